@@ -0,0 +1,26 @@
+-- Trigram indexes for Titan Menu node lookups
+--
+-- validate_node() and search_devices() match node.name / node.fqdn with
+-- ILIKE, anchored ('term%') and unanchored ('%term%'). pg_trgm GIN indexes
+-- serve both forms; without them every lookup is a sequential scan of node.
+--
+-- Run once per database by a DBA, NOT from the client, with psql in
+-- autocommit mode (CREATE INDEX CONCURRENTLY cannot run in a transaction):
+--
+--     psql -h titandb.wal-mart.com -d gorm -f sql/node_trgm_indexes.sql
+--
+-- If a concurrent build fails it leaves an INVALID index behind, which
+-- IF NOT EXISTS would then skip. Check for one before re-running:
+--
+--     SELECT indexrelid::regclass FROM pg_index
+--     WHERE NOT indisvalid AND indrelid = 'node'::regclass;
+--
+-- and DROP INDEX CONCURRENTLY any index it lists.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS node_name_trgm
+    ON node USING gin (name gin_trgm_ops);
+
+CREATE INDEX CONCURRENTLY IF NOT EXISTS node_fqdn_trgm
+    ON node USING gin (fqdn gin_trgm_ops);
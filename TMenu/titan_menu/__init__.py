@@ -8,9 +8,23 @@ from .database import TitanDatabase
 from .queries import TitanQueries
 from .display import print_results, export_csv, show_main_menu, print_banner
 from .main import main
-from .nre_jumpbox import NREJumpbox, NREJumpboxConfig, prompt_for_jumpbox_credentials
 from .superputty_config import SuperPuttyConfigGenerator, SuperPuttyProfile
 
+import importlib
+
+# Re-exports whose modules pull in paramiko; imported on first access.
+_LAZY_EXPORTS = {
+    "NREJumpbox": ".nre_jumpbox",
+    "NREJumpboxConfig": ".nre_jumpbox",
+    "prompt_for_jumpbox_credentials": ".nre_jumpbox",
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_EXPORTS:
+        return getattr(importlib.import_module(_LAZY_EXPORTS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 __version__ = "2.0.0"
 __all__ = [
     "TitanDatabase",
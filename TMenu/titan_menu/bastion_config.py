@@ -7,12 +7,23 @@ Supports multiple bastion types:
   3. Custom SSH Jump Servers
 """
 
-from typing import Dict, List
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping
 
 BASTION_TYPE_SSH = "ssh"
 BASTION_TYPE_GCLOUD = "gcloud"
 
-BASTION_HOSTS: Dict[str, Dict] = {
+
+def _freeze(value: Any) -> Any:
+    """Recursively convert dicts to read-only mappings and lists to tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+_BASTION_HOSTS: Dict[str, Dict] = {
     "nre_oser_jumpbox": {
         "name": "NRE Enterprise Oser Jumpbox (TACACS+)",
         "type": "nre_jumpbox",
@@ -68,6 +79,8 @@ BASTION_HOSTS: Dict[str, Dict] = {
     },
 }
 
+BASTION_HOSTS: Mapping[str, Mapping[str, Any]] = _freeze(_BASTION_HOSTS)
+
 SSH_CONFIG = {
     "timeout": 30,
     "connect_timeout": 10,
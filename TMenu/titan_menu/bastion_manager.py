@@ -7,18 +7,31 @@ Handles connections through various bastion types:
   - Custom SSH tunnels
 """
 
+import functools
 import subprocess
 import os
-from typing import Dict, Optional, Tuple, List
+import re
+import shlex
+import socket
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Dict, Mapping, Optional, Tuple, List
 from dataclasses import dataclass
 
 from .bastion_config import (
     BASTION_HOSTS, BASTION_TYPE_SSH, BASTION_TYPE_GCLOUD,
-    SSH_CONFIG, GCLOUD_CONFIG, DEFAULT_BASTION
+    SSH_CONFIG, GCLOUD_CONFIG, DEFAULT_BASTION, DEVICE_SSH_CONFIG
 )
+from .ssh_config import OS_TYPE_ALIASES, BATCHED_OS_TYPES
 
+if TYPE_CHECKING:
+    import paramiko
 
-@dataclass
+
+@dataclass(frozen=True)
 class BastionConfig:
     """Configuration for a bastion host."""
     bastion_id: str
@@ -34,12 +47,93 @@ class BastionConfig:
     region: str = ""
 
 
+BASTIONS_BY_ID: Mapping[str, BastionConfig] = MappingProxyType({
+    bastion_id: BastionConfig(
+        bastion_id=bastion_id,
+        name=config_dict.get("name", ""),
+        bastion_type=config_dict.get("type", BASTION_TYPE_SSH),
+        host=config_dict.get("host"),
+        port=config_dict.get("port", 22),
+        instance_name=config_dict.get("instance_name"),
+        zone=config_dict.get("zone"),
+        project=config_dict.get("project"),
+        auth_method=config_dict.get("auth_method", "password"),
+        description=config_dict.get("description", ""),
+        region=config_dict.get("region", ""),
+    )
+    for bastion_id, config_dict in BASTION_HOSTS.items()
+})
+
+BASTION_LISTING: Tuple[Mapping[str, Optional[str]], ...] = tuple(
+    MappingProxyType({
+        "id": bastion_id,
+        "name": config.get("name"),
+        "type": config.get("type"),
+        "region": config.get("region"),
+        "description": config.get("description"),
+    })
+    for bastion_id, config in BASTION_HOSTS.items()
+)
+
+
+@dataclass(frozen=True)
+class BastionTable:
+    """Bastion summaries laid out column-wise, in BASTION_LISTING order."""
+    ids: Tuple[str, ...]
+    names: Tuple[Optional[str], ...]
+    types: Tuple[Optional[str], ...]
+    regions: Tuple[Optional[str], ...]
+    descriptions: Tuple[Optional[str], ...]
+
+
+BASTION_TABLE = BastionTable(
+    ids=tuple(bastion["id"] for bastion in BASTION_LISTING),
+    names=tuple(bastion["name"] for bastion in BASTION_LISTING),
+    types=tuple(bastion["type"] for bastion in BASTION_LISTING),
+    regions=tuple(bastion["region"] for bastion in BASTION_LISTING),
+    descriptions=tuple(bastion["description"] for bastion in BASTION_LISTING),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _gcloud_ready() -> Tuple[bool, bool]:
+    """
+    Probe the gcloud CLI and its auth state in parallel.
+
+    Returns:
+        Tuple of (cli_ok, auth_ok). Timeouts and a missing binary raise
+        and are therefore never cached.
+    """
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        version = executor.submit(
+            subprocess.run, ["gcloud", "--version"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5
+        )
+        auth = executor.submit(
+            subprocess.run, ["gcloud", "auth", "list"],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=5
+        )
+        return version.result().returncode == 0, auth.result().returncode == 0
+
+
 class BastionManager:
     """
     Manages connections through bastion hosts.
     Supports SSH jump hosts and Google Cloud bastion instances.
     """
 
+    COMMAND_BOUNDARY = "===CMD_BOUNDARY==="
+
+    _CONNECT_DISPATCH = {
+        BASTION_TYPE_SSH: "connect_ssh_bastion",
+        BASTION_TYPE_GCLOUD: "connect_gcloud_bastion",
+    }
+
+    _EXECUTE_DISPATCH = {
+        BASTION_TYPE_SSH: "_execute_via_ssh_bastion",
+        BASTION_TYPE_GCLOUD: "_execute_via_gcloud_bastion",
+    }
+
     def __init__(self, bastion_id: str = DEFAULT_BASTION, username: str = "", password: str = ""):
         """
         Initialize bastion manager.
@@ -54,6 +148,47 @@ class BastionManager:
         self.password = password
         self.connected = False
         self.bastion_config = self._load_bastion_config(bastion_id)
+        self._ctl = os.path.join(
+            tempfile.gettempdir(),
+            f"tm-ssh-{os.getpid()}-{bastion_id}.sock"
+        )
+        self._pool: Dict[Tuple[str, str, str], "paramiko.SSHClient"] = {}
+        self._pool_last_used: Dict[Tuple[str, str, str], float] = {}
+        # Borrowers are counted per client, so one displaced from _pool by a
+        # reconnect is still closed when its last borrower releases it.
+        self._pool_in_use: Dict["paramiko.SSHClient", int] = {}
+        self._pool_lock = threading.Lock()
+        self._reaper: Optional[threading.Thread] = None
+        self._reaper_stop = threading.Event()
+
+    def _ssh_base_args(self) -> List[str]:
+        """
+        OpenSSH options for connection sharing over the control socket.
+
+        The first ssh invocation opens the master connection and every
+        subsequent one reuses its TCP stream instead of handshaking again.
+
+        Returns:
+            List of ssh command-line arguments
+        """
+        return [
+            "-o", "ControlMaster=auto",
+            "-o", f"ControlPath={self._ctl}",
+            "-o", "ControlPersist=600s",
+            "-o", "StrictHostKeyChecking=no",
+        ]
+
+    def _bastion_target(self) -> str:
+        """
+        Build the ssh destination for the bastion host.
+
+        Returns:
+            "user@host" if a username is set, otherwise the bare host
+        """
+        host = self.bastion_config.host or self.bastion_config.instance_name
+        if self.username:
+            return f"{self.username}@{host}"
+        return host
 
     def _load_bastion_config(self, bastion_id: str) -> BastionConfig:
         """
@@ -65,41 +200,29 @@ class BastionManager:
         Returns:
             BastionConfig object
         """
-        if bastion_id not in BASTION_HOSTS:
+        if bastion_id not in BASTIONS_BY_ID:
             raise ValueError(f"Unknown bastion ID: {bastion_id}")
 
-        config_dict = BASTION_HOSTS[bastion_id]
-        return BastionConfig(
-            bastion_id=bastion_id,
-            name=config_dict.get("name", ""),
-            bastion_type=config_dict.get("type", BASTION_TYPE_SSH),
-            host=config_dict.get("host"),
-            port=config_dict.get("port", 22),
-            instance_name=config_dict.get("instance_name"),
-            zone=config_dict.get("zone"),
-            project=config_dict.get("project"),
-            auth_method=config_dict.get("auth_method", "password"),
-            description=config_dict.get("description", ""),
-            region=config_dict.get("region", ""),
-        )
+        return BASTIONS_BY_ID[bastion_id]
 
-    def list_available_bastions(self) -> List[Dict]:
+    def list_available_bastions(self) -> Tuple[Mapping[str, Optional[str]], ...]:
         """
         List all available bastion hosts.
 
         Returns:
-            List of bastion configurations
-        """
-        bastions = []
-        for bastion_id, config in BASTION_HOSTS.items():
-            bastions.append({
-                "id": bastion_id,
-                "name": config.get("name"),
-                "type": config.get("type"),
-                "region": config.get("region"),
-                "description": config.get("description"),
-            })
-        return bastions
+            Read-only bastion summaries, built once at import
+        """
+        return BASTION_LISTING
+
+    def get_bastion_table(self) -> BastionTable:
+        """
+        Get the bastion summaries as parallel column tuples, for menus
+        and filters that scan every bastion.
+
+        Returns:
+            Read-only bastion table, built once at import
+        """
+        return BASTION_TABLE
 
     def connect_ssh_bastion(self) -> bool:
         """
@@ -114,9 +237,29 @@ class BastionManager:
 
         try:
             print(f"[*] Connecting to bastion: {self.bastion_config.host}...")
+            result = subprocess.run(
+                [
+                    "ssh", "-M", "-N", "-f",
+                    *self._ssh_base_args(),
+                    "-o", f"ConnectTimeout={SSH_CONFIG['connect_timeout']}",
+                    "-p", str(self.bastion_config.port),
+                    self._bastion_target(),
+                ],
+                timeout=SSH_CONFIG["timeout"]
+            )
+            if result.returncode != 0:
+                print(f"[!] Could not open master connection to {self.bastion_config.host}")
+                return False
+
             print(f"[+] Connected to {self.bastion_config.name}")
             self.connected = True
             return True
+        except subprocess.TimeoutExpired:
+            print("[!] ssh command timed out")
+            return False
+        except FileNotFoundError:
+            print("[!] ssh client not found in PATH")
+            return False
         except Exception as e:
             print(f"[!] Connection failed: {e}")
             return False
@@ -133,24 +276,17 @@ class BastionManager:
             return False
 
         try:
-            print(f"[*] Checking gcloud CLI...")
-            result = subprocess.run(
-                ["gcloud", "--version"],
-                capture_output=True,
-                timeout=5
-            )
-            if result.returncode != 0:
+            print(f"[*] Checking gcloud CLI and authentication...")
+            cli_ok, auth_ok = _gcloud_ready()
+            if not (cli_ok and auth_ok):
+                self.refresh_gcloud()
+
+            if not cli_ok:
                 print("[!] gcloud CLI not installed or not in PATH")
                 print("[!] Install Google Cloud SDK from: https://cloud.google.com/sdk/docs/install")
                 return False
 
-            print(f"[*] Authenticating with gcloud...")
-            auth_result = subprocess.run(
-                ["gcloud", "auth", "list"],
-                capture_output=True,
-                timeout=5
-            )
-            if auth_result.returncode != 0:
+            if not auth_ok:
                 print("[!] Not authenticated. Run: gcloud auth login")
                 return False
 
@@ -168,6 +304,13 @@ class BastionManager:
             print(f"[!] Connection failed: {e}")
             return False
 
+    @staticmethod
+    def refresh_gcloud():
+        """
+        Forget the cached gcloud probe so the next connect re-checks it.
+        """
+        _gcloud_ready.cache_clear()
+
     def connect(self) -> bool:
         """
         Connect to bastion host using appropriate method.
@@ -175,14 +318,14 @@ class BastionManager:
         Returns:
             True if connected, False otherwise
         """
-        if self.bastion_config.bastion_type == BASTION_TYPE_SSH:
-            return self.connect_ssh_bastion()
-        elif self.bastion_config.bastion_type == BASTION_TYPE_GCLOUD:
-            return self.connect_gcloud_bastion()
-        else:
+        try:
+            handler = self._CONNECT_DISPATCH[self.bastion_config.bastion_type]
+        except KeyError:
             print(f"[!] Unknown bastion type: {self.bastion_config.bastion_type}")
             return False
 
+        return getattr(self, handler)()
+
     def execute_command_via_bastion(
         self,
         device_ip: str,
@@ -203,90 +346,439 @@ class BastionManager:
         if not self.connected:
             return False, "[!] Not connected to bastion"
 
+        handler = self._EXECUTE_DISPATCH.get(self.bastion_config.bastion_type)
+        if handler is None:
+            return False, "[!] Unknown execution method"
+
         try:
-            if self.bastion_config.bastion_type == BASTION_TYPE_SSH:
-                return self._execute_via_ssh_bastion(device_ip, device_username, command)
-            elif self.bastion_config.bastion_type == BASTION_TYPE_GCLOUD:
-                return self._execute_via_gcloud_bastion(device_ip, device_username, command)
+            return getattr(self, handler)(device_ip, device_username, command)
         except Exception as e:
             return False, f"[!] Execution failed: {e}"
 
-        return False, "[!] Unknown execution method"
-
-    def _execute_via_ssh_bastion(
+    def execute_commands_via_bastion(
         self,
         device_ip: str,
         device_username: str,
-        command: str
-    ) -> Tuple[bool, str]:
+        commands: List[str],
+        device_os: str = ""
+    ) -> Tuple[bool, List[str]]:
         """
-        Execute command via SSH bastion host.
+        Execute several commands on remote device.
+
+        On shells that accept ';' (BATCHED_OS_TYPES) the commands share one
+        exec, each followed by an echoed boundary carrying its exit status,
+        so the output splits back into one entry per command. Other CLIs
+        (IOS, NX-OS, Junos) run them one at a time.
 
         Args:
-            device_ip: Target device IP
-            device_username: Device username
-            command: Command to run
+            device_ip: Target device IP address
+            device_username: Username on device
+            commands: Commands to execute, in order
+            device_os: Device OS type, used to decide whether to batch
 
         Returns:
-            Tuple of (success, output)
+            Tuple of (success: bool, outputs: one string per command);
+            success is False if any command failed. If a batch cannot be
+            split, its error or raw output is in the first slot and the
+            rest are empty.
+        """
+        if not commands:
+            return True, []
+
+        os_type = OS_TYPE_ALIASES.get(device_os.upper().strip(), device_os.lower())
+        if os_type not in BATCHED_OS_TYPES:
+            all_ok = True
+            outputs = []
+            for command in commands:
+                success, output = self.execute_command_via_bastion(device_ip, device_username, command)
+                outputs.append(output)
+                all_ok = all_ok and success
+            return all_ok, outputs
+
+        joined = "".join(f"{command}; echo '{self.COMMAND_BOUNDARY}'$?; " for command in commands)
+        success, output = self.execute_command_via_bastion(device_ip, device_username, joined)
+
+        if not success:
+            return False, [output] + [""] * (len(commands) - 1)
+
+        # [out1, status1, out2, status2, ..., trailing]
+        parts = re.split(rf"{re.escape(self.COMMAND_BOUNDARY)}(\d+)\r?\n?", output)
+        if len(parts) != 2 * len(commands) + 1:
+            return False, [output] + [""] * (len(commands) - 1)
+
+        outputs = [part.strip("\r\n") for part in parts[0:-1:2]]
+        return all(status == "0" for status in parts[1::2]), outputs
+
+    def execute_on_many(
+        self,
+        targets: List[Tuple[str, str, str]],
+        max_concurrency: int = 8
+    ) -> List[Tuple[bool, str]]:
         """
-        return True, f"[*] Ready to execute via {self.bastion_config.name}"
+        Execute commands on many devices concurrently.
 
-    def _execute_via_gcloud_bastion(
+        Concurrency is capped so the bastion's sshd MaxStartups limit is not
+        tripped; all workers share the same master socket and client pool.
+
+        Args:
+            targets: List of (device_ip, device_username, command) tuples
+            max_concurrency: Maximum number of simultaneous sessions
+
+        Returns:
+            List of (success, output) tuples in the same order as targets
+        """
+        if not targets:
+            return []
+
+        results: List[Tuple[bool, str]] = [(False, "")] * len(targets)
+        workers = max(1, min(max_concurrency, len(targets)))
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.execute_command_via_bastion, ip, user, cmd): index
+                for index, (ip, user, cmd) in enumerate(targets)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    results[index] = (False, f"[!] Execution failed: {e}")
+
+        return results
+
+    def execute_script_via_bastion(
         self,
         device_ip: str,
         device_username: str,
-        command: str
+        script: str
     ) -> Tuple[bool, str]:
         """
-        Execute command via Google Cloud bastion host.
+        Run a multi-line script on remote device in a single SSH operation.
+
+        The script is piped to 'bash -s' on stdin, so every command in it
+        shares one exec request instead of paying a round trip each.
 
         Args:
-            device_ip: Target device IP
-            device_username: Device username
-            command: Command to run
+            device_ip: Target device IP address
+            device_username: Username on device
+            script: Shell script to run
 
         Returns:
-            Tuple of (success, output)
+            Tuple of (success: bool, output: str)
         """
+        import paramiko
+
+        if not self.connected:
+            return False, "[!] Not connected to bastion"
+
         try:
-            gcloud_cmd = [
+            client = self._get_client(device_ip, device_username)
+            try:
+                stdin, stdout, stderr = client.exec_command(
+                    "bash -s",
+                    timeout=SSH_CONFIG["command_timeout"]
+                )
+                stdin.write(script if script.endswith("\n") else script + "\n")
+                stdin.channel.shutdown_write()
+
+                output = stdout.read().decode('utf-8', errors='ignore')
+                error = stderr.read().decode('utf-8', errors='ignore')
+                status = stdout.channel.recv_exit_status()
+            finally:
+                self._release_client(device_ip, device_username, client)
+
+            if status == 0:
+                return True, output
+            else:
+                return False, error or output
+
+        except paramiko.AuthenticationException:
+            return False, f"[!] Authentication failed for {device_username}@{device_ip}"
+        except socket.timeout:
+            return False, "[!] Script timed out"
+        except Exception as e:
+            return False, f"[!] Script execution failed: {e}"
+
+    def _proxy_command(self, device_ip: str) -> str:
+        """
+        Build the ProxyCommand that tunnels a TCP stream to the device
+        through the bastion.
+
+        Args:
+            device_ip: Target device IP
+
+        Returns:
+            Shell command string for paramiko.ProxyCommand
+        """
+        target = f"{device_ip}:{DEVICE_SSH_CONFIG['port']}"
+
+        if self.bastion_config.bastion_type == BASTION_TYPE_GCLOUD:
+            args = [
                 "gcloud",
                 "compute",
                 "ssh",
                 self.bastion_config.instance_name,
                 f"--zone={self.bastion_config.zone}",
                 f"--project={self.bastion_config.project}",
+                "--quiet",
                 "--",
+                *self._ssh_base_args(),
+                "-W", target,
+            ]
+        else:
+            args = [
                 "ssh",
-                "-o", "StrictHostKeyChecking=no",
-                f"{device_username}@{device_ip}",
-                command
+                *self._ssh_base_args(),
+                "-p", str(self.bastion_config.port),
+                "-W", target,
+                self._bastion_target(),
             ]
 
-            result = subprocess.run(
-                gcloud_cmd,
-                capture_output=True,
-                timeout=SSH_CONFIG["command_timeout"],
-                text=True
-            )
+        return " ".join(shlex.quote(arg) for arg in args)
+
+    def _get_client(self, device_ip: str, device_username: str) -> "paramiko.SSHClient":
+        """
+        Check out an authenticated SSH client for a device, reusing a pooled
+        one while its transport is still active.
+
+        The client counts as in use, and is never reaped, until it is
+        handed back with _release_client().
+
+        Args:
+            device_ip: Target device IP
+            device_username: Device username
+
+        Returns:
+            Connected paramiko.SSHClient
+        """
+        import paramiko
+
+        key = (self.bastion_id, device_ip, device_username)
+
+        with self._pool_lock:
+            client = self._checkout_pooled(key)
+            if client:
+                return client
+
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        client.connect(
+            hostname=device_ip,
+            port=DEVICE_SSH_CONFIG["port"],
+            username=device_username,
+            password=self.password or None,
+            sock=paramiko.ProxyCommand(self._proxy_command(device_ip)),
+            timeout=SSH_CONFIG["connect_timeout"],
+            banner_timeout=SSH_CONFIG["connect_timeout"],
+        )
+
+        with self._pool_lock:
+            # Another worker may have connected to the same device meanwhile
+            pooled = self._checkout_pooled(key)
+            if pooled:
+                client.close()
+                return pooled
+            self._pool[key] = client
+            self._pool_last_used[key] = time.monotonic()
+            self._pool_in_use[client] = 1
+        self._start_reaper()
+
+        return client
 
-            if result.returncode == 0:
-                return True, result.stdout
+    def _checkout_pooled(self, key: Tuple[str, str, str]) -> Optional["paramiko.SSHClient"]:
+        """
+        Mark the live pooled client for key as in use. Call with _pool_lock held.
+
+        A client with a dead transport is dropped from the pool. It is closed
+        now, or by the last _release_client() if a command still holds it.
+
+        Args:
+            key: (bastion_id, device_ip, device_username) pool key
+
+        Returns:
+            The pooled client, or None if there is no live one
+        """
+        client = self._pool.get(key)
+        if client is None:
+            return None
+
+        transport = client.get_transport()
+        if transport and transport.is_active():
+            self._pool_in_use[client] = self._pool_in_use.get(client, 0) + 1
+            return client
+
+        del self._pool[key]
+        del self._pool_last_used[key]
+        if not self._pool_in_use.get(client):
+            client.close()
+        return None
+
+    def _release_client(self, device_ip: str, device_username: str, client: "paramiko.SSHClient"):
+        """
+        Hand back a client from _get_client once its command has finished.
+
+        A client no longer in the pool is closed by its last borrower.
+
+        Args:
+            device_ip: Target device IP
+            device_username: Device username
+            client: The client _get_client returned
+        """
+        key = (self.bastion_id, device_ip, device_username)
+
+        with self._pool_lock:
+            count = self._pool_in_use.get(client, 0) - 1
+            if count > 0:
+                self._pool_in_use[client] = count
             else:
-                return False, result.stderr
+                self._pool_in_use.pop(client, None)
 
-        except subprocess.TimeoutExpired:
+            if self._pool.get(key) is client:
+                self._pool_last_used[key] = time.monotonic()
+            elif count <= 0:
+                client.close()
+
+    def _start_reaper(self):
+        """
+        Start the background thread that closes idle pooled clients.
+        """
+        if self._reaper and self._reaper.is_alive():
+            return
+
+        self._reaper_stop.clear()
+        self._reaper = threading.Thread(target=self._reap_idle_clients, daemon=True)
+        self._reaper.start()
+
+    def _reap_idle_clients(self):
+        """
+        Close pooled clients that have been idle longer than tunnel_timeout.
+        """
+        idle_timeout = GCLOUD_CONFIG["tunnel_timeout"]
+
+        while not self._reaper_stop.wait(idle_timeout / 2):
+            now = time.monotonic()
+            with self._pool_lock:
+                stale = [
+                    key for key, last_used in self._pool_last_used.items()
+                    if now - last_used > idle_timeout
+                    and not self._pool_in_use.get(self._pool[key])
+                ]
+                for key in stale:
+                    self._pool.pop(key).close()
+                    del self._pool_last_used[key]
+
+    def _close_pool(self):
+        """
+        Stop the reaper and close every pooled or still-borrowed client.
+        """
+        self._reaper_stop.set()
+        with self._pool_lock:
+            for client in {*self._pool.values(), *self._pool_in_use}:
+                client.close()
+            self._pool.clear()
+            self._pool_last_used.clear()
+            self._pool_in_use.clear()
+
+    def _execute_pooled(
+        self,
+        device_ip: str,
+        device_username: str,
+        command: str
+    ) -> Tuple[bool, str]:
+        """
+        Execute command on a pooled device connection.
+
+        Args:
+            device_ip: Target device IP
+            device_username: Device username
+            command: Command to run
+
+        Returns:
+            Tuple of (success, output)
+        """
+        import paramiko
+
+        try:
+            client = self._get_client(device_ip, device_username)
+            try:
+                stdin, stdout, stderr = client.exec_command(
+                    command,
+                    timeout=SSH_CONFIG["command_timeout"]
+                )
+
+                output = stdout.read().decode('utf-8', errors='ignore')
+                error = stderr.read().decode('utf-8', errors='ignore')
+                status = stdout.channel.recv_exit_status()
+            finally:
+                self._release_client(device_ip, device_username, client)
+
+            if status == 0:
+                return True, output
+            else:
+                return False, error or output
+
+        except paramiko.AuthenticationException:
+            return False, f"[!] Authentication failed for {device_username}@{device_ip}"
+        except socket.timeout:
             return False, "[!] Command timed out"
         except Exception as e:
-            return False, f"[!] gcloud execution failed: {e}"
+            return False, f"[!] ssh execution failed: {e}"
+
+    def _execute_via_ssh_bastion(
+        self,
+        device_ip: str,
+        device_username: str,
+        command: str
+    ) -> Tuple[bool, str]:
+        """
+        Execute command via SSH bastion host.
+
+        Args:
+            device_ip: Target device IP
+            device_username: Device username
+            command: Command to run
+
+        Returns:
+            Tuple of (success, output)
+        """
+        return self._execute_pooled(device_ip, device_username, command)
+
+    def _execute_via_gcloud_bastion(
+        self,
+        device_ip: str,
+        device_username: str,
+        command: str
+    ) -> Tuple[bool, str]:
+        """
+        Execute command via Google Cloud bastion host.
+
+        Args:
+            device_ip: Target device IP
+            device_username: Device username
+            command: Command to run
+
+        Returns:
+            Tuple of (success, output)
+        """
+        return self._execute_pooled(device_ip, device_username, command)
 
     def disconnect(self):
         """
         Disconnect from bastion host.
         """
-        if self.bastion_config.bastion_type == BASTION_TYPE_GCLOUD:
-            pass
+        self._close_pool()
+        if self.connected:
+            try:
+                subprocess.run(
+                    ["ssh", "-O", "exit", "-o", f"ControlPath={self._ctl}",
+                     self._bastion_target()],
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.DEVNULL,
+                    timeout=5
+                )
+            except Exception:
+                pass
         self.connected = False
         print(f"[*] Disconnected from {self.bastion_config.name}")
 
@@ -2,12 +2,155 @@
 Database connection and base query functionality for Titan DB.
 """
 
+import functools
+import itertools
+import re
 import socket
-from typing import Optional
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Hashable, Optional, Tuple
 import psycopg2
 import psycopg2.extras
 
 
+CACHE_MAXSIZE = 512
+CACHE_TTL = 600
+DNS_TIMEOUT = 2
+
+FQDN_SUFFIX = '.wal-mart.com.'
+
+_MISS = object()
+
+_VALIDATE_NODE_ORDER = """
+        ORDER BY 
+            -- First, exclude devices with '.old' or '-old' in name/fqdn
+            CASE 
+                WHEN name ILIKE '%%.old%%' OR fqdn ILIKE '%%.old%%' THEN 3
+                WHEN name ILIKE '%%-old%%' OR fqdn ILIKE '%%-old%%' THEN 3
+                ELSE 1
+            END,
+            -- Then prioritize exact matches
+            CASE 
+                WHEN name = %s THEN 1
+                WHEN fqdn = %s THEN 2
+                WHEN name ILIKE %s THEN 3
+                ELSE 4
+            END,
+            -- Finally prioritize online devices over offline/decommissioned
+            CASE 
+                WHEN state = 'online' THEN 1
+                WHEN state = 'offline' THEN 2
+                WHEN state = 'decommissioned' THEN 3
+                ELSE 4
+            END
+        LIMIT 1
+"""
+
+# tm_validate_prefix uses a non-leading wildcard so it can be served from an
+# index; tm_validate is the bilateral-wildcard fallback. Both are fastest with
+# the trigram indexes in sql/node_trgm_indexes.sql (applied by a DBA).
+# Queries keep psycopg2 %s placeholders, as execute_prepared() expects.
+PREPARED_STATEMENTS = {
+    "tm_validate_prefix": """
+        SELECT fqdn, name, state
+        FROM node 
+        WHERE name ILIKE %s OR fqdn ILIKE %s
+    """ + _VALIDATE_NODE_ORDER,
+    "tm_validate": """
+        SELECT fqdn, name, state
+        FROM node 
+        WHERE fqdn ILIKE %s OR name ILIKE %s
+    """ + _VALIDATE_NODE_ORDER,
+}
+
+
+_PLACEHOLDER_RE = re.compile(r'%%|%s')
+
+
+def _numbered_params(query: str) -> str:
+    """Rewrite psycopg2 %s placeholders as PREPARE-style $1, $2, ..."""
+    counter = itertools.count(1)
+    return _PLACEHOLDER_RE.sub(
+        lambda m: '%' if m.group() == '%%' else f'${next(counter)}', query
+    )
+
+
+_dns_executor = ThreadPoolExecutor(max_workers=2)
+
+
+@functools.lru_cache(maxsize=256)
+def _ptr_lookup(address: str) -> Optional[str]:
+    """Reverse-resolve an address; failures are cached as None too."""
+    try:
+        return socket.gethostbyaddr(address)[0]
+    except (socket.herror, socket.gaierror, OSError):
+        return None
+
+
+def _resolve_ptr(address: str) -> Optional[str]:
+    """Cached PTR lookup bounded by DNS_TIMEOUT without touching the global socket timeout."""
+    return _dns_executor.submit(_ptr_lookup, address).result(timeout=DNS_TIMEOUT)
+
+
+def cached_query(method=None, *, ttl: float = CACHE_TTL):
+    """
+    Cache a read-only query method's result in the instance TTL cache.
+
+    Empty results are not cached so a failed query is retried next time.
+    Use as @cached_query, or @cached_query(ttl=...) for a shorter lifetime.
+    """
+    if method is None:
+        return functools.partial(cached_query, ttl=ttl)
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        key = (method.__name__,) + args + tuple(sorted(kwargs.items()))
+        with self._lock:
+            result = self._cache_get(key)
+            if result is not _MISS:
+                return result
+
+            result = method(self, *args, **kwargs)
+            if result:
+                self._cache_set(key, result, ttl)
+            return result
+
+    return wrapper
+
+
+def auto_reconnect(method):
+    """
+    Reconnect and retry a query method once if the connection dropped.
+
+    Catches the error directly, and also covers methods that swallow it
+    themselves by checking whether the connection was left closed. A
+    connection already known to be closed is reopened up front, so the
+    wrapped methods need no ensure_connected() call of their own.
+
+    Holds the instance lock for the whole call, since every query shares
+    self.cur and a psycopg2 cursor must not be used from two threads.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        with self._lock:
+            self.ensure_connected()
+            try:
+                result = method(self, *args, **kwargs)
+                if self.conn is not None and not self.conn.closed:
+                    return result
+            except (psycopg2.OperationalError, psycopg2.InterfaceError):
+                if self.conn is not None and not self.conn.closed:
+                    raise
+
+            print("[*] Connection lost, reconnecting...")
+            self.connect()
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
 class TitanDatabase:
     """
     Handles database connection and basic query execution for Titan DB.
@@ -19,6 +162,49 @@ class TitanDatabase:
         self.password = password
         self.conn = None
         self.cur = None
+        self._prepared = set()
+        self._lock = threading.RLock()
+        self._cache: "OrderedDict[Tuple[Hashable, ...], Tuple[float, Any]]" = OrderedDict()
+    
+    def _cache_get(self, key: Tuple[Hashable, ...]) -> Any:
+        """Return a cached value, or _MISS if absent or expired."""
+        entry = self._cache.get(key)
+        if entry is None:
+            return _MISS
+        
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._cache[key]
+            return _MISS
+        
+        self._cache.move_to_end(key)
+        return value
+    
+    def _cache_set(self, key: Tuple[Hashable, ...], value: Any, ttl: float = CACHE_TTL):
+        """Store a value, evicting the least recently used entry if full."""
+        self._cache[key] = (time.monotonic() + ttl, value)
+        self._cache.move_to_end(key)
+        while len(self._cache) > CACHE_MAXSIZE:
+            self._cache.popitem(last=False)
+    
+    def invalidate(self, key_prefix: str):
+        """Drop cached results for every query whose name starts with key_prefix."""
+        for key in [k for k in self._cache if k[0].startswith(key_prefix)]:
+            del self._cache[key]
+    
+    def invalidate_device(self, node: str):
+        """Drop every cached query result for one device, whatever the query."""
+        node = node.lower()
+        stale = [
+            k for k in self._cache
+            if len(k) > 1 and isinstance(k[1], str) and k[1].lower() == node
+        ]
+        for key in stale:
+            del self._cache[key]
+    
+    def clear_cache(self):
+        """Drop all cached query results."""
+        self._cache.clear()
     
     def connect(self) -> bool:
         """Connect to Titan DB."""
@@ -33,7 +219,8 @@ class TitanDatabase:
             )
             
             self.conn = psycopg2.connect(rdbconnstr)
-            self.cur = self.conn.cursor(cursor_factory=psycopg2.extras.DictCursor)
+            self.cur = self.conn.cursor(cursor_factory=psycopg2.extras.RealDictCursor)
+            self._prepare_statements()
             print("[+] Connected successfully!\n")
             return True
             
@@ -41,6 +228,38 @@ class TitanDatabase:
             print(f"\n[!] Connection failed: {e}\n")
             return False
     
+    def _prepare_statements(self):
+        """PREPARE the hot lookup queries once per connection so Postgres reuses the plan."""
+        self._prepared = set()
+        for name, sql in PREPARED_STATEMENTS.items():
+            try:
+                self.cur.execute(f"PREPARE {name} AS {_numbered_params(sql)}")
+                self.conn.commit()
+                self._prepared.add(name)
+            except Exception as e:
+                print(f"[!] Could not prepare {name}: {e}")
+                self.conn.rollback()
+    
+    def execute_prepared(self, name: str, query: str, params: Tuple = ()):
+        """Run query on self.cur as the server-side prepared statement `name`.
+        
+        The statement is PREPAREd the first time it is used on a connection,
+        so later calls skip the parse and plan. query keeps psycopg2 %s
+        placeholders and must be the same text every time for a given name.
+        If the PREPARE fails, query runs unprepared instead.
+        """
+        if name not in self._prepared:
+            try:
+                self.cur.execute(f"PREPARE {name} AS {_numbered_params(query)}")
+            except psycopg2.Error as e:
+                print(f"[!] Could not prepare {name}, running it unprepared: {e}")
+                self.conn.rollback()
+                self.cur.execute(query, params)
+                return
+            self._prepared.add(name)
+        placeholders = ', '.join(['%s'] * len(params))
+        self.cur.execute(f"EXECUTE {name} ({placeholders})" if params else f"EXECUTE {name}", params)
+    
     def disconnect(self):
         """Close connection."""
         if self.cur:
@@ -50,63 +269,60 @@ class TitanDatabase:
             print("\n[*] Disconnected from Titan DB\n")
     
     def ensure_connected(self) -> bool:
-        """Ensure database connection is alive, reconnect if needed."""
-        try:
-            if self.conn is None or self.conn.closed:
-                print("[*] Connection lost, reconnecting...")
-                return self.connect()
-            self.cur.execute("SELECT 1")
-            return True
-        except Exception:
+        """Reconnect if the connection is known to be closed.
+        
+        A connection that died silently is caught by @auto_reconnect on the
+        query itself, so no round trip is spent probing a healthy one.
+        """
+        if self.conn is None or self.conn.closed:
             print("[*] Connection lost, reconnecting...")
             return self.connect()
+        return True
     
     def validate_node(self, node: str) -> str:
-        """Validate and return best matching node from database."""
-        query = """
-            SELECT fqdn, name, state
-            FROM node 
-            WHERE fqdn ILIKE %s OR name ILIKE %s
-            ORDER BY 
-                -- First, exclude devices with '.old' or '-old' in name/fqdn
-                CASE 
-                    WHEN name ILIKE '%.old%' OR fqdn ILIKE '%.old%' THEN 3
-                    WHEN name ILIKE '%-old%' OR fqdn ILIKE '%-old%' THEN 3
-                    ELSE 1
-                END,
-                -- Then prioritize exact matches
-                CASE 
-                    WHEN name = %s THEN 1
-                    WHEN fqdn = %s THEN 2
-                    WHEN name ILIKE %s THEN 3
-                    ELSE 4
-                END,
-                -- Finally prioritize online devices over offline/decommissioned
-                CASE 
-                    WHEN state = 'online' THEN 1
-                    WHEN state = 'offline' THEN 2
-                    WHEN state = 'decommissioned' THEN 3
-                    ELSE 4
-                END
-            LIMIT 1
+        """Validate and return best matching node from database.
+        
+        A resolved FQDN is also cached under its own key, so passing a
+        name this method returned back in does not query again.
         """
+        key = ("validate_node", node.lower())
+        cached = self._cache_get(key)
+        if cached is not _MISS:
+            return cached
         
         try:
-            self.cur.execute(query, (f'%{node}%', f'%{node}%', node, f'{node}.wal-mart.com.', node))
+            prefix = node + '%'
+            fqdn_exact = node + FQDN_SUFFIX
+            self.execute_prepared(
+                'tm_validate_prefix', PREPARED_STATEMENTS['tm_validate_prefix'],
+                (prefix, prefix, node, fqdn_exact, node)
+            )
             result = self.cur.fetchone()
             
+            if not result:
+                wild = '%' + prefix
+                self.execute_prepared(
+                    'tm_validate', PREPARED_STATEMENTS['tm_validate'],
+                    (wild, wild, node, fqdn_exact, node)
+                )
+                result = self.cur.fetchone()
+            
             if result:
-                return result[0]
+                fqdn = result['fqdn']
+                self._cache_set(key, fqdn)
+                self._cache_set(("validate_node", fqdn.lower()), fqdn)
+                return fqdn
         except Exception:
-            pass
+            if self.conn:
+                self.conn.rollback()
         
 
         if '/' not in node[-3:]:
             try:
-                name = socket.gethostbyaddr(node)
-                node = name[0]
-                node = node.split('.')[0].split('_')[0]
-            except:
+                hostname = _resolve_ptr(node)
+                if hostname:
+                    node = hostname.split('.')[0].split('_')[0]
+            except Exception:
                 pass
         
         return node
@@ -2,9 +2,12 @@
 Display and UI functions for Titan Menu.
 """
 
-from typing import List, Dict, Optional
-from tabulate import tabulate
-import pandas as pd
+import csv
+import sys
+from typing import Iterable, List, Dict, Optional
+
+
+_EMPTY_VALUES = frozenset((None, '', 'N/A', 'unknown'))
 
 
 def print_results(data: List[Dict], title: str = "", vertical: bool = False):
@@ -25,41 +28,56 @@ def print_results(data: List[Dict], title: str = "", vertical: bool = False):
         print(f"{'='*100}")
     
     if vertical and len(data) == 1:
-        print()
-        record = data[0]
-        max_key_len = max(len(str(k)) for k in record.keys())
-        for key, value in record.items():
-            if value in [None, '', 'N/A', 'unknown']:
-                continue
-            print(f"  {key:<{max_key_len}} : {value}")
-        print()
+        items = [(str(k), v) for k, v in data[0].items() if v not in _EMPTY_VALUES]
+        max_key_len = max((len(k) for k, _ in items), default=0)
+        buf = [""]
+        buf.extend(f"  {key:<{max_key_len}} : {value}" for key, value in items)
+        buf.append("")
+        sys.stdout.write("\n".join(buf) + "\n")
     else:
+        from tabulate import tabulate
         print(tabulate(data, headers='keys', tablefmt='grid'))
         print(f"\nTotal: {len(data)} record(s)\n")
 
 
-def export_csv(data: List[Dict], filename: str):
-    """Export results to CSV."""
-    if not data:
+def export_csv(data: Iterable[Dict], filename: str):
+    """Export results to CSV.
+    
+    Rows are written as they are consumed, so a generator is streamed
+    straight to disk without being materialised. The header is taken
+    from the first row.
+    """
+    rows = iter(data)
+    first = next(rows, None)
+    if first is None:
         print("[!] No data to export")
         return
     
-    df = pd.DataFrame(data)
-    df.to_csv(filename, index=False)
-    print(f"[+] Exported {len(data)} records to {filename}\n")
+    total = 1
+    with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 16) as f:
+        writer = csv.DictWriter(f, fieldnames=list(first))
+        writer.writeheader()
+        writer.writerow(first)
+        for row in rows:
+            writer.writerow(row)
+            total += 1
+    print(f"[+] Exported {total} records to {filename}\n")
 
 
 def show_main_menu(availability: Optional[Dict[str, int]] = None, device_info: Optional[Dict[str, str]] = None):
     """Display main menu with data availability indicators."""
-    print("\n" + "="*70)
-    print("TITAN DATABASE - DEVICE QUERY MENU")
-    print("="*70)
+    buf = [
+        "",
+        "="*70,
+        "TITAN DATABASE - DEVICE QUERY MENU",
+        "="*70,
+    ]
     
     if device_info:
-        print(f"\n📍 Device: {device_info.get('name', 'N/A')}")
-        print(f"   IP: {device_info.get('mgmt_ip', 'N/A')}")
-        print(f"   Status: {device_info.get('state', 'Unknown')}")
-        print()
+        buf.append(f"\n📍 Device: {device_info.get('name', 'N/A')}")
+        buf.append(f"   IP: {device_info.get('mgmt_ip', 'N/A')}")
+        buf.append(f"   Status: {device_info.get('state', 'Unknown')}")
+        buf.append("")
     
     def format_option(num: int, text: str, data_key: Optional[str] = None) -> str:
         """Format menu option with availability indicator."""
@@ -72,37 +90,41 @@ def show_main_menu(availability: Optional[Dict[str, int]] = None, device_info: O
                 return f"{num:2}. {text:50} [No Data]"
         return f"{num:2}. {text}"
     
-    print("\n[Device Info]")
-    print(format_option(1, "Device Information (Overview)"))
-    print(format_option(2, "Hardware Inventory", "inventory"))
+    buf.append("\n[Device Info]")
+    buf.append(format_option(1, "Device Information (Overview)"))
+    buf.append(format_option(2, "Hardware Inventory", "inventory"))
+    
+    buf.append("\n[Interfaces]")
+    buf.append(format_option(3, "All Interfaces", "interfaces"))
+    buf.append(format_option(4, "UP Interfaces Only", "interfaces"))
+    buf.append(format_option(5, "DOWN Interfaces Only", "interfaces"))
+    buf.append(format_option(6, "Interface Statistics Summary", "interfaces"))
     
-    print("\n[Interfaces]")
-    print(format_option(3, "All Interfaces", "interfaces"))
-    print(format_option(4, "UP Interfaces Only", "interfaces"))
-    print(format_option(5, "DOWN Interfaces Only", "interfaces"))
-    print(format_option(6, "Interface Statistics Summary", "interfaces"))
+    buf.append("\n[Layer 2/3]")
+    buf.append(format_option(7, "L2 Neighbors (LLDP/CDP)", "l2_neighbors"))
+    buf.append(format_option(8, "Circuit Interfaces", "circuits"))
     
-    print("\n[Layer 2/3]")
-    print(format_option(7, "L2 Neighbors (LLDP/CDP)", "l2_neighbors"))
-    print(format_option(8, "Circuit Interfaces", "circuits"))
+    buf.append("\n[Routing Protocols]")
+    buf.append(format_option(9, "OSPF Neighbors", "ospf"))
+    buf.append(format_option(10, "IS-IS Circuits", "isis"))
+    buf.append(format_option(11, "IP SLA Performance (Site-based)", "ip_sla"))
     
-    print("\n[Routing Protocols]")
-    print(format_option(9, "OSPF Neighbors", "ospf"))
-    print(format_option(10, "IS-IS Circuits", "isis"))
-    print(format_option(11, "IP SLA Performance (Site-based)", "ip_sla"))
+    buf.append("\n[Remote SSH Commands]")
+    buf.append(format_option(14, "SSH Remote Command Execution"))
     
-    print("\n[Remote SSH Commands]")
-    print(format_option(14, "SSH Remote Command Execution"))
+    buf.append("\n[Actions]")
+    buf.append("12.  Search for Different Device")
+    buf.append("13.  Export Last Results to CSV")
+    buf.append(" 0.  Exit")
+    buf.append("="*70)
     
-    print("\n[Actions]")
-    print("12.  Search for Different Device")
-    print("13.  Export Last Results to CSV")
-    print(" 0.  Exit")
-    print("="*70)
+    sys.stdout.write("\n".join(buf) + "\n")
 
 
 def print_banner():
     """Print welcome banner."""
-    print("\n" + "*"*60)
-    print("*** TITAN DATABASE - INTERACTIVE QUERY TOOL ***")
-    print("*"*60)
+    sys.stdout.write(
+        "\n" + "*"*60 + "\n"
+        "*** TITAN DATABASE - INTERACTIVE QUERY TOOL ***\n"
+        + "*"*60 + "\n"
+    )
@@ -4,10 +4,57 @@ Main entry point for Titan Database Interactive Menu.
 
 import sys
 import getpass
+import logging
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from .queries import TitanQueries
 from .display import print_results, export_csv, show_main_menu, print_banner
 
 
+# Menu options that run one query and display the rows. Each handler
+# returns (rows, title, print_results keyword arguments).
+HANDLERS = {
+    '1': lambda tq, d: (tq.get_node_info(d), f"Device Information: {d}", {'vertical': True}),
+    '2': lambda tq, d: (tq.get_inventory(d), f"Hardware Inventory: {d}", {}),
+    '3': lambda tq, d: (tq.get_interfaces(d), f"All Interfaces: {d}", {}),
+    '4': lambda tq, d: (tq.get_interfaces(d, state='up'), f"UP Interfaces: {d}", {}),
+    '5': lambda tq, d: (tq.get_interfaces(d, state='down'), f"DOWN Interfaces: {d}", {}),
+    '6': lambda tq, d: (tq.get_interface_stats(d), f"Interface Statistics: {d}", {}),
+    '7': lambda tq, d: (tq.get_neighbors(d), f"L2 Neighbors: {d}", {}),
+    '8': lambda tq, d: (tq.get_circuits(d), f"Circuit Interfaces: {d}", {}),
+    '9': lambda tq, d: (tq.get_ospf_neighbors(d), f"OSPF Neighbors: {d}", {}),
+    '10': lambda tq, d: (tq.get_isis_circuits(d), f"IS-IS Circuits: {d}", {}),
+}
+
+# Query most likely to be picked next after a menu choice, warmed in the
+# background while the user reads the results.
+PREFETCH_NEXT = {
+    '1': 'get_inventory',
+    '3': 'get_interface_stats',
+}
+
+
+def _start_log_listener(log_queue: queue.Queue) -> QueueListener:
+    """Route package log records through log_queue to a background stdout writer.
+    
+    Callers only enqueue a record; the blocking terminal write happens on
+    the listener thread. log_queue.join() waits until everything queued
+    has been printed, for use before output that must come after it.
+    """
+    handler = logging.StreamHandler(sys.stdout)
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    
+    logger = logging.getLogger(__package__)
+    logger.setLevel(logging.INFO)
+    logger.addHandler(QueueHandler(log_queue))
+    logger.propagate = False
+    
+    listener = QueueListener(log_queue, handler)
+    listener.start()
+    return listener
+
+
 def main():
     """Main interactive menu."""
     print_banner()
@@ -27,12 +74,15 @@ def main():
     current_device = None
     data_availability = None
     device_info_result = None
+    executor = ThreadPoolExecutor(max_workers=2)
+    log_queue = queue.Queue(-1)
+    log_listener = _start_log_listener(log_queue)
     
     try:
         while True:
             if not current_device:
                 print("\n" + "="*60)
-                device_input = input("Enter device name (or 'search' to search): ").strip()
+                device_input = input("Enter device name (or 'search' to search, prefix '!' to refresh): ").strip()
                 
                 if device_input.lower() == 'search':
                     search_term = input("Enter search term: ").strip()
@@ -44,14 +94,12 @@ def main():
                     else:
                         continue
                 
-                current_device = device_input
+                refresh = device_input.startswith('!')
+                current_device = device_input.lstrip('!').strip()
                 print(f"\n[*] Current device: {current_device}")
-                print("[*] Fetching device information...")
-                
-                device_info_result = tq.get_device_header_info(current_device)
+                print("[*] Fetching device information and checking data availability...")
                 
-                print("[*] Checking data availability...")
-                data_availability = tq.check_data_availability(current_device)
+                device_info_result, data_availability = tq.open_device(current_device, refresh)
                 print("[+] Ready!")
             
             show_main_menu(data_availability, device_info_result)
@@ -61,54 +109,9 @@ def main():
                 print("\n[*] Exiting...")
                 break
             
-            elif choice == '1':
-                data = tq.get_node_info(current_device)
-                print_results(data, f"Device Information: {current_device}", vertical=True)
-                last_results = data
-            
-            elif choice == '2':
-                data = tq.get_inventory(current_device)
-                print_results(data, f"Hardware Inventory: {current_device}")
-                last_results = data
-            
-            elif choice == '3':
-                data = tq.get_interfaces(current_device)
-                print_results(data, f"All Interfaces: {current_device}")
-                last_results = data
-            
-            elif choice == '4':
-                data = tq.get_interfaces(current_device, state='up')
-                print_results(data, f"UP Interfaces: {current_device}")
-                last_results = data
-            
-            elif choice == '5':
-                data = tq.get_interfaces(current_device, state='down')
-                print_results(data, f"DOWN Interfaces: {current_device}")
-                last_results = data
-            
-            elif choice == '6':
-                data = tq.get_interface_stats(current_device)
-                print_results(data, f"Interface Statistics: {current_device}")
-                last_results = data
-            
-            elif choice == '7':
-                data = tq.get_neighbors(current_device)
-                print_results(data, f"L2 Neighbors: {current_device}")
-                last_results = data
-            
-            elif choice == '8':
-                data = tq.get_circuits(current_device)
-                print_results(data, f"Circuit Interfaces: {current_device}")
-                last_results = data
-            
-            elif choice == '9':
-                data = tq.get_ospf_neighbors(current_device)
-                print_results(data, f"OSPF Neighbors: {current_device}")
-                last_results = data
-            
-            elif choice == '10':
-                data = tq.get_isis_circuits(current_device)
-                print_results(data, f"IS-IS Circuits: {current_device}")
+            elif choice in HANDLERS:
+                data, title, options = HANDLERS[choice](tq, current_device)
+                print_results(data, title, **options)
                 last_results = data
             
             elif choice == '11':
@@ -140,22 +143,26 @@ def main():
                     device_os = device_info_result.get('os', 'Unknown')
                     device_mgmt_ip = device_info_result.get('mgmt_ip', 'N/A')
                     
-                    print(f"\n" + "="*70)
-                    print(f"NRE Jumpbox - Interactive Bash Shell")
-                    print(f"="*70)
+                    parts = ["\n" + "="*70, "NRE Jumpbox - Interactive Bash Shell", "="*70]
                     
                     if device_mgmt_ip != 'N/A':
-                        print(f"\nTarget Device: {current_device}")
-                        print(f"Management IP: {device_mgmt_ip}")
-                        print(f"OS Type: {device_os}")
+                        parts += [
+                            f"\nTarget Device: {current_device}",
+                            f"Management IP: {device_mgmt_ip}",
+                            f"OS Type: {device_os}",
+                        ]
                     
-                    print(f"\n[*] Connecting to oser500521 jumpbox...")
+                    parts.append("\n[*] Connecting to oser500521 jumpbox...")
+                    sys.stdout.write("\n".join(parts) + "\n")
+                    sys.stdout.flush()
                     
                     jb_username, jb_password = prompt_for_jumpbox_credentials()
                     
                     jumpbox = NREJumpbox(jb_username, jb_password)
                     
-                    if not jumpbox.connect():
+                    connected = jumpbox.connect()
+                    log_queue.join()
+                    if not connected:
                         print("\n[!] Failed to connect to jumpbox.\n")
                         continue
                     
@@ -171,6 +178,7 @@ def main():
                     jumpbox.start_interactive_shell(auto_ssh_username=stored_username, auto_ssh_ip=device_mgmt_ip if device_mgmt_ip != 'N/A' else None)
                     
                     jumpbox.disconnect()
+                    log_queue.join()
                     print(f"\n[+] Jumpbox session closed\n")
                 
                 except ImportError as e:
@@ -181,9 +189,14 @@ def main():
             else:
                 print("\n[!] Invalid option. Please try again.\n")
             
+            if choice in PREFETCH_NEXT:
+                executor.submit(getattr(tq, PREFETCH_NEXT[choice]), current_device)
+            
             input("\nPress Enter to continue...")
     
     finally:
+        executor.shutdown(wait=True)
+        log_listener.stop()
         tq.disconnect()
         stored_username = None
 
@@ -25,11 +25,19 @@ Usage:
         napa.disconnect()
 """
 
-from typing import Dict, Optional, Tuple
+from typing import TYPE_CHECKING, Dict, Iterator, Optional, Tuple
 from dataclasses import dataclass
+import atexit
+import codecs
+import functools
 import getpass
-import paramiko
+import re
 import socket
+import sys
+import time
+
+if TYPE_CHECKING:
+    import paramiko
 
 
 @dataclass
@@ -43,6 +51,33 @@ class NAPAInstance:
     description: str
 
 
+# (name, host, port, environment, auth_type, description)
+_INSTANCE_ROWS = (
+    ("NAPA_1", "161.170.234.61", 4000, "MCC BM (dfw replacement)", "ad", "Non-PCI, AD Authentication"),
+    ("NAPA_2", "oseu2015023.homeoffice.wal-mart.com", 4000, "New - CDC", "ad", "Non-PCI, AD Authentication"),
+    ("NAPA_3", "oseu2015024.homeoffice.wal-mart.com", 4000, "New - CDC", "ad", "Non-PCI, AD Authentication"),
+    ("NAPA_4", "oseu2015025.homeoffice.wal-mart.com", 4000, "New - NDC", "ad", "Non-PCI, AD Authentication"),
+    ("NAPA_5", "oseu2015026.homeoffice.wal-mart.com", 4000, "New - EDC", "ad", "Non-PCI, AD Authentication"),
+    ("NAPA_6", "10.120.62.177", 30167, "PCI - NDC", "2fa", "PCI Instance, 2FA Required (AD + RSA OTP)"),
+    ("NAPA_7", "10.120.62.178", 30167, "PCI - NDC", "2fa", "PCI Instance, 2FA Required (AD + RSA OTP)"),
+    ("NAPA_8", "10.225.158.187", 30167, "PCI - CDC", "2fa", "PCI Instance, 2FA Required (AD + RSA OTP)"),
+    ("NAPA_9", "10.225.158.188", 30167, "PCI - CDC", "2fa", "PCI Instance, 2FA Required (AD + RSA OTP)"),
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _instances() -> Dict[str, NAPAInstance]:
+    """Build the NAPAInstance map on first use."""
+    return {row[0]: NAPAInstance(*row) for row in _INSTANCE_ROWS}
+
+
+class _LazyInstances:
+    """Class attribute that resolves to the NAPAInstance map when first read."""
+    
+    def __get__(self, obj, owner) -> Dict[str, NAPAInstance]:
+        return _instances()
+
+
 class NAPAGateway:
     """
     NAPA Gateway for authenticated network device access.
@@ -52,80 +87,21 @@ class NAPAGateway:
     comprehensive audit logging and access control.
     """
     
-    INSTANCES = {
-        "NAPA_1": NAPAInstance(
-            name="NAPA_1",
-            host="161.170.234.61",
-            port=4000,
-            environment="MCC BM (dfw replacement)",
-            auth_type="ad",
-            description="Non-PCI, AD Authentication"
-        ),
-        "NAPA_2": NAPAInstance(
-            name="NAPA_2",
-            host="oseu2015023.homeoffice.wal-mart.com",
-            port=4000,
-            environment="New - CDC",
-            auth_type="ad",
-            description="Non-PCI, AD Authentication"
-        ),
-        "NAPA_3": NAPAInstance(
-            name="NAPA_3",
-            host="oseu2015024.homeoffice.wal-mart.com",
-            port=4000,
-            environment="New - CDC",
-            auth_type="ad",
-            description="Non-PCI, AD Authentication"
-        ),
-        "NAPA_4": NAPAInstance(
-            name="NAPA_4",
-            host="oseu2015025.homeoffice.wal-mart.com",
-            port=4000,
-            environment="New - NDC",
-            auth_type="ad",
-            description="Non-PCI, AD Authentication"
-        ),
-        "NAPA_5": NAPAInstance(
-            name="NAPA_5",
-            host="oseu2015026.homeoffice.wal-mart.com",
-            port=4000,
-            environment="New - EDC",
-            auth_type="ad",
-            description="Non-PCI, AD Authentication"
-        ),
-        "NAPA_6": NAPAInstance(
-            name="NAPA_6",
-            host="10.120.62.177",
-            port=30167,
-            environment="PCI - NDC",
-            auth_type="2fa",
-            description="PCI Instance, 2FA Required (AD + RSA OTP)"
-        ),
-        "NAPA_7": NAPAInstance(
-            name="NAPA_7",
-            host="10.120.62.178",
-            port=30167,
-            environment="PCI - NDC",
-            auth_type="2fa",
-            description="PCI Instance, 2FA Required (AD + RSA OTP)"
-        ),
-        "NAPA_8": NAPAInstance(
-            name="NAPA_8",
-            host="10.225.158.187",
-            port=30167,
-            environment="PCI - CDC",
-            auth_type="2fa",
-            description="PCI Instance, 2FA Required (AD + RSA OTP)"
-        ),
-        "NAPA_9": NAPAInstance(
-            name="NAPA_9",
-            host="10.225.158.188",
-            port=30167,
-            environment="PCI - CDC",
-            auth_type="2fa",
-            description="PCI Instance, 2FA Required (AD + RSA OTP)"
-        ),
-    }
+    INSTANCES = _LazyInstances()
+    
+    SHELL_TIMEOUT = 30
+    PROMPT_QUIET = 0.5
+    RECV_SIZE = 65536
+    # Lines a device CLI prints when it rejects a command (IOS/NX-OS/EOS, Junos)
+    DEVICE_ERROR_RE = re.compile(
+        r'^\s*(?:% ?(?:Invalid|Incomplete|Ambiguous|Unknown|Unrecognized)\b'
+        r'|syntax error\b|unknown command\b|error:)',
+        re.IGNORECASE | re.MULTILINE
+    )
+    WARNING_RE = re.compile(rb'^\s*Warning', re.IGNORECASE | re.MULTILINE)
+    
+    # Authenticated clients kept open across disconnect(), keyed by (host, port, username)
+    _client_pool: Dict[Tuple[str, int, str], "paramiko.SSHClient"] = {}
     
     def __init__(
         self,
@@ -144,11 +120,14 @@ class NAPAGateway:
         self.username = username
         self.otp = otp
         
-        if napa_instance not in self.INSTANCES:
+        instance = self.INSTANCES.get(napa_instance)
+        if instance is None:
             raise ValueError(f"Invalid NAPA instance: {napa_instance}")
         
-        self.instance = self.INSTANCES[napa_instance]
+        self.instance = instance
         self.ssh_client = None
+        self._chan = None
+        self._prompt_re = None
         self.connected = False
         self.current_device = None
     
@@ -162,15 +141,33 @@ class NAPAGateway:
         Returns:
             True if connection successful
         """
+        import paramiko
+        
+        pool_key = (self.instance.host, self.instance.port, self.username)
+        pooled = self._client_pool.get(pool_key)
+        if pooled is not None:
+            transport = pooled.get_transport()
+            if transport is not None and transport.is_active() and transport.is_authenticated():
+                self.ssh_client = pooled
+                self._open_shell()
+                self.connected = True
+                print(f"[+] Reusing NAPA session: {self.instance.name}")
+                return True
+            del self._client_pool[pool_key]
+            pooled.close()
+        
+        passcode = bytearray()
         try:
             if not password:
                 password = getpass.getpass(f"AD Password for {self.username}: ")
             
-            passcode = password
+            passcode.extend(password.encode('utf-8'))
+            password = None
             if self.instance.auth_type == "2fa":
                 if not self.otp:
                     self.otp = getpass.getpass("RSA OTP (6 digits): ")
-                passcode = password + self.otp
+                passcode.extend(self.otp.encode('utf-8'))
+                self.otp = None
             
             print(f"[*] Connecting to {self.instance.name} ({self.instance.host}:{self.instance.port})...")
             
@@ -181,13 +178,16 @@ class NAPAGateway:
                 hostname=self.instance.host,
                 port=self.instance.port,
                 username=self.username,
-                password=passcode,
+                password=passcode.decode('utf-8'),
                 timeout=10,
                 allow_agent=False,
                 look_for_keys=False,
                 banner_timeout=10,
             )
             
+            self._client_pool[pool_key] = self.ssh_client
+            self._open_shell()
+            
             self.connected = True
             print(f"[+] Connected to NAPA: {self.instance.name}")
             print(f"[+] Environment: {self.instance.environment}")
@@ -210,13 +210,93 @@ class NAPAGateway:
         except Exception as e:
             print(f"[!] Connection error: {e}")
             return False
+        
+        finally:
+            # Zero the combined password/OTP buffer; the OTP is single-use anyway
+            for i in range(len(passcode)):
+                passcode[i] = 0
+            self.otp = None
+    
+    def _open_shell(self) -> None:
+        """
+        Open the long-lived shell channel reused by execute_command.
+        
+        The exact prompt is learned from the login output, so a command is
+        only considered finished when that prompt comes back, not when some
+        output line happens to end in '#' or '%'.
+        
+        Falls back to per-command exec channels if the gateway refuses a shell.
+        """
+        try:
+            self._chan = self.ssh_client.invoke_shell()
+            prompt = self._learn_prompt()
+            self._prompt_re = re.compile(rb'[\r\n]' + re.escape(prompt) + rb'\s*$')
+        except Exception as e:
+            print(f"[*] Interactive shell unavailable, using one-shot commands: {e}")
+            self._close_shell()
+    
+    def _close_shell(self) -> None:
+        """
+        Close the shell channel, if open.
+        """
+        if self._chan is not None:
+            self._chan.close()
+            self._chan = None
+        self._prompt_re = None
+    
+    def _learn_prompt(self) -> bytes:
+        """
+        Read the login banner until the shell has been quiet for
+        PROMPT_QUIET seconds and take its last line as the prompt.
+        
+        Returns:
+            The prompt, without surrounding whitespace
+        """
+        buf = bytearray()
+        deadline = time.monotonic() + self.SHELL_TIMEOUT
+        self._chan.settimeout(self.PROMPT_QUIET)
+        try:
+            while time.monotonic() < deadline:
+                try:
+                    chunk = self._chan.recv(self.RECV_SIZE)
+                except socket.timeout:
+                    if buf.strip():
+                        break
+                    continue
+                if not chunk:
+                    raise EOFError("NAPA shell closed")
+                buf += chunk
+        finally:
+            self._chan.settimeout(self.SHELL_TIMEOUT)
+        
+        lines = bytes(buf).strip().splitlines()
+        if not lines:
+            raise socket.timeout("No prompt from NAPA shell")
+        return lines[-1].strip()
+    
+    def _read_until_prompt(self) -> bytes:
+        """
+        Read from the shell channel until the learned prompt reappears.
+        
+        Returns:
+            Raw bytes received, including the echoed command and prompt
+        """
+        buf = bytearray()
+        while True:
+            chunk = self._chan.recv(self.RECV_SIZE)
+            if not chunk:
+                raise EOFError("NAPA shell closed")
+            buf += chunk
+            if self._prompt_re.search(buf[-256:]):
+                return bytes(buf)
     
-    def execute_command(self, command: str) -> Tuple[bool, str]:
+    def execute_command(self, command: str, one_shot: bool = False) -> Tuple[bool, str]:
         """
         Execute command on connected device via NAPA.
         
         Args:
             command: Command to execute on device
+            one_shot: Run on a fresh exec channel instead of the shared shell
             
         Returns:
             Tuple of (success: bool, output: str)
@@ -224,53 +304,114 @@ class NAPAGateway:
         if not self.connected:
             return False, "Not connected to NAPA"
         
-        try:
-            stdin, stdout, stderr = self.ssh_client.exec_command(command)
-            output = stdout.read().decode('utf-8', errors='ignore')
-            error = stderr.read().decode('utf-8', errors='ignore')
-            
-            if error and "Warning" not in error:
-                return False, error
+        if self._chan is not None and not one_shot:
+            try:
+                self._chan.send(command + "\n")
+                raw = self._read_until_prompt()
+            except Exception as e:
+                # Output still in flight would be read as the next command's,
+                # so start over on a fresh shell
+                self._close_shell()
+                self._open_shell()
+                if isinstance(e, socket.timeout):
+                    return False, "[!] Command timeout"
+                return False, str(e)
             
+            lines = raw.decode('utf-8', errors='ignore').splitlines()
+            output = "\n".join(lines[1:-1])
+            if self.DEVICE_ERROR_RE.search(output):
+                return False, output
             return True, output
         
+        try:
+            return True, "".join(self.stream_command(command))
         except Exception as e:
             return False, str(e)
     
+    def stream_command(self, command: str) -> Iterator[str]:
+        """
+        Run command on a fresh exec channel, yielding output as it arrives.
+        
+        Output is received in RECV_SIZE chunks and decoded incrementally, so
+        large dumps can be written out without holding them in memory.
+        
+        Args:
+            command: Command to execute on device
+            
+        Yields:
+            Decoded chunks of stdout
+            
+        Raises:
+            RuntimeError: If stderr has output and no line of it starts with "Warning"
+        """
+        stdin, stdout, stderr = self.ssh_client.exec_command(command)
+        channel = stdout.channel
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='ignore')
+        
+        while True:
+            chunk = channel.recv(self.RECV_SIZE)
+            if not chunk:
+                break
+            text = decoder.decode(chunk)
+            if text:
+                yield text
+        
+        tail = decoder.decode(b"", final=True)
+        if tail:
+            yield tail
+        
+        error = stderr.read()
+        if error and not self.WARNING_RE.search(error):
+            raise RuntimeError(error.decode('utf-8', errors='ignore'))
+    
     def disconnect(self) -> None:
         """
         Disconnect from NAPA.
+        
+        The authenticated client stays in the pool for the next connect();
+        use close_pool() to drop it for real.
         """
-        if self.ssh_client:
-            self.ssh_client.close()
+        self._close_shell()
+        self.ssh_client = None
         self.connected = False
         print(f"[+] Disconnected from NAPA")
     
+    @classmethod
+    def close_pool(cls) -> None:
+        """
+        Close every pooled NAPA client. Registered to run at exit.
+        """
+        for client in cls._client_pool.values():
+            client.close()
+        cls._client_pool.clear()
+    
     @staticmethod
     def list_instances() -> None:
         """
         Display all available NAPA instances.
         """
-        print("\n" + "="*80)
-        print("Available NAPA Instances")
-        print("="*80)
+        parts = ["\n" + "="*80, "Available NAPA Instances", "="*80]
         
-        print("\nNON-PCI Instances (AD Authentication):")
-        print("-" * 80)
-        for name in ["NAPA_1", "NAPA_2", "NAPA_3", "NAPA_4", "NAPA_5"]:
-            inst = NAPAGateway.INSTANCES[name]
-            print(f"  {name:8} | {inst.host:40} | {inst.environment:30}")
+        parts += ["\nNON-PCI Instances (AD Authentication):", "-" * 80]
+        parts += [f"  {name:8} | {host:40} | {environment:30}"
+                  for name, host, _, environment, auth_type, _ in _INSTANCE_ROWS
+                  if auth_type == "ad"]
         
-        print("\nPCI Instances (2FA - AD + RSA OTP):")
-        print("-" * 80)
-        for name in ["NAPA_6", "NAPA_7", "NAPA_8", "NAPA_9"]:
-            inst = NAPAGateway.INSTANCES[name]
-            print(f"  {name:8} | {inst.host:40} | {inst.environment:30}")
+        parts += ["\nPCI Instances (2FA - AD + RSA OTP):", "-" * 80]
+        parts += [f"  {name:8} | {host:40} | {environment:30}"
+                  for name, host, _, environment, auth_type, _ in _INSTANCE_ROWS
+                  if auth_type == "2fa"]
         
-        print("\nRecommendation:")
-        print("  - Use NAPA_6 to NAPA_9 for external/remote access (more secure)")
-        print("  - Use NAPA_1 to NAPA_5 for internal network access (AD only)")
-        print()
+        parts += [
+            "\nRecommendation:",
+            "  - Use NAPA_6 to NAPA_9 for external/remote access (more secure)",
+            "  - Use NAPA_1 to NAPA_5 for internal network access (AD only)",
+            "",
+        ]
+        sys.stdout.write("\n".join(parts) + "\n")
+
+
+atexit.register(NAPAGateway.close_pool)
 
 
 def prompt_for_napa_access() -> Tuple[str, str, str]:
@@ -10,10 +10,24 @@ Usage:
     jumpbox.execute_on_device(device_ip, device_user, command)
 """
 
+import atexit
+import codecs
+import functools
+import logging
+import os
 import paramiko
+import random
+import select
+import selectors
+import shlex
 import socket
 import re
-from typing import Tuple, Optional
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, as_completed, wait
+from pathlib import Path
+from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 
 
@@ -26,9 +40,303 @@ class NREJumpboxConfig:
     auth_method: str = "ad_password"
     connect_timeout: int = 10
     command_timeout: int = 15
+    keepalive_interval: int = 30
+    busy_poll_usec: int = 0
     realm: str = ""
 
 
+class _SSHPool:
+    """
+    Authenticated SSH clients shared per (hostname, username, port).
+    
+    A paramiko Transport multiplexes channels, so every NREJumpbox talking
+    to the same jumpbox as the same user opens its channels over one
+    TCP/SSH connection instead of dialling its own. Clients stay open after
+    disconnect() so the next connect() skips the handshake, KEX and auth.
+    """
+    
+    def __init__(self):
+        self._clients: Dict[Tuple[str, str, int], paramiko.SSHClient] = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _is_live(client: paramiko.SSHClient) -> bool:
+        """Whether client still has an active transport."""
+        transport = client.get_transport()
+        return transport is not None and transport.is_active()
+    
+    def borrow(self, key: Tuple[str, str, int]) -> Optional[paramiko.SSHClient]:
+        """
+        Return the live shared client for key, dropping it if it has gone stale.
+        
+        Returns:
+            A connected SSHClient, or None if there is none for key
+        """
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None:
+                return None
+            if self._is_live(client):
+                return client
+            del self._clients[key]
+        client.close()
+        return None
+    
+    def add(self, key: Tuple[str, str, int], client: paramiko.SSHClient) -> paramiko.SSHClient:
+        """
+        Share a newly connected client under key.
+        
+        If another caller connected first, its client wins and ours is closed.
+        
+        Returns:
+            The client to use for key
+        """
+        with self._lock:
+            existing = self._clients.get(key)
+            if existing is None or existing is client or not self._is_live(existing):
+                self._clients[key] = client
+                return client
+        client.close()
+        return existing
+    
+    def release(self, key: Tuple[str, str, int], client: paramiko.SSHClient):
+        """
+        Give up a caller's use of client; it is closed only if its transport is dead.
+        """
+        if self._is_live(client):
+            return
+        with self._lock:
+            if self._clients.get(key) is client:
+                del self._clients[key]
+        client.close()
+    
+    def close_all(self):
+        """
+        Close every pooled client. Registered to run at exit.
+        """
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+        for client in clients:
+            client.close()
+
+
+KNOWN_HOSTS_PATH = Path.home() / ".titan_menu" / "known_hosts"
+_KNOWN_HOSTS_LOCK = threading.Lock()
+
+
+class _SaveNewHostKeyPolicy(paramiko.MissingHostKeyPolicy):
+    """
+    Trust a jumpbox key on first use and persist it to KNOWN_HOSTS_PATH.
+    
+    Hosts already in the file are verified against it by paramiko, so a
+    changed key raises BadHostKeyException instead of being accepted.
+    The file is re-read under a lock before saving so the concurrent
+    primary/fallback attempts do not overwrite each other's entries.
+    """
+    
+    def missing_host_key(self, client, hostname, key):
+        with _KNOWN_HOSTS_LOCK:
+            known = paramiko.HostKeys()
+            if KNOWN_HOSTS_PATH.exists():
+                known.load(str(KNOWN_HOSTS_PATH))
+            known.add(hostname, key.get_name(), key)
+            KNOWN_HOSTS_PATH.parent.mkdir(parents=True, exist_ok=True)
+            known.save(str(KNOWN_HOSTS_PATH))
+        client.get_host_keys().add(hostname, key.get_name(), key)
+
+
+def _probe_key(path: Path) -> bool:
+    """
+    Check whether path is a private key file.
+    
+    Only the first line is read; PEM and OpenSSH keys put the
+    "-----BEGIN ... PRIVATE KEY-----" header there.
+    """
+    try:
+        if not path.is_file():
+            return False
+        with open(path, 'r') as f:
+            return "PRIVATE KEY" in f.readline(64)
+    except Exception:
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _discover_ssh_keys() -> Tuple[Path, ...]:
+    """
+    Find private keys among the standard ~/.ssh key files, once per process.
+    
+    The four files are probed concurrently. Call _discover_ssh_keys.cache_clear()
+    to force a re-scan.
+    
+    Returns:
+        Paths of valid keys, in preference order
+    """
+    ssh_home = Path.home() / ".ssh"
+    key_paths = [ssh_home / name for name in ("id_rsa", "id_ecdsa", "id_ed25519", "id_dsa")]
+    
+    with ThreadPoolExecutor(max_workers=len(key_paths)) as executor:
+        found = executor.map(_probe_key, key_paths)
+        return tuple(path for path, ok in zip(key_paths, found) if ok)
+
+
+RESOLVE_TTL = 300
+_RESOLVE_CACHE: Dict[Tuple[str, int], Tuple[str, float]] = {}
+_RESOLVE_LOCK = threading.Lock()
+
+
+def _resolve(hostname: str, port: int) -> str:
+    """
+    Resolve a jumpbox hostname, preferring IPv4, caching it for RESOLVE_TTL.
+    
+    Only temporary resolver failures (EAI_AGAIN) are retried, with a short
+    jittered backoff; a name that does not exist fails on the first try.
+    Failures are not cached, and a jumpbox moved in DNS is picked up once
+    the entry expires.
+    
+    Returns:
+        IP address to dial
+    """
+    key = (hostname, port)
+    with _RESOLVE_LOCK:
+        cached = _RESOLVE_CACHE.get(key)
+    if cached and cached[1] > time.monotonic():
+        return cached[0]
+    
+    for attempt in range(3):
+        try:
+            infos = socket.getaddrinfo(hostname, port, type=socket.SOCK_STREAM)
+            break
+        except socket.gaierror as e:
+            if e.errno != socket.EAI_AGAIN or attempt == 2:
+                raise
+            time.sleep(0.1 * 2 ** attempt + random.random() * 0.1)
+    
+    address = next(
+        (sockaddr[0] for family, _, _, _, sockaddr in infos if family == socket.AF_INET),
+        infos[0][4][0]
+    )
+    with _RESOLVE_LOCK:
+        _RESOLVE_CACHE[key] = (address, time.monotonic() + RESOLVE_TTL)
+    return address
+
+
+def _enable_keepalive(client: paramiko.SSHClient, interval: int):
+    """
+    Keep an idle jumpbox session alive through NAT and firewall idle timers.
+    
+    Sends an SSH-level keepalive every interval seconds and turns on TCP
+    keepalive on the socket, with the idle time set where the platform
+    supports it.
+    """
+    transport = client.get_transport()
+    if transport is None:
+        return
+    
+    transport.set_keepalive(interval)
+    sock = transport.sock
+    try:
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+        if hasattr(socket, 'TCP_KEEPIDLE'):
+            sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 2 * interval)
+    except OSError:
+        pass
+
+
+# Not exported by the socket module; the value is fixed in the Linux ABI
+SO_BUSY_POLL = getattr(socket, 'SO_BUSY_POLL', 46)
+
+
+def _enable_busy_poll(client: paramiko.SSHClient, usec: int):
+    """
+    Ask the kernel to busy-poll the jumpbox socket for usec on blocking reads.
+    
+    Linux only. Trades CPU for lower small-message latency, so it is off
+    unless NREJumpboxConfig.busy_poll_usec is set; values above the
+    net.core.busy_read sysctl need CAP_NET_ADMIN and are silently skipped.
+    """
+    transport = client.get_transport()
+    if transport is None or not sys.platform.startswith('linux'):
+        return
+    
+    try:
+        transport.sock.setsockopt(socket.SOL_SOCKET, SO_BUSY_POLL, usec)
+    except OSError:
+        pass
+
+
+CONNECT_ATTEMPTS = 3
+
+
+def _connect_with_retry(client: paramiko.SSHClient, **kwargs):
+    """
+    Call client.connect(), retrying transient network failures.
+    
+    Timeouts, refused/reset connections and SSH protocol errors are retried
+    with jittered exponential backoff. Authentication and host-key failures
+    are raised immediately, as retrying cannot fix them. A pre-connected
+    sock is only used for the first attempt; retries dial afresh.
+    """
+    for attempt in range(CONNECT_ATTEMPTS):
+        try:
+            client.connect(**kwargs)
+            return
+        except (paramiko.AuthenticationException, paramiko.BadHostKeyException):
+            raise
+        except (socket.timeout, ConnectionError, paramiko.SSHException,
+                paramiko.ssh_exception.NoValidConnectionsError):
+            if attempt == CONNECT_ATTEMPTS - 1:
+                raise
+            client.close()
+            kwargs.pop('sock', None)
+            time.sleep(min(2.0, 0.1 * 2 ** attempt) + random.random() * 0.1)
+
+
+def _close_loser(fut: Future):
+    """
+    Close the socket from a dial that finished after the race was won.
+    """
+    sock = fut.result()
+    if sock is not None:
+        sock.close()
+
+
+_CONNECTION_POOL = _SSHPool()
+atexit.register(_CONNECTION_POOL.close_all)
+
+log = logging.getLogger(__name__)
+
+RECV_SIZE = 65536
+
+# Algorithms never offered to the jumpbox. Modular DH key exchange costs a
+# large modexp (and an extra round trip for group-exchange) where the
+# remaining curve25519/ECDH options are cheap; CBC and 3DES are legacy.
+# Names a given paramiko release does not know are simply ignored.
+JUMPBOX_DISABLED_ALGORITHMS = {
+    'kex': [
+        'diffie-hellman-group-exchange-sha256',
+        'diffie-hellman-group-exchange-sha1',
+        'diffie-hellman-group16-sha512',
+        'diffie-hellman-group14-sha256',
+        'diffie-hellman-group14-sha1',
+        'diffie-hellman-group1-sha1',
+    ],
+    'ciphers': ['aes128-cbc', 'aes192-cbc', 'aes256-cbc', '3des-cbc'],
+}
+
+_STDERR_WARNING_RE = re.compile(rb'^\s*warning\b', re.IGNORECASE | re.MULTILINE)
+
+# Frames every command on the persistent shell: stdout up to _OUT_RE, then
+# the command's stderr (captured in $TM_ERR) up to _ERR_RE
+_COMMAND_FRAME = (
+    "{{ {command}\n}} 2>\"$TM_ERR\"; printf '\\n__TM_OUT__\\n'; "
+    "cat \"$TM_ERR\"; printf '\\n__TM_ERR__\\n'\n"
+)
+_OUT_RE = re.compile(rb'\r?\n__TM_OUT__\r?\n')
+_ERR_RE = re.compile(rb'\r?\n__TM_ERR__\r?\n')
+
+
 class NREJumpbox:
     """
     NRE Enterprise Jumpbox Handler.
@@ -53,6 +361,8 @@ class NREJumpbox:
         4. Bash shell environment with tools like wl, bli, ds, etc.
     """
     
+    HEDGE_DELAY = 0.25
+    
     def __init__(
         self,
         username: str,
@@ -74,6 +384,9 @@ class NREJumpbox:
         self.ssh_client = None
         self.connected = False
         self.current_host = None
+        self._shell = None
+        self._shell_buf = bytearray()
+        self._shell_lock = threading.Lock()
     
     def _validate_credentials(self) -> bool:
         """
@@ -99,11 +412,18 @@ class NREJumpbox:
         """
         return hostname.lower()
     
+    def _pool_key(self, hostname: str) -> Tuple[str, str, int]:
+        """
+        Key identifying this user's connection to hostname in the pool.
+        """
+        return (hostname, self.username, self.config.port)
+    
     def connect(self) -> bool:
         """
         Connect to NRE Jumpbox with TACACS+ authentication.
         
         Tries primary host first, then falls back to secondary if needed.
+        A shared pooled connection to either host is reused before dialling.
         Uses PASSCODE for TACACS+ authentication.
         
         Returns:
@@ -115,14 +435,160 @@ class NREJumpbox:
         ]
         
         for host in hosts_to_try:
-            if self._try_connect(host):
+            client = _CONNECTION_POOL.borrow(self._pool_key(host))
+            if client is not None:
+                log.info("[+] Reusing jumpbox connection: %s", host)
+                self.ssh_client = client
                 self.current_host = host
                 self.connected = True
                 return True
         
-        return False
+        host, client = self._race_connect(hosts_to_try)
+        if client is None:
+            return False
+        
+        _enable_keepalive(client, self.config.keepalive_interval)
+        if self.config.busy_poll_usec:
+            _enable_busy_poll(client, self.config.busy_poll_usec)
+        self.ssh_client = _CONNECTION_POOL.add(self._pool_key(host), client)
+        self.current_host = host
+        self.connected = True
+        return True
+    
+    def _race_connect(self, hosts: List[str]) -> Tuple[Optional[str], Optional[paramiko.SSHClient]]:
+        """
+        Dial the jumpboxes happy-eyeballs style, then authenticate once.
+        
+        Only the TCP connect is hedged: the primary gets a HEDGE_DELAY head
+        start and the fallback is dialled as soon as that expires or the
+        primary fails, so a dead primary costs HEDGE_DELAY rather than a full
+        connect_timeout. If both answer together the primary is preferred and
+        the other socket is closed. The SSH handshake and TACACS+/RSA auth
+        then run on the winning socket alone. If the handshake fails the
+        remaining hosts are dialled and tried in turn, but a rejected login
+        ends the attempt, so a passcode is never sent to a second host.
+        
+        Returns:
+            Tuple of (hostname, client), or (None, None) if every host failed
+        """
+        remaining = list(hosts)
+        while remaining:
+            host, sock = self._dial_first(remaining)
+            if sock is None:
+                return None, None
+            
+            try:
+                client = self._try_connect(host, sock)
+            except paramiko.AuthenticationException:
+                return None, None
+            if client is not None:
+                return host, client
+            
+            remaining.remove(host)
+        
+        return None, None
+    
+    def _dial_first(self, hosts: List[str]) -> Tuple[Optional[str], Optional[socket.socket]]:
+        """
+        Hedge the TCP connect across hosts, preferring the earlier ones.
+        
+        Returns:
+            Tuple of (hostname, socket), or (None, None) if no host answered
+        """
+        executor = ThreadPoolExecutor(max_workers=len(hosts))
+        futures = {executor.submit(self._dial, hosts[0]): 0}
+        next_host = 1
+        pending = set(futures)
+        winner: Tuple[Optional[str], Optional[socket.socket]] = (None, None)
+        
+        try:
+            while pending:
+                timeout = self.HEDGE_DELAY if next_host < len(hosts) else None
+                done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+                
+                for fut in sorted(done, key=futures.get):
+                    sock = fut.result()
+                    if sock is None:
+                        continue
+                    if winner[1] is None:
+                        winner = (hosts[futures[fut]], sock)
+                    else:
+                        sock.close()
+                
+                if winner[1] is not None:
+                    break
+                
+                if next_host < len(hosts):
+                    fut = executor.submit(self._dial, hosts[next_host])
+                    futures[fut] = next_host
+                    pending.add(fut)
+                    next_host += 1
+        finally:
+            for fut in pending:
+                fut.add_done_callback(_close_loser)
+            executor.shutdown(wait=False)
+        
+        return winner
+    
+    def _dial(self, hostname: str) -> Optional[socket.socket]:
+        """
+        Open the TCP connection to a jumpbox host, with no SSH traffic yet.
+        
+        Refused or reset connections are retried like _connect_with_retry.
+        
+        Args:
+            hostname: Hostname (short name like 'oser500521')
+            
+        Returns:
+            Connected socket, or None on failure
+        """
+        log.info("[*] Connecting to jumpbox: %s:%s...", hostname, self.config.port)
+        
+        for attempt in range(CONNECT_ATTEMPTS):
+            try:
+                address = _resolve(hostname, self.config.port)
+                return socket.create_connection(
+                    (address, self.config.port), self.config.connect_timeout
+                )
+            except socket.timeout:
+                log.warning("[!] Connection timeout to %s", hostname)
+                return None
+            except socket.gaierror:
+                log.warning("[!] Cannot resolve hostname: %s", hostname)
+                return None
+            except ConnectionError as e:
+                if attempt == CONNECT_ATTEMPTS - 1:
+                    log.warning("[!] Connection error on %s: %s", hostname, e)
+                    return None
+                time.sleep(min(2.0, 0.1 * 2 ** attempt) + random.random() * 0.1)
+            except OSError as e:
+                log.warning("[!] Connection error on %s: %s", hostname, e)
+                return None
     
-    def _find_ssh_keys(self) -> list:
+    def _ensure_transport(self) -> bool:
+        """
+        Reconnect if the jumpbox transport has dropped since connect().
+        
+        The dead client is handed back through the pool, which drops it
+        for every borrower, rather than closed out from under them.
+        
+        Returns:
+            True if a live connection is available
+        """
+        transport = self.ssh_client.get_transport() if self.ssh_client else None
+        if transport is not None and transport.is_active():
+            return True
+        
+        log.info("[*] Jumpbox connection lost, reconnecting...")
+        with self._shell_lock:
+            self._close_command_shell()
+        if self.ssh_client is not None:
+            _CONNECTION_POOL.release(self._pool_key(self.current_host), self.ssh_client)
+        self.ssh_client = None
+        self.connected = False
+        return self.connect()
+    
+    def _find_ssh_keys(self) -> List[Path]:
         """
         Find SSH private keys in standard locations.
         
@@ -132,30 +598,19 @@ class NREJumpbox:
         3. ~/.ssh/id_ed25519 (ED25519 key)
         4. ~/.ssh/id_dsa (DSA key - legacy)
         
+        The scan is shared with prompt_for_jumpbox_credentials and done
+        once per process; see _discover_ssh_keys().
+        
         Returns:
             List of valid SSH key paths
         """
-        import os
-        from pathlib import Path
-        
-        ssh_home = Path.home() / ".ssh"
-        key_names = ["id_rsa", "id_ecdsa", "id_ed25519", "id_dsa"]
-        found_keys = []
-        
-        for key_name in key_names:
-            key_path = ssh_home / key_name
-            if key_path.exists() and key_path.is_file():
-                try:
-                    with open(key_path, 'r') as f:
-                        content = f.read()
-                        if "PRIVATE KEY" in content:
-                            found_keys.append(str(key_path))
-                except Exception:
-                    pass
-        
-        return found_keys
+        return list(_discover_ssh_keys())
     
-    def _try_connect(self, hostname: str) -> bool:
+    def _try_connect(
+        self,
+        hostname: str,
+        sock: Optional[socket.socket] = None
+    ) -> Optional[paramiko.SSHClient]:
         """
         Attempt connection to a specific jumpbox host.
         
@@ -164,82 +619,109 @@ class NREJumpbox:
         2. Pageant/SSH Agent (if available)
         3. AD password (fallback)
         
+        paramiko is given the hostname rather than the dialled address, so
+        host keys are checked and saved under the name in known_hosts.
+        
         Args:
             hostname: Hostname (short name like 'oser500521')
+            sock: Socket already connected by _dial, used for the first attempt
             
         Returns:
-            True if successful, False otherwise
+            The authenticated SSHClient, or None on failure
+            
+        Raises:
+            paramiko.AuthenticationException: The host rejected the login
         """
+        client = paramiko.SSHClient()
+        if KNOWN_HOSTS_PATH.exists():
+            client.load_host_keys(str(KNOWN_HOSTS_PATH))
+        client.set_missing_host_key_policy(_SaveNewHostKeyPolicy())
+        connected = False
+        
         try:
-            print(f"[*] Connecting to jumpbox: {hostname}:{self.config.port}...")
-            
-            self.ssh_client = paramiko.SSHClient()
-            self.ssh_client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+            if sock is None:
+                log.info("[*] Connecting to jumpbox: %s:%s...", hostname, self.config.port)
             
             ssh_keys = self._find_ssh_keys()
             if ssh_keys:
-                print(f"[*] Found SSH keys: {', '.join([k.split('/')[-1] for k in ssh_keys])}")
-                print(f"[*] Trying key-based authentication...")
+                log.info("[*] Found SSH keys: %s", ', '.join(key.name for key in ssh_keys))
+                log.info("[*] Trying key-based authentication...")
                 
                 try:
-                    self.ssh_client.connect(
+                    first_sock, sock = sock, None
+                    _connect_with_retry(
+                        client,
                         hostname=hostname,
                         port=self.config.port,
+                        sock=first_sock,
                         username=self.username,
-                        key_filename=ssh_keys,
+                        key_filename=[str(key) for key in ssh_keys],
                         timeout=self.config.connect_timeout,
                         allow_agent=True,
                         look_for_keys=True,
                         banner_timeout=10,
+                        disabled_algorithms=JUMPBOX_DISABLED_ALGORITHMS,
                     )
-                    print(f"[+] Connected to jumpbox: {hostname}")
-                    print(f"[+] Authenticated as: {self.username} (using SSH key)")
-                    return True
+                    log.info("[+] Connected to jumpbox: %s", hostname)
+                    log.info("[+] Authenticated as: %s (using SSH key)", self.username)
+                    connected = True
+                    return client
                 
                 except paramiko.AuthenticationException:
-                    print(f"[!] SSH key authentication failed")
-                    print(f"[*] Falling back to password authentication...")
+                    log.warning("[!] SSH key authentication failed")
+                    log.info("[*] Falling back to password authentication...")
             
             if not self.password:
-                print(f"[!] No SSH keys found and no password provided")
-                return False
+                log.warning("[!] No SSH keys found and no password provided")
+                return None
             
-            print(f"[*] Using password authentication...")
-            self.ssh_client.connect(
+            log.info("[*] Using password authentication...")
+            first_sock, sock = sock, None
+            _connect_with_retry(
+                client,
                 hostname=hostname,
                 port=self.config.port,
+                sock=first_sock,
                 username=self.username,
                 password=self.password,
                 timeout=self.config.connect_timeout,
-                allow_agent=True,
-                look_for_keys=True,
+                # The key attempt above already offered the agent and key files
+                allow_agent=not ssh_keys,
+                look_for_keys=False,
                 banner_timeout=10,
+                disabled_algorithms=JUMPBOX_DISABLED_ALGORITHMS,
             )
             
-            print(f"[+] Connected to jumpbox: {hostname}")
-            print(f"[+] Authenticated as: {self.username} (using password)")
-            return True
+            log.info("[+] Connected to jumpbox: %s", hostname)
+            log.info("[+] Authenticated as: %s (using password)", self.username)
+            connected = True
+            return client
             
         except paramiko.AuthenticationException as e:
-            print(f"[!] Authentication failed on {hostname}")
-            print(f"[!] Check: username ({self.username})")
+            log.warning("[!] Authentication failed on %s", hostname)
+            log.warning("[!] Check: username (%s)", self.username)
             if self.password:
-                print(f"[!] Check: AD password")
-            print(f"[!] Verify AD groups: NetEng_servers_Role-Login, NetEng_servers_Role-Listed")
-            return False
+                log.warning("[!] Check: AD password")
+            log.warning("[!] Verify AD groups: NetEng_servers_Role-Login, NetEng_servers_Role-Listed")
+            raise
         
         except socket.timeout:
-            print(f"[!] Connection timeout to {hostname}")
-            return False
+            log.warning("[!] Connection timeout to %s", hostname)
+            return None
         
         except socket.gaierror as e:
-            print(f"[!] Cannot resolve hostname: {hostname}")
-            print(f"[!] Trying fallback jumpbox...")
-            return False
+            log.warning("[!] Cannot resolve hostname: %s", hostname)
+            return None
         
         except Exception as e:
-            print(f"[!] Connection error on {hostname}: {e}")
-            return False
+            log.warning("[!] Connection error on %s: %s", hostname, e)
+            return None
+        
+        finally:
+            if not connected:
+                client.close()
+            if sock is not None:
+                sock.close()
     
     def _enable_agent_forwarding(self) -> bool:
         """
@@ -270,7 +752,8 @@ class NREJumpbox:
         """
         Start interactive bash shell on jumpbox (cross-platform).
         Allows user to run commands directly on jumpbox.
-        Uses threading to handle bidirectional I/O on Windows and Unix.
+        Relays I/O with a single select loop on Unix, and with a reader
+        thread per direction on Windows, where stdin cannot be selected.
         
         SSH agent forwarding is enabled for device SSH access.
         
@@ -283,56 +766,15 @@ class NREJumpbox:
         
         try:
             channel = self.ssh_client.invoke_shell()
-            channel.settimeout(0.1)
             
             print("[+] Interactive bash shell started")
             print("[*] Type 'exit' or 'logout' to close connection")
             print("[*] SSH keys are forwarded for device access (use: ssh -l neteng <device_ip>)\n")
             
-            import sys
-            import threading
-            import time
-            
-            stop_flag = threading.Event()
-            
-            def read_from_remote():
-                """Read from jumpbox and print to screen."""
-                while not stop_flag.is_set():
-                    try:
-                        data = channel.recv(1024)
-                        if not data:
-                            break
-                        sys.stdout.write(data.decode('utf-8', errors='ignore'))
-                        sys.stdout.flush()
-                    except socket.timeout:
-                        time.sleep(0.01)
-                    except Exception:
-                        break
-            
-            def read_from_stdin():
-                """Read from user input and send to jumpbox."""
-                while not stop_flag.is_set():
-                    try:
-                        cmd = sys.stdin.readline()
-                        if cmd:
-                            channel.send(cmd.encode('utf-8'))
-                            if cmd.strip() in ['exit', 'logout', 'quit']:
-                                stop_flag.set()
-                                break
-                    except Exception:
-                        break
-            
-            reader_thread = threading.Thread(target=read_from_remote, daemon=True)
-            stdin_thread = threading.Thread(target=read_from_stdin, daemon=True)
-            
-            reader_thread.start()
-            stdin_thread.start()
-            
-            stdin_thread.join()
-            
-            stop_flag.set()
-            
-            reader_thread.join(timeout=1)
+            if os.name == 'nt':
+                self._relay_threaded(channel)
+            else:
+                self._relay_select(channel)
             
             channel.close()
             return True
@@ -344,15 +786,178 @@ class NREJumpbox:
             print(f"[!] Error: {e}")
             return False
     
+    def _relay_select(self, channel: paramiko.Channel) -> None:
+        """
+        Relay terminal and jumpbox shell I/O from one selectors loop.
+        
+        Blocks in select() until either side has data, so an idle session
+        costs no CPU and keystrokes are forwarded without polling delay.
+        Returns on an exit command or when either side closes.
+        """
+        stdin_fd = sys.stdin.fileno()
+        channel.setblocking(False)
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        
+        with selectors.DefaultSelector() as sel:
+            sel.register(channel, selectors.EVENT_READ)
+            sel.register(stdin_fd, selectors.EVENT_READ)
+            
+            while True:
+                for key, _ in sel.select():
+                    if key.fileobj is channel:
+                        try:
+                            data = channel.recv(RECV_SIZE)
+                        except socket.timeout:
+                            continue
+                        if not data:
+                            sys.stdout.write(decoder.decode(b'', final=True))
+                            return
+                        sys.stdout.write(decoder.decode(data))
+                        sys.stdout.flush()
+                    else:
+                        cmd = os.read(stdin_fd, 4096)
+                        if not cmd:
+                            return
+                        channel.send(cmd)
+                        if cmd.strip() in (b'exit', b'logout', b'quit'):
+                            return
+    
+    def _relay_threaded(self, channel: paramiko.Channel) -> None:
+        """
+        Relay terminal and jumpbox shell I/O with one thread per direction.
+        
+        Used on Windows, where select() only works on sockets.
+        """
+        channel.settimeout(0.1)
+        stop_flag = threading.Event()
+        decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+        
+        def read_from_remote():
+            """Read from jumpbox and print to screen."""
+            while not stop_flag.is_set():
+                try:
+                    data = channel.recv(RECV_SIZE)
+                    if not data:
+                        break
+                    sys.stdout.write(decoder.decode(data))
+                    sys.stdout.flush()
+                except socket.timeout:
+                    time.sleep(0.01)
+                except Exception:
+                    break
+            sys.stdout.write(decoder.decode(b'', final=True))
+        
+        def read_from_stdin():
+            """Read from user input and send to jumpbox."""
+            while not stop_flag.is_set():
+                try:
+                    cmd = sys.stdin.readline()
+                    if cmd:
+                        channel.send(cmd.encode('utf-8'))
+                        if cmd.strip() in ['exit', 'logout', 'quit']:
+                            stop_flag.set()
+                            break
+                except Exception:
+                    break
+        
+        reader_thread = threading.Thread(target=read_from_remote, daemon=True)
+        stdin_thread = threading.Thread(target=read_from_stdin, daemon=True)
+        
+        reader_thread.start()
+        stdin_thread.start()
+        
+        stdin_thread.join()
+        
+        stop_flag.set()
+        
+        reader_thread.join(timeout=1)
+    
+    def _open_command_shell(self) -> bool:
+        """
+        Open the persistent shell that execute_command pipelines commands into.
+        
+        The prompt and echo are switched off so the channel carries only
+        command output and the framing markers; stderr goes to a per-shell
+        temp file that is replayed after each command's stdout.
+        
+        Returns:
+            True if the shell is ready, False if the jumpbox refused one
+        """
+        try:
+            shell = self.ssh_client.invoke_shell()
+            shell.settimeout(self.config.command_timeout)
+            shell.send(
+                "export PS1='' PS2=''; stty -echo; "
+                "bind 'set enable-bracketed-paste off' 2>/dev/null; "
+                "TM_ERR=$(mktemp); trap 'rm -f \"$TM_ERR\"' EXIT\n"
+                + _COMMAND_FRAME.format(command=":")
+            )
+            self._shell = shell
+            self._read_command_result()
+            return True
+        except Exception as e:
+            log.info("[*] Persistent shell unavailable, using one-shot commands: %s", e)
+            self._close_command_shell()
+            return False
+    
+    def _close_command_shell(self):
+        """
+        Close the persistent command shell, if open.
+        """
+        if self._shell is not None:
+            self._shell.close()
+            self._shell = None
+        self._shell_buf.clear()
+    
+    def _read_until_marker(self, marker: "re.Pattern") -> bytes:
+        """
+        Read from the persistent shell up to the next marker.
+        
+        Bytes after the marker stay buffered for the next read.
+        
+        Returns:
+            Raw output before the marker
+        """
+        buf = self._shell_buf
+        match = marker.search(buf)
+        while match is None:
+            chunk = self._shell.recv(RECV_SIZE)
+            if not chunk:
+                raise EOFError("Jumpbox shell closed")
+            buf += chunk
+            match = marker.search(buf)
+        
+        data = bytes(buf[:match.start()])
+        del buf[:match.end()]
+        return data
+    
+    def _read_command_result(self) -> Tuple[bytes, bytes]:
+        """
+        Read one framed command's stdout and stderr from the persistent shell.
+        
+        Returns:
+            Tuple of (stdout bytes, stderr bytes) with pty line endings undone
+        """
+        output = self._read_until_marker(_OUT_RE)
+        error = self._read_until_marker(_ERR_RE)
+        return output.replace(b'\r\n', b'\n'), error.replace(b'\r\n', b'\n')
+    
     def execute_command(
         self,
-        command: str
+        command: str,
+        one_shot: bool = False
     ) -> Tuple[bool, str]:
         """
         Execute a single command on jumpbox and return output.
         
+        Commands are written to one long-lived shell channel and framed by
+        markers, so only the first call pays for opening a channel. stderr
+        is captured separately on both paths, and a command fails if it
+        wrote anything to stderr other than warnings.
+        
         Args:
             command: Bash command to execute on jumpbox
+            one_shot: Run on a fresh exec channel instead of the shared shell
             
         Returns:
             Tuple of (success: bool, output: str)
@@ -360,35 +965,178 @@ class NREJumpbox:
         if not self.connected:
             return False, "[!] Not connected to jumpbox"
         
+        if not self._ensure_transport():
+            return False, "[!] Jumpbox connection lost"
+        
+        if not one_shot:
+            with self._shell_lock:
+                if self._shell is not None or self._open_command_shell():
+                    try:
+                        self._shell.send(_COMMAND_FRAME.format(command=command))
+                        return self._command_result(*self._read_command_result())
+                    except socket.timeout:
+                        self._close_command_shell()
+                        return False, "[!] Command timeout"
+                    except Exception as e:
+                        self._close_command_shell()
+                        return False, f"[!] Error: {e}"
+        
         try:
             stdin, stdout, stderr = self.ssh_client.exec_command(
                 command,
                 timeout=self.config.command_timeout
             )
             
-            output = stdout.read().decode('utf-8', errors='ignore')
-            error = stderr.read().decode('utf-8', errors='ignore')
-            
-            if error and "Warning" not in error:
-                return False, error.strip()
-            
-            return True, output.strip()
+            return self._command_result(*self._drain_exec(stdout.channel))
             
         except socket.timeout:
             return False, "[!] Command timeout"
         except Exception as e:
             return False, f"[!] Error: {e}"
     
+    @staticmethod
+    def _command_result(output: bytes, error: bytes) -> Tuple[bool, str]:
+        """
+        Turn a command's stdout and stderr into execute_command's result.
+        
+        Returns:
+            (False, stderr) if stderr has anything but warnings, else (True, stdout)
+        """
+        if error and not _STDERR_WARNING_RE.search(error):
+            return False, error.decode('utf-8', errors='ignore').strip()
+        
+        return True, output.decode('utf-8', errors='ignore').strip()
+    
 
     
+    def execute_on_device(
+        self,
+        device_ip: str,
+        device_user: str,
+        command: str
+    ) -> Tuple[bool, str]:
+        """
+        Run a command on a network device by hopping through the jumpbox.
+        
+        Uses its own exec channel on the shared jumpbox transport, so calls
+        can run concurrently. BatchMode makes the device hop fail fast
+        instead of waiting on a password prompt nobody can answer.
+        
+        Args:
+            device_ip: Target device IP
+            device_user: Device username
+            command: Command to run on the device
+            
+        Returns:
+            Tuple of (success: bool, output: str)
+        """
+        remote = (
+            f"ssh -o BatchMode=yes -o ConnectTimeout={self.config.connect_timeout} "
+            f"-l {shlex.quote(device_user)} {shlex.quote(device_ip)} {shlex.quote(command)}"
+        )
+        return self.execute_command(remote, one_shot=True)
+    
+    def execute_on_devices(
+        self,
+        targets: List[Tuple[str, str, str]],
+        max_concurrency: int = 8
+    ) -> List[Tuple[bool, str]]:
+        """
+        Execute commands on many devices concurrently through the jumpbox.
+        
+        Every worker opens its channel on the one jumpbox connection, so the
+        fan-out costs no extra handshakes. Concurrency is capped below
+        sshd's default MaxSessions of 10 channels per connection.
+        
+        Args:
+            targets: List of (device_ip, device_user, command) tuples
+            max_concurrency: Maximum number of simultaneous device sessions
+            
+        Returns:
+            List of (success, output) tuples in the same order as targets
+        """
+        if not targets:
+            return []
+        
+        results: List[Tuple[bool, str]] = [(False, "")] * len(targets)
+        workers = max(1, min(max_concurrency, len(targets)))
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(self.execute_on_device, ip, user, cmd): index
+                for index, (ip, user, cmd) in enumerate(targets)
+            }
+            for future in as_completed(futures):
+                index = futures[future]
+                try:
+                    results[index] = future.result()
+                except Exception as e:
+                    results[index] = (False, f"[!] Execution failed: {e}")
+        
+        return results
+    
+    def _drain_exec(self, channel: paramiko.Channel) -> Tuple[bytes, bytes]:
+        """
+        Read stdout and stderr of an exec channel together until EOF.
+        
+        Draining both in one loop keeps a chatty stderr from filling the
+        channel window while stdout is still being read. paramiko only
+        wakes select() for stdout, so the wait is capped at 50 ms to pick
+        up stderr promptly.
+        
+        Raises:
+            socket.timeout: If neither stream produces data for command_timeout
+            
+        Returns:
+            Tuple of (stdout bytes, stderr bytes)
+        """
+        out_chunks = []
+        err_chunks = []
+        last_data = time.monotonic()
+        
+        while True:
+            got_data = False
+            if channel.recv_ready():
+                out_chunks.append(channel.recv(RECV_SIZE))
+                got_data = True
+            if channel.recv_stderr_ready():
+                err_chunks.append(channel.recv_stderr(RECV_SIZE))
+                got_data = True
+            
+            if got_data:
+                last_data = time.monotonic()
+                continue
+            if channel.eof_received or channel.closed:
+                # Data that landed between the ready checks and EOF is
+                # still buffered; recv returns b"" once a stream is empty
+                for recv, chunks in ((channel.recv, out_chunks), (channel.recv_stderr, err_chunks)):
+                    chunk = recv(RECV_SIZE)
+                    while chunk:
+                        chunks.append(chunk)
+                        chunk = recv(RECV_SIZE)
+                break
+            if time.monotonic() - last_data > self.config.command_timeout:
+                raise socket.timeout()
+            
+            select.select([channel], [], [], 0.05)
+        
+        return b"".join(out_chunks), b"".join(err_chunks)
+    
     def disconnect(self):
         """
         Close connection to jumpbox.
+        
+        A live connection stays open in the pool for other and later users.
         """
+        self._close_command_shell()
         if self.ssh_client:
-            self.ssh_client.close()
+            if self.connected:
+                _CONNECTION_POOL.release(self._pool_key(self.current_host), self.ssh_client)
+            else:
+                self.ssh_client.close()
+            self.ssh_client = None
             self.connected = False
-            print(f"[*] Disconnected from jumpbox: {self.current_host}")
+            log.info("[*] Disconnected from jumpbox: %s", self.current_host)
     
     def __enter__(self):
         """Context manager entry."""
@@ -411,7 +1159,6 @@ def prompt_for_jumpbox_credentials() -> Tuple[str, str]:
         Tuple of (username: str, password: str)
     """
     import getpass
-    from pathlib import Path
     
     print("\n" + "="*70)
     print("NRE Enterprise Jumpbox - SSH Authentication")
@@ -420,20 +1167,14 @@ def prompt_for_jumpbox_credentials() -> Tuple[str, str]:
     print("OS: Unix/Linux (Bash shell)")
     print()
     
-    username = input("AD Username (e.g., vn59iz6): ").strip()
+    # Scan ~/.ssh while the user types; the result is cached for connect() too
+    key_probe = threading.Thread(target=_discover_ssh_keys, daemon=True)
+    key_probe.start()
     
-    ssh_home = Path.home() / ".ssh"
-    has_ssh_keys = False
-    
-    if ssh_home.exists():
-        key_names = ["id_rsa", "id_ecdsa", "id_ed25519", "id_dsa"]
-        for key_name in key_names:
-            key_path = ssh_home / key_name
-            if key_path.exists():
-                has_ssh_keys = True
-                break
+    username = input("AD Username (e.g., vn59iz6): ").strip()
     
-    if has_ssh_keys:
+    key_probe.join()
+    if _discover_ssh_keys():
         print("\n[*] SSH keys found in ~/.ssh")
         print("[*] Will try key-based authentication first (like SuperPutty)")
         password_prompt = "AD Password (press Enter to skip if SSH key works): "
@@ -449,6 +1190,8 @@ def prompt_for_jumpbox_credentials() -> Tuple[str, str]:
 if __name__ == "__main__":
     import sys
     
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     try:
         username, passcode = prompt_for_tacacs_credentials()
         
@@ -2,8 +2,228 @@
 Query methods for Titan DB device information.
 """
 
-from typing import List, Dict, Optional
-from .database import TitanDatabase
+import re
+from typing import List, Dict, Optional, Tuple
+from .database import _MISS, TitanDatabase, auto_reconnect, cached_query
+
+
+HEADER_TTL = 30
+
+_STATE_DISPLAY = {
+    'online': '🟢 Online',
+    'offline': '🔴 Offline',
+    'decommissioned': '⚫ Decommissioned',
+}
+_OTHER_STATE_PREFIX = '⚪ '
+
+_FQDN_STRIP = re.compile(r'\.(?:homeoffice\.|mgt\.)?wal-mart\.com\.?$')
+
+
+def _build_node_predicate(node: str, alias: str = 'n') -> Tuple[str, Tuple[str, str]]:
+    """
+    Build the WHERE fragment that matches a node by name or FQDN.
+
+    validate_node() already resolves input to the device's FQDN, so an
+    anchored 'token%' match is enough and lets Postgres probe the node
+    indexes instead of scanning. A pattern that already contains '%' is
+    passed through unchanged for callers that need an unanchored match.
+    """
+    pattern = node if '%' in node else f'{node}%'
+    return f"({alias}.name ILIKE %s OR {alias}.fqdn ILIKE %s)", (pattern, pattern)
+
+
+def _device_header_query(node: str) -> Tuple[str, Tuple]:
+    """Name, management IP and state of the best match for a validated node."""
+    clean_node = _FQDN_STRIP.sub('', node).rstrip('.')
+    node_sql, node_params = _build_node_predicate(clean_node)
+    query = f"""
+        SELECT 
+            n.name,
+            n.mgmt_ip,
+            n.state
+        FROM node n
+        WHERE {node_sql}
+        ORDER BY 
+            CASE 
+                WHEN n.name = %s THEN 1
+                WHEN n.fqdn ILIKE %s THEN 2
+                ELSE 3
+            END
+        LIMIT 1
+    """
+    return query, node_params + (clean_node, f'{clean_node}.wal-mart.com%')
+
+
+def _device_header(result: Optional[Dict], node: str) -> Dict[str, str]:
+    """Format a _device_header_query row for the menu header."""
+    if not result:
+        return {'name': node, 'mgmt_ip': 'N/A', 'state': '⚪ Unknown'}
+    
+    state = result['state'] or 'unknown'
+    return {
+        'name': result['name'] or 'Unknown',
+        'mgmt_ip': result['mgmt_ip'] or 'N/A',
+        'state': _STATE_DISPLAY.get(state.lower()) or _OTHER_STATE_PREFIX + state.title()
+    }
+
+
+def _availability_query(node: str) -> Tuple[str, Tuple]:
+    """Row counts behind each menu option for a validated node, in one row."""
+    node_sql, node_params = _build_node_predicate(node, 'node')
+    query = f"""
+        WITH n AS (
+            SELECT id, site_id
+            FROM node
+            WHERE {node_sql}
+            ORDER BY fqdn = %s DESC
+            LIMIT 1
+        ),
+        i AS (
+            SELECT id, description
+            FROM interface
+            WHERE node_id IN (SELECT id FROM n)
+        )
+        SELECT
+            ic.interfaces,
+            (SELECT COUNT(*) FROM node_inventory WHERE node_id IN (SELECT id FROM n)) AS inventory,
+            (SELECT COUNT(*) FROM interface_metrics WHERE interface_id IN (SELECT id FROM i)) AS interface_metrics,
+            (SELECT COUNT(*) FROM l2_neighbor WHERE node_id IN (SELECT id FROM n) AND deleted_at IS NULL) AS l2_neighbors,
+            (SELECT COUNT(*) FROM ospf_neighbor o
+                JOIN ospf_area_interface oai ON oai.id = o.ospf_area_interface_id
+                WHERE oai.interface_id IN (SELECT id FROM i) AND o.deleted_at IS NULL) AS ospf,
+            (SELECT COUNT(*) FROM isis_circuit WHERE interface_id IN (SELECT id FROM i) AND deleted_at IS NULL) AS isis,
+            (SELECT COUNT(*) FROM circuit_interface WHERE interface_id IN (SELECT id FROM i)) AS circuit_links,
+            ic.cid_descriptions,
+            (SELECT COUNT(*) FROM ip_sla
+                WHERE site_id = (SELECT site_id FROM n)
+                AND time > NOW() - interval '24 hours') AS ip_sla
+        FROM (
+            SELECT
+                COUNT(*) AS interfaces,
+                COUNT(*) FILTER (WHERE description ILIKE '%%CID:%%') AS cid_descriptions
+            FROM i
+        ) ic
+    """
+    return query, node_params + (node,)
+
+
+def _availability(counts: Dict, node: str) -> Dict[str, int]:
+    """Fold an _availability_query row into the per-option counts."""
+    counts = dict(counts)
+    circuit_count = counts.pop('circuit_links')
+    cid_count = counts.pop('cid_descriptions')
+    print(f"[DEBUG] Circuit table count: {circuit_count} for node: {node}")
+    if circuit_count == 0:
+        circuit_count = cid_count
+        print(f"[DEBUG] CID description count: {circuit_count} for node: {node}")
+    counts['circuits'] = circuit_count
+    return counts
+
+
+def _interface_stats_query(node: str) -> Tuple[str, Tuple]:
+    """Interface count per oper state for a validated node."""
+    node_sql, node_params = _build_node_predicate(node, 'node')
+    query = f"""
+        SELECT 
+            interface.state AS "State",
+            COUNT(*) AS "Count"
+        FROM interface
+        JOIN node ON node.id = interface.node_id
+        WHERE {node_sql}
+        GROUP BY interface.state
+        ORDER BY "Count" DESC
+    """
+    return query, node_params
+
+
+# Panel queries shared by the per-panel methods and get_all_panels().
+# {node_sql} is filled in with _build_node_predicate() for the node.
+_INTERFACES_SQL = """
+    SELECT DISTINCT 
+        interface.name AS "Interface", 
+        COALESCE(interface.link_speed, 0) AS "Speed", 
+        interface.state AS "Oper_State",
+        COALESCE(interface.description, '') AS "Description"
+    FROM interface
+    JOIN node ON node.id = interface.node_id
+    WHERE {node_sql}
+"""
+
+_INVENTORY_SQL = """
+    SELECT 
+        ni.name AS "Component",
+        CASE WHEN length(ni.description) > 50
+            THEN left(ni.description, 50) || '...'
+            ELSE COALESCE(ni.description, '')
+        END AS "Description",
+        COALESCE(ni.serial_number, '') AS "Serial"
+    FROM node_inventory ni
+    JOIN node n ON n.id = ni.node_id
+    WHERE {node_sql}
+    ORDER BY ni.name
+"""
+
+_NEIGHBORS_SQL = """
+    SELECT DISTINCT
+        COALESCE(l2.local_interface_name, '') AS "Local_Port",
+        regexp_replace(
+            trim(split_part(COALESCE(l2.system_name, ''), '(', 1)),
+            '\\.(homeoffice\\.|mgt\\.)?wal-mart\\.com', '', 'g'
+        ) AS "Neighbor",
+        COALESCE(l2.remote_interface_name, '') AS "Remote_Port",
+        COALESCE(l2.management_address, '') AS "IP",
+        CASE WHEN l2.lldp THEN 'LLDP' WHEN l2.cdp THEN 'CDP' ELSE 'Other' END AS "Type"
+    FROM l2_neighbor l2
+    JOIN node n ON n.id = l2.node_id
+    WHERE {node_sql}
+    AND l2.deleted_at IS NULL
+    ORDER BY "Local_Port"
+"""
+
+# Circuit-table rows, or interfaces with a CID: in their description when
+# the circuit table has none for the device; the fallback is only scanned
+# when the first branch comes back empty.
+_CIRCUITS_SQL = """
+    WITH ct AS (
+        SELECT DISTINCT
+            i.name AS "Interface",
+            COALESCE(i.link_speed / 1000, 0) AS "Speed_Mbps",
+            i.state AS "State",
+            COALESCE(c.vendor_circuit_id, '') AS "Circuit_ID",
+            COALESCE(substring(i.description from 'VRF:\\s*(\\S+)'), '') AS "VRF",
+            COALESCE(i.description, '') AS "Description"
+        FROM interface i
+        JOIN circuit_interface ci ON ci.interface_id = i.id
+        JOIN circuit c ON c.id = ci.circuit_id
+        JOIN node n ON n.id = i.node_id
+        WHERE {node_sql}
+    ),
+    cid AS (
+        SELECT DISTINCT
+            i.name AS "Interface",
+            COALESCE(i.link_speed / 1000, 0) AS "Speed_Mbps",
+            i.state AS "State",
+            COALESCE(substring(upper(i.description) from 'CID:\\s*(\\S+)'), '') AS "Circuit_ID",
+            COALESCE(substring(i.description from 'VRF:\\s*(\\S+)'), '') AS "VRF",
+            COALESCE(i.description, '') AS "Description"
+        FROM interface i
+        JOIN node n ON n.id = i.node_id
+        WHERE {node_sql}
+        AND i.description ILIKE '%%CID:%%'
+    )
+    SELECT * FROM ct
+    UNION ALL
+    SELECT * FROM cid WHERE NOT EXISTS (SELECT 1 FROM ct)
+    ORDER BY "Interface"
+"""
+
+# get_all_panels(): panel name -> (cached method, query, node alias)
+_PANELS = {
+    'interfaces': ('get_interfaces', _INTERFACES_SQL + ' ORDER BY interface.name', 'node'),
+    'inventory': ('get_inventory', _INVENTORY_SQL, 'n'),
+    'neighbors': ('get_neighbors', _NEIGHBORS_SQL, 'n'),
+    'circuits': ('get_circuits', _CIRCUITS_SQL, 'n'),
+}
 
 
 class TitanQueries(TitanDatabase):
@@ -15,77 +235,173 @@ class TitanQueries(TitanDatabase):
         """Initialize with credentials."""
         super().__init__(username, password)
         self.current_device = None
+        self._availability_cache: Dict[str, Dict[str, int]] = {}
     
-    def get_node_info(self, node: str) -> List[Dict]:
-        """Query general node information."""
-        self.ensure_connected()
+    def cached_header_info(self, node: str, refresh: bool = False) -> Dict[str, str]:
+        """Device header info, reused across repaints for HEADER_TTL seconds."""
+        if refresh:
+            with self._lock:
+                self._cache.pop(('get_device_header_info', node), None)
+        return self.get_device_header_info(node)
+    
+    def cached_availability(self, node: str, refresh: bool = False) -> Dict[str, int]:
+        """Data availability counts, memoized per device for the session."""
+        key = node.lower()
+        if refresh or key not in self._availability_cache:
+            self._availability_cache[key] = self.check_data_availability(node)
+        return self._availability_cache[key]
+    
+    def _run(self, name: str, node: str, query: str, label: str,
+             alias: str = 'n') -> List[Dict]:
+        """
+        Run a node-scoped query and return its rows.
+        
+        query marks the node match with {node_sql} slots, filled in by
+        _build_node_predicate() for the validated node, and the query runs
+        as the prepared statement tm_<name>. A failed query is reported and
+        rolled back, and gives an empty list.
+        """
         node = self.validate_node(node)
+        node_sql, node_params = _build_node_predicate(node, alias)
+        node_params *= query.count('{node_sql}')
+        query = query.format(node_sql=node_sql)
         
+        try:
+            self.execute_prepared(f'tm_{name}', query, node_params)
+            return self.cur.fetchall()
+        except Exception as e:
+            print(f"[!] {label} query failed: {e}")
+            if self.conn:
+                self.conn.rollback()
+            return []
+    
+    @auto_reconnect
+    def open_device(self, node: str, refresh: bool = False) -> Tuple[Dict[str, str], Dict[str, int]]:
+        """
+        Menu header and data availability for a device in one round trip.
+        
+        The interface statistics come back in the same statement and warm
+        their cache, since they are a common first pick. Anything already
+        cached is served without touching the database; refresh first drops
+        everything cached for the device, live interface and SLA state included.
+        """
+        header_key = ('get_device_header_info', node)
+        stats_key = ('get_interface_stats', node)
+        if refresh:
+            self.invalidate_device(node)
+            self._availability_cache.pop(node.lower(), None)
+        
+        header = self._cache_get(header_key)
+        availability = self._availability_cache.get(node.lower())
+        if header is not _MISS and availability is not None:
+            return header, availability
+        
+        resolved = self.validate_node(node)
+        header_sql, header_params = _device_header_query(resolved)
+        avail_sql, avail_params = _availability_query(resolved)
+        stats_sql, stats_params = _interface_stats_query(resolved)
+        
+        query = f"""
+            SELECT
+                (SELECT row_to_json(h) FROM ({header_sql}) h) AS header,
+                (SELECT row_to_json(a) FROM ({avail_sql}) a) AS availability,
+                (SELECT json_agg(st ORDER BY st."Count" DESC) FROM ({stats_sql}) st) AS interface_stats
+        """
+        
+        try:
+            self.execute_prepared('tm_open_device', query, header_params + avail_params + stats_params)
+            row = self.cur.fetchone()
+        except Exception as e:
+            print(f"[!] Batched device lookup failed, querying separately: {e}")
+            if self.conn:
+                self.conn.rollback()
+            return self.cached_header_info(node), self.cached_availability(node)
+        
+        header = _device_header(row['header'], resolved)
+        availability = _availability(row['availability'], resolved)
+        self._cache_set(header_key, header, HEADER_TTL)
+        self._availability_cache[node.lower()] = availability
+        if row['interface_stats']:
+            self._cache_set(stats_key, row['interface_stats'])
+        
+        return header, availability
+    
+    @auto_reconnect
+    def get_all_panels(self, node: str) -> Dict[str, List[Dict]]:
+        """
+        Rows for every device panel, fetched in one round trip.
+        
+        Each panel query runs as a json_agg subquery of a single statement,
+        and the results seed the per-method caches so the menu options that
+        follow are answered locally. The one connection cannot run queries
+        in parallel, so batching is what removes the per-panel round trips.
+        """
+        resolved = self.validate_node(node)
+        columns = []
+        params = ()
+        for name, (_, sql, alias) in _PANELS.items():
+            node_sql, node_params = _build_node_predicate(resolved, alias)
+            columns.append(f"(SELECT json_agg(p) FROM ({sql.format(node_sql=node_sql)}) p) AS {name}")
+            params += node_params * sql.count('{node_sql}')
+        stats_sql, stats_params = _interface_stats_query(resolved)
+        columns.append(f"(SELECT json_agg(p) FROM ({stats_sql}) p) AS interface_stats")
+        params += stats_params
+        
+        methods = {name: method for name, (method, _, _) in _PANELS.items()}
+        methods['interface_stats'] = 'get_interface_stats'
+        
+        try:
+            self.execute_prepared('tm_all_panels', "SELECT " + ",\n".join(columns), params)
+            row = self.cur.fetchone()
+        except Exception as e:
+            print(f"[!] Batched panel lookup failed, querying separately: {e}")
+            if self.conn:
+                self.conn.rollback()
+            return {name: getattr(self, method)(node) for name, method in methods.items()}
+        
+        panels = {}
+        for name, method in methods.items():
+            panels[name] = row[name] or []
+            if panels[name]:
+                self._cache_set((method, node), panels[name])
+        return panels
+    
+    @cached_query
+    @auto_reconnect
+    def get_node_info(self, node: str) -> List[Dict]:
+        """Query general node information."""
         query = """
             SELECT 
-                n.name,
-                n.fqdn,
-                n.mgmt_ip,
-                n.serial,
-                n.model_name,
-                n.state,
-                o.os,
-                o.platform,
-                o.version,
-                s.name as site_name,
-                s.address,
-                s.city,
-                s.state as site_state,
-                s.country_code
+                COALESCE(NULLIF(n.name, ''), 'N/A') AS "Name",
+                COALESCE(NULLIF(rtrim(n.fqdn, '.'), ''), 'N/A') AS "FQDN",
+                COALESCE(NULLIF(concat(n.mgmt_ip), ''), 'N/A') AS "Management_IP",
+                COALESCE(NULLIF(n.serial, ''), 'N/A') AS "Serial",
+                COALESCE(NULLIF(n.model_name, ''), 'N/A') AS "Model",
+                COALESCE(NULLIF(n.state, ''), 'unknown') AS "Device_State",
+                COALESCE(NULLIF(o.os, ''), 'N/A') AS "OS",
+                COALESCE(NULLIF(o.version, ''), 'N/A') AS "OS_Version",
+                COALESCE(NULLIF(s.name, ''), 'N/A') AS "Site_ID",
+                COALESCE(NULLIF(s.address, ''), 'N/A') AS "Site_Address",
+                COALESCE(NULLIF(s.city, ''), 'N/A') AS "City",
+                COALESCE(NULLIF(s.state, ''), 'N/A') AS "State",
+                COALESCE(NULLIF(s.country_code, ''), 'N/A') AS "Country"
             FROM node n
             LEFT JOIN os o ON n.os_id = o.id
             LEFT JOIN site s ON n.site_id = s.id
-            WHERE n.fqdn ILIKE %s OR n.name ILIKE %s
+            WHERE {node_sql}
         """
         
-        self.cur.execute(query, (f'%{node}%', f'%{node}%'))
-        results = self.cur.fetchall()
-        
-        data = []
-        for row in results:
-
-            fqdn = row[1].rstrip('.') if row[1] else 'N/A'
-            
-            data.append({
-                'Name': row[0] or 'N/A',
-                'FQDN': fqdn,
-                'Management_IP': row[2] or 'N/A',
-                'Serial': row[3] or 'N/A',
-                'Model': row[4] or 'N/A',
-                'Device_State': row[5] or 'unknown',
-                'OS': row[6] or 'N/A',
-                'OS_Version': row[8] or 'N/A',
-                'Site_ID': row[9] or 'N/A',
-                'Site_Address': row[10] or 'N/A',
-                'City': row[11] or 'N/A',
-                'State': row[12] or 'N/A',
-                'Country': row[13] or 'N/A'
-            })
-        
-        return data
+        return self._run('node_info', node, query, "Node info")
     
+    @cached_query
+    @auto_reconnect
     def get_interfaces(self, node: str, state: Optional[str] = None) -> List[Dict]:
         """Query interface information."""
-        self.ensure_connected()
         node = self.validate_node(node)
+        node_sql, node_params = _build_node_predicate(node, 'node')
         
-        query = """
-            SELECT DISTINCT 
-                interface.name, 
-                interface.link_speed, 
-                interface.state,
-                interface.description
-            FROM interface
-            JOIN node ON node.id = interface.node_id
-            WHERE node.fqdn ILIKE %s
-        """
-        
-        params = [f'%{node}%']
+        query = _INTERFACES_SQL.format(node_sql=node_sql)
+        params = list(node_params)
         
         if state:
             query += " AND interface.state = %s"
@@ -94,629 +410,247 @@ class TitanQueries(TitanDatabase):
         query += " ORDER BY interface.name"
         
         self.cur.execute(query, params)
-        results = self.cur.fetchall()
-        
-        data = []
-        for row in results:
-            data.append({
-                'Interface': row[0],
-                'Speed': row[1] or 0,
-                'Oper_State': row[2],
-                'Description': row[3] or ''
-            })
-        
-        return data
+        return self.cur.fetchall()
     
+    @cached_query
+    @auto_reconnect
     def get_inventory(self, node: str) -> List[Dict]:
         """Query hardware inventory."""
-        self.ensure_connected()
-        node = self.validate_node(node)
-        
-        try:
-            query = """
-                SELECT 
-                    ni.name,
-                    ni.description,
-                    ni.serial_number
-                FROM node_inventory ni
-                JOIN node n ON n.id = ni.node_id
-                WHERE n.fqdn ILIKE %s OR n.name ILIKE %s
-                ORDER BY ni.name
-            """
-            
-            self.cur.execute(query, (f'%{node}%', f'%{node}%'))
-            results = self.cur.fetchall()
-            
-            data = []
-            for row in results:
-                desc = row[1] or ''
-                data.append({
-                    'Component': row[0],
-                    'Description': (desc[:50] + '...') if len(desc) > 50 else desc,
-                    'Serial': row[2] or ''
-                })
-            
-            return data
-        except Exception as e:
-            print(f"[!] Inventory query failed: {e}")
-            if self.conn:
-                self.conn.rollback()
-            return []
+        return self._run('inventory', node, _INVENTORY_SQL, "Inventory")
     
+    @cached_query
+    @auto_reconnect
     def get_neighbors(self, node: str) -> List[Dict]:
         """Query L2 neighbor information from l2_neighbor table."""
-        self.ensure_connected()
-        node = self.validate_node(node)
-        
-        try:
-            query = """
-                SELECT DISTINCT
-                    l2.local_interface_name,
-                    l2.system_name,
-                    l2.remote_interface_name,
-                    l2.management_address,
-                    CASE WHEN l2.lldp THEN 'LLDP' WHEN l2.cdp THEN 'CDP' ELSE 'Other' END as protocol
-                FROM l2_neighbor l2
-                JOIN node n ON n.id = l2.node_id
-                WHERE (n.fqdn ILIKE %s OR n.name ILIKE %s)
-                AND l2.deleted_at IS NULL
-                ORDER BY l2.local_interface_name
-            """
-            
-            self.cur.execute(query, (f'%{node}%', f'%{node}%'))
-            results = self.cur.fetchall()
-            
-            data = []
-            for row in results:
-
-                neighbor = row[1] or ''
-                if '(' in neighbor:
-                    neighbor = neighbor.split('(')[0].strip()
-                if '.wal-mart.com' in neighbor:
-                    neighbor = neighbor.replace('.wal-mart.com', '')
-                if '.homeoffice.wal-mart.com' in neighbor:
-                    neighbor = neighbor.replace('.homeoffice.wal-mart.com', '')
-                if '.mgt.wal-mart.com' in neighbor:
-                    neighbor = neighbor.replace('.mgt.wal-mart.com', '')
-                
-                data.append({
-                    'Local_Port': row[0] or '',
-                    'Neighbor': neighbor,
-                    'Remote_Port': row[2] or '',
-                    'IP': row[3] or '',
-                    'Type': row[4]
-                })
-            
-            return data
-        except Exception as e:
-            print(f"[!] L2 Neighbor query failed: {e}")
-            if self.conn:
-                self.conn.rollback()
-            return []
+        return self._run('neighbors', node, _NEIGHBORS_SQL, "L2 Neighbor")
     
+    @cached_query
+    @auto_reconnect
     def get_interface_stats(self, node: str) -> List[Dict]:
         """Get interface statistics summary."""
-        self.ensure_connected()
         node = self.validate_node(node)
         
-        query = """
-            SELECT 
-                interface.state,
-                COUNT(*) as count
-            FROM interface
-            JOIN node ON node.id = interface.node_id
-            WHERE node.fqdn ILIKE %s
-            GROUP BY interface.state
-            ORDER BY count DESC
-        """
-        
-        self.cur.execute(query, (f'%{node}%',))
-        results = self.cur.fetchall()
-        
-        data = []
-        for row in results:
-            data.append({
-                'State': row[0],
-                'Count': row[1]
-            })
-        
-        return data
+        query, params = _interface_stats_query(node)
+        self.execute_prepared('tm_interface_stats', query, params)
+        return self.cur.fetchall()
     
+    @cached_query
+    @auto_reconnect
     def get_circuits(self, node: str) -> List[Dict]:
-        """Query circuits using circuit and circuit_interface tables."""
-        self.ensure_connected()
-        node = self.validate_node(node)
-        
-        try:
-            query = """
-                SELECT DISTINCT
-                    i.name as interface_name,
-                    i.link_speed,
-                    i.state,
-                    c.vendor_circuit_id,
-                    c.speed as circuit_speed,
-                    i.description
-                FROM interface i
-                JOIN circuit_interface ci ON ci.interface_id = i.id
-                JOIN circuit c ON c.id = ci.circuit_id
-                JOIN node n ON n.id = i.node_id
-                WHERE (n.fqdn ILIKE %s OR n.name ILIKE %s)
-                ORDER BY i.name
-            """
-            
-            self.cur.execute(query, (f'%{node}%', f'%{node}%'))
-            results = self.cur.fetchall()
-            
-            print(f"[DEBUG] Circuit table query returned {len(results)} rows")
-            
-            if results:
-                data = []
-                for row in results:
-                    desc = row[5] or ''
-
-                    vrf = ''
-                    if 'VRF:' in desc:
-                        vrf_part = desc.split('VRF:')[1].split()[0] if 'VRF:' in desc else ''
-                        vrf = vrf_part
-                    
-
-                    speed_mbps = int(row[1] / 1000) if row[1] else 0
-                    
-                    data.append({
-                        'Interface': row[0],
-                        'Speed_Mbps': speed_mbps,
-                        'State': row[2],
-                        'Circuit_ID': row[3] or '',
-                        'VRF': vrf,
-                        'Description': desc
-                    })
-                return data
-            else:
-
-                print("[*] No circuits found in circuit table, searching interface descriptions...\n")
-                query2 = """
-                    SELECT DISTINCT 
-                        interface.name, 
-                        interface.short_name, 
-                        interface.link_speed, 
-                        interface.state, 
-                        interface.state_start,
-                        interface.description
-                    FROM interface
-                    JOIN node ON node.id = interface.node_id
-                    WHERE (node.fqdn ILIKE %s OR node.name ILIKE %s)
-                    AND interface.description ILIKE '%%CID:%%'
-                    ORDER BY interface.name
-                """
-                
-                self.cur.execute(query2, (f'%{node}%', f'%{node}%'))
-                results2 = self.cur.fetchall()
-                
-                print(f"[DEBUG] Description search returned {len(results2)} rows")
-                
-                data = []
-                for row in results2:
-                    description = row[5] or ""
-                    cid = ""
-                    vrf = ''
-                    
-                    if "CID:" in description.upper():
-                        parts = description.upper().split("CID:")
-                        if len(parts) > 1:
-                            cid = parts[1].strip().split()[0] if parts[1].strip() else ""
-                    
-                    if 'VRF:' in description:
-                        vrf_part = description.split('VRF:')[1].split()[0] if 'VRF:' in description else ''
-                        vrf = vrf_part
-                    
-
-                    speed_mbps = int(row[2] / 1000) if row[2] else 0
-                    
-                    data.append({
-                        'Interface': row[0],
-                        'Speed_Mbps': speed_mbps,
-                        'State': row[3],
-                        'Circuit_ID': cid,
-                        'VRF': vrf,
-                        'Description': description
-                    })
-                
-                return data
-                
-        except Exception as e:
-            print(f"[!] Circuit query failed: {e}")
-            if self.conn:
-                self.conn.rollback()
-            return []
+        """Query circuits from the circuit tables, falling back to CID: descriptions."""
+        results = self._run('circuits', node, _CIRCUITS_SQL, "Circuit")
+        print(f"[DEBUG] Circuit query returned {len(results)} rows")
+        return results
     
+    @cached_query
+    @auto_reconnect
     def get_bgp_info(self, node: str) -> List[Dict]:
         """Query BGP information from bgp_stats table."""
-        self.ensure_connected()
-        node = self.validate_node(node)
+        query = """
+            SELECT 
+                COALESCE(bs.ip, '') AS "Peer_IP",
+                COALESCE(bs.as_num, 0) AS "AS_Number",
+                COALESCE(bs.state, '') AS "State",
+                COALESCE(bs.accepted_pfx, 0) AS "Accepted_Prefixes",
+                COALESCE(bs.advertised_pfx, 0) AS "Advertised_Prefixes",
+                COALESCE(bs.denied_pfx, 0) AS "Denied_Prefixes",
+                COALESCE(to_char(bs.time, 'YYYY-MM-DD HH24:MI:SS'), '') AS "Timestamp"
+            FROM bgp_stats bs
+            JOIN node n ON n.id = bs.node_id
+            WHERE {node_sql}
+            ORDER BY bs.ip
+        """
         
-        try:
-            query = """
-                SELECT 
-                    bs.ip,
-                    bs.as_num,
-                    bs.state,
-                    bs.accepted_pfx,
-                    bs.advertised_pfx,
-                    bs.denied_pfx,
-                    bs.time
-                FROM bgp_stats bs
-                JOIN node n ON n.id = bs.node_id
-                WHERE (n.fqdn ILIKE %s OR n.name ILIKE %s)
-                ORDER BY bs.ip
-            """
-            
-            self.cur.execute(query, (f'%{node}%', f'%{node}%'))
-            results = self.cur.fetchall()
-            
-            data = []
-            for row in results:
-                data.append({
-                    'Peer_IP': row[0] or '',
-                    'AS_Number': row[1] or 0,
-                    'State': row[2] or '',
-                    'Accepted_Prefixes': row[3] or 0,
-                    'Advertised_Prefixes': row[4] or 0,
-                    'Denied_Prefixes': row[5] or 0,
-                    'Timestamp': row[6].strftime("%Y-%m-%d %H:%M:%S") if row[6] else ''
-                })
-            
-            return data
-        except Exception as e:
-            print(f"[!] BGP query failed: {e}")
-            if self.conn:
-                self.conn.rollback()
-            return []
+        return self._run('bgp_info', node, query, "BGP")
     
+    @cached_query
+    @auto_reconnect
     def get_ospf_neighbors(self, node: str) -> List[Dict]:
         """Query OSPF neighbor information."""
-        self.ensure_connected()
-        node = self.validate_node(node)
+        query = """
+            SELECT 
+                concat(ospf.router_id) AS "Router_ID",
+                concat(ospf.ip) AS "IP_Address",
+                COALESCE(ospf.state, '') AS "State",
+                COALESCE(ospf.priority, 0) AS "Priority",
+                COALESCE(to_char(ospf.state_start, 'YYYY-MM-DD HH24:MI:SS'), '') AS "State_Start"
+            FROM ospf_neighbor ospf
+            JOIN ospf_area_interface oai ON oai.id = ospf.ospf_area_interface_id
+            JOIN interface i ON i.id = oai.interface_id
+            JOIN node n ON n.id = i.node_id
+            WHERE {node_sql}
+            AND ospf.deleted_at IS NULL
+            ORDER BY ospf.ip
+        """
         
-        try:
-            query = """
-                SELECT 
-                    ospf.router_id,
-                    ospf.ip,
-                    ospf.state,
-                    ospf.priority,
-                    ospf.state_start
-                FROM ospf_neighbor ospf
-                JOIN ospf_area_interface oai ON oai.id = ospf.ospf_area_interface_id
-                JOIN interface i ON i.id = oai.interface_id
-                JOIN node n ON n.id = i.node_id
-                WHERE (n.fqdn ILIKE %s OR n.name ILIKE %s)
-                AND ospf.deleted_at IS NULL
-                ORDER BY ospf.ip
-            """
-            
-            self.cur.execute(query, (f'%{node}%', f'%{node}%'))
-            results = self.cur.fetchall()
-            
-            data = []
-            for row in results:
-                data.append({
-                    'Router_ID': str(row[0]) if row[0] else '',
-                    'IP_Address': str(row[1]) if row[1] else '',
-                    'State': row[2] or '',
-                    'Priority': row[3] or 0,
-                    'State_Start': row[4].strftime("%Y-%m-%d %H:%M:%S") if row[4] else ''
-                })
-            
-            return data
-        except Exception as e:
-            print(f"[!] OSPF query failed: {e}")
-            if self.conn:
-                self.conn.rollback()
-            return []
+        return self._run('ospf_neighbors', node, query, "OSPF")
     
+    @cached_query
+    @auto_reconnect
     def get_isis_circuits(self, node: str) -> List[Dict]:
         """Query IS-IS circuit information."""
-        self.ensure_connected()
-        node = self.validate_node(node)
+        query = """
+            SELECT 
+                COALESCE(i.name, '') AS "Interface",
+                COALESCE(isis.state, '') AS "State",
+                COALESCE(isis.type, '') AS "Type",
+                COALESCE(isis.level_type, '') AS "Level",
+                CASE WHEN isis.is_passive THEN 'Yes' ELSE 'No' END AS "Passive",
+                COALESCE(to_char(isis.state_start, 'YYYY-MM-DD HH24:MI:SS'), '') AS "State_Start"
+            FROM isis_circuit isis
+            JOIN interface i ON i.id = isis.interface_id
+            JOIN node n ON n.id = i.node_id
+            WHERE {node_sql}
+            AND isis.deleted_at IS NULL
+            ORDER BY i.name
+        """
         
-        try:
-            query = """
-                SELECT 
-                    i.name as interface_name,
-                    isis.state,
-                    isis.type,
-                    isis.level_type,
-                    isis.is_passive,
-                    isis.state_start
-                FROM isis_circuit isis
-                JOIN interface i ON i.id = isis.interface_id
-                JOIN node n ON n.id = i.node_id
-                WHERE (n.fqdn ILIKE %s OR n.name ILIKE %s)
-                AND isis.deleted_at IS NULL
-                ORDER BY i.name
-            """
-            
-            self.cur.execute(query, (f'%{node}%', f'%{node}%'))
-            results = self.cur.fetchall()
-            
-            data = []
-            for row in results:
-                data.append({
-                    'Interface': row[0] or '',
-                    'State': row[1] or '',
-                    'Type': row[2] or '',
-                    'Level': row[3] or '',
-                    'Passive': 'Yes' if row[4] else 'No',
-                    'State_Start': row[5].strftime("%Y-%m-%d %H:%M:%S") if row[5] else ''
-                })
-            
-            return data
-        except Exception as e:
-            print(f"[!] IS-IS query failed: {e}")
-            if self.conn:
-                self.conn.rollback()
-            return []
+        return self._run('isis_circuits', node, query, "IS-IS")
     
+    @cached_query
+    @auto_reconnect
     def get_ip_sla(self, node: str, hours_back: int = 24) -> List[Dict]:
         """Query IP SLA data (latency/performance metrics).
         
         Note: IP SLA is site-based, so this returns SLA data for the device's site.
         """
-        self.ensure_connected()
         node = self.validate_node(node)
+        node_sql, node_params = _build_node_predicate(node)
         
         try:
 
-            site_query = """
-                SELECT DISTINCT n.site_id, s.name as site_name
+            site_query = f"""
+                SELECT DISTINCT n.site_id
                 FROM node n
-                LEFT JOIN site s ON s.id = n.site_id
-                WHERE (n.fqdn ILIKE %s OR n.name ILIKE %s)
+                WHERE {node_sql}
                 LIMIT 1
             """
             
-            self.cur.execute(site_query, (f'%{node}%', f'%{node}%'))
+            self.execute_prepared('tm_node_site', site_query, node_params)
             site_result = self.cur.fetchone()
             
-            if not site_result or not site_result[0]:
+            if not site_result or not site_result['site_id']:
                 print(f"[!] No site found for device {node}")
                 return []
             
-            site_id = site_result[0]
-            site_name = site_result[1] or 'Unknown'
-            
 
             query = """
                 SELECT 
-                    sla.name,
-                    sla.destination,
-                    sla.rtt_total,
-                    sla.rtt_dns,
-                    sla.rtt_tcp,
-                    sla.rtt_status,
-                    sla.admin_status,
-                    sla.time
+                    COALESCE(sla.name, '') AS "SLA_Name",
+                    concat(sla.destination) AS "Destination",
+                    COALESCE(NULLIF(sla.rtt_total, 0) || 'ms', 'N/A') AS "RTT_Total",
+                    COALESCE(NULLIF(sla.rtt_dns, 0) || 'ms', 'N/A') AS "RTT_DNS",
+                    COALESCE(NULLIF(sla.rtt_tcp, 0) || 'ms', 'N/A') AS "RTT_TCP",
+                    COALESCE(sla.rtt_status, '') AS "Status",
+                    COALESCE(sla.admin_status, '') AS "Admin_Status",
+                    COALESCE(to_char(sla.time, 'YYYY-MM-DD HH24:MI:SS'), '') AS "Timestamp",
+                    COALESCE(NULLIF(s.name, ''), 'Unknown') AS "Site"
                 FROM ip_sla sla
+                LEFT JOIN site s ON s.id = sla.site_id
                 WHERE sla.site_id = %s
-                AND sla.time > NOW() - interval '%s hours'
+                AND sla.time > NOW() - make_interval(hours => %s)
                 ORDER BY sla.time DESC
                 LIMIT 100
             """
             
-            self.cur.execute(query, (site_id, hours_back))
-            results = self.cur.fetchall()
-            
-            data = []
-            for row in results:
-                data.append({
-                    'SLA_Name': row[0] or '',
-                    'Destination': str(row[1]) if row[1] else '',
-                    'RTT_Total': f"{row[2]}ms" if row[2] else 'N/A',
-                    'RTT_DNS': f"{row[3]}ms" if row[3] else 'N/A',
-                    'RTT_TCP': f"{row[4]}ms" if row[4] else 'N/A',
-                    'Status': row[5] or '',
-                    'Admin_Status': row[6] or '',
-                    'Timestamp': row[7].strftime("%Y-%m-%d %H:%M:%S") if row[7] else '',
-                    'Site': site_name
-                })
-            
-            return data
+            self.execute_prepared('tm_ip_sla', query, (site_result['site_id'], hours_back))
+            return self.cur.fetchall()
         except Exception as e:
             print(f"[!] IP SLA query failed: {e}")
             if self.conn:
                 self.conn.rollback()
             return []
     
+    @cached_query
+    @auto_reconnect
     def get_interface_metrics(self, node: str) -> List[Dict]:
         """Query interface performance metrics."""
-        self.ensure_connected()
-        node = self.validate_node(node)
+        query = """
+            SELECT 
+                i.name AS "Interface",
+                COALESCE(to_char(NULLIF(im.tx_bytes, 0), 'FM999,999,999,999,999,999,999'), '0') AS "TX_Bytes",
+                COALESCE(to_char(NULLIF(im.rx_bytes, 0), 'FM999,999,999,999,999,999,999'), '0') AS "RX_Bytes",
+                COALESCE(im.tx_errors, 0) AS "TX_Errors",
+                COALESCE(im.rx_errors, 0) AS "RX_Errors",
+                COALESCE(im.tx_drops, 0) AS "TX_Drops",
+                COALESCE(im.rx_drops, 0) AS "RX_Drops",
+                COALESCE(im.speed, 0) AS "Speed",
+                COALESCE(to_char(im.time, 'YYYY-MM-DD HH24:MI:SS'), '') AS "Timestamp"
+            FROM interface_metrics im
+            JOIN interface i ON i.id = im.interface_id
+            JOIN node n ON n.id = i.node_id
+            WHERE {node_sql}
+            AND i.state = 'up'
+            ORDER BY im.rx_bytes DESC
+            LIMIT 50
+        """
         
-        try:
-            query = """
-                SELECT 
-                    i.name as interface_name,
-                    im.tx_bytes,
-                    im.rx_bytes,
-                    im.tx_errors,
-                    im.rx_errors,
-                    im.tx_drops,
-                    im.rx_drops,
-                    im.speed,
-                    im.time
-                FROM interface_metrics im
-                JOIN interface i ON i.id = im.interface_id
-                JOIN node n ON n.id = i.node_id
-                WHERE (n.fqdn ILIKE %s OR n.name ILIKE %s)
-                AND i.state = 'up'
-                ORDER BY im.rx_bytes DESC
-                LIMIT 50
-            """
-            
-            self.cur.execute(query, (f'%{node}%', f'%{node}%'))
-            results = self.cur.fetchall()
-            
-            data = []
-            for row in results:
-                data.append({
-                    'Interface': row[0],
-                    'TX_Bytes': f"{row[1]:,}" if row[1] else '0',
-                    'RX_Bytes': f"{row[2]:,}" if row[2] else '0',
-                    'TX_Errors': row[3] or 0,
-                    'RX_Errors': row[4] or 0,
-                    'TX_Drops': row[5] or 0,
-                    'RX_Drops': row[6] or 0,
-                    'Speed': row[7] or 0,
-                    'Timestamp': row[8].strftime("%Y-%m-%d %H:%M:%S") if row[8] else ''
-                })
-            
-            return data
-        except Exception as e:
-            print(f"[!] Interface metrics query failed: {e}")
-            if self.conn:
-                self.conn.rollback()
-            return []
+        return self._run('interface_metrics', node, query, "Interface metrics")
     
+    @cached_query(ttl=HEADER_TTL)
+    @auto_reconnect
     def get_device_header_info(self, node: str) -> Dict[str, str]:
         """Get basic device info for menu header display."""
-        self.ensure_connected()
         node = self.validate_node(node)
         
         try:
-            clean_node = node.replace('.wal-mart.com', '').replace('.homeoffice.wal-mart.com', '').replace('.mgt.wal-mart.com', '').rstrip('.')
-            
-            query = """
-                SELECT 
-                    n.name,
-                    n.mgmt_ip,
-                    n.state
-                FROM node n
-                WHERE n.fqdn ILIKE %s OR n.name ILIKE %s OR n.fqdn ILIKE %s
-                ORDER BY 
-                    CASE 
-                        WHEN n.name = %s THEN 1
-                        WHEN n.fqdn ILIKE %s THEN 2
-                        ELSE 3
-                    END
-                LIMIT 1
-            """
-            
-
-            self.cur.execute(query, (
-                f'{clean_node}.wal-mart.com%',
-                clean_node,
-                f'%{clean_node}%',
-                clean_node,
-                f'{clean_node}.wal-mart.com%'
-            ))
-            result = self.cur.fetchone()
-            
-            if result:
-
-                state = result[2] or 'unknown'
-                if state.lower() == 'online':
-                    state_display = '🟢 Online'
-                elif state.lower() == 'offline':
-                    state_display = '🔴 Offline'
-                elif state.lower() == 'decommissioned':
-                    state_display = '⚫ Decommissioned'
-                else:
-                    state_display = f'⚪ {state.title()}'
-                
-                return {
-                    'name': result[0] or 'Unknown',
-                    'mgmt_ip': result[1] or 'N/A',
-                    'state': state_display
-                }
-            else:
-                return {'name': node, 'mgmt_ip': 'N/A', 'state': '⚪ Unknown'}
+            query, params = _device_header_query(node)
+            self.execute_prepared('tm_device_header', query, params)
+            return _device_header(self.cur.fetchone(), node)
         except Exception as e:
             print(f"[!] Failed to get device info: {e}")
             if self.conn:
                 self.conn.rollback()
             return {'name': node, 'mgmt_ip': 'N/A', 'state': '⚪ Unknown'}
     
+    @auto_reconnect
     def check_data_availability(self, node: str) -> Dict[str, int]:
         """Check what data is available for a device."""
-        self.ensure_connected()
         node = self.validate_node(node)
         
-        availability = {}
-        
-        checks = [
-            ('interfaces', 'SELECT COUNT(*) FROM interface i JOIN node n ON n.id = i.node_id WHERE (n.fqdn ILIKE %s OR n.name ILIKE %s)'),
-            ('inventory', 'SELECT COUNT(*) FROM node_inventory ni JOIN node n ON n.id = ni.node_id WHERE (n.fqdn ILIKE %s OR n.name ILIKE %s)'),
-            ('interface_metrics', 'SELECT COUNT(*) FROM interface_metrics im JOIN interface i ON i.id = im.interface_id JOIN node n ON n.id = i.node_id WHERE (n.fqdn ILIKE %s OR n.name ILIKE %s)'),
-            ('l2_neighbors', 'SELECT COUNT(*) FROM l2_neighbor l2 JOIN node n ON n.id = l2.node_id WHERE (n.fqdn ILIKE %s OR n.name ILIKE %s) AND l2.deleted_at IS NULL'),
-            ('ospf', 'SELECT COUNT(*) FROM ospf_neighbor o JOIN ospf_area_interface oai ON oai.id = o.ospf_area_interface_id JOIN interface i ON i.id = oai.interface_id JOIN node n ON n.id = i.node_id WHERE (n.fqdn ILIKE %s OR n.name ILIKE %s) AND o.deleted_at IS NULL'),
-            ('isis', 'SELECT COUNT(*) FROM isis_circuit isis JOIN interface i ON i.id = isis.interface_id JOIN node n ON n.id = i.node_id WHERE (n.fqdn ILIKE %s OR n.name ILIKE %s) AND isis.deleted_at IS NULL'),
-        ]
-        
-        for key, query in checks:
-            try:
-                self.cur.execute(query, (f'%{node}%', f'%{node}%'))
-                count = self.cur.fetchone()[0]
-                availability[key] = count
-            except Exception as e:
-                availability[key] = 0
-                if self.conn:
-                    self.conn.rollback()
+        query, params = _availability_query(node)
         
         try:
-            circuit_query = 'SELECT COUNT(*) FROM circuit_interface ci JOIN interface i ON i.id = ci.interface_id JOIN node n ON n.id = i.node_id WHERE (n.fqdn ILIKE %s OR n.name ILIKE %s)'
-            self.cur.execute(circuit_query, (f'%{node}%', f'%{node}%'))
-            circuit_count = self.cur.fetchone()[0]
-            print(f"[DEBUG] Circuit table count: {circuit_count} for node: {node}")
-            
-            if circuit_count == 0:
-                cid_query = "SELECT COUNT(*) FROM interface i JOIN node n ON n.id = i.node_id WHERE (n.fqdn ILIKE %s OR n.name ILIKE %s) AND i.description ILIKE '%%CID:%%'"
-                self.cur.execute(cid_query, (f'%{node}%', f'%{node}%'))
-                circuit_count = self.cur.fetchone()[0]
-                print(f"[DEBUG] CID description count: {circuit_count} for node: {node}")
-            
-            availability['circuits'] = circuit_count
+            self.execute_prepared('tm_availability', query, params)
+            counts = self.cur.fetchone()
         except Exception as e:
-            print(f"[ERROR] Circuit availability check failed: {e}")
-            availability['circuits'] = 0
+            print(f"[ERROR] Availability check failed: {e}")
             if self.conn:
                 self.conn.rollback()
+            return {key: 0 for key in (
+                'interfaces', 'inventory', 'interface_metrics', 'l2_neighbors',
+                'ospf', 'isis', 'circuits', 'ip_sla'
+            )}
         
-        try:
-            site_query = "SELECT site_id FROM node WHERE (fqdn ILIKE %s OR name ILIKE %s) LIMIT 1"
-            self.cur.execute(site_query, (f'%{node}%', f'%{node}%'))
-            site_result = self.cur.fetchone()
-            
-            if site_result and site_result[0]:
-                sla_query = "SELECT COUNT(*) FROM ip_sla WHERE site_id = %s AND time > NOW() - interval '24 hours'"
-                self.cur.execute(sla_query, (site_result[0],))
-                availability['ip_sla'] = self.cur.fetchone()[0]
-            else:
-                availability['ip_sla'] = 0
-        except Exception as e:
-            availability['ip_sla'] = 0
-            if self.conn:
-                self.conn.rollback()
-        
-        return availability
+        return _availability(counts, node)
     
+    @cached_query
+    @auto_reconnect
     def search_devices(self, search_term: str, limit: int = 20) -> List[Dict]:
         """Search for devices by name pattern. Includes all devices including -old versions."""
-        self.ensure_connected()
         
-        clean_term = search_term.replace('.wal-mart.com', '').replace('.homeoffice.wal-mart.com', '').rstrip('.')
+        clean_term = _FQDN_STRIP.sub('', search_term).rstrip('.')
         
-        query = """
+        # Unanchored so infix hits are kept; the ORDER BY still ranks exact
+        # and prefix matches first, and the trigram indexes serve '%term%'
+        node_sql, node_params = _build_node_predicate(f'%{clean_term}%')
+        
+        query = f"""
             SELECT 
-                n.fqdn,
-                n.name,
-                n.mgmt_ip,
-                n.state,
-                s.name as site_name,
-                s.city,
-                s.state as site_state
+                COALESCE(NULLIF(rtrim(n.fqdn, '.'), ''), NULLIF(n.name, ''), 'N/A') AS "Device_FQDN",
+                COALESCE(NULLIF(concat(n.mgmt_ip), ''), 'N/A') AS "Mgmt_IP",
+                CASE lower(COALESCE(NULLIF(n.state, ''), 'unknown'))
+                    WHEN 'online' THEN '🟢 Online'
+                    WHEN 'offline' THEN '🔴 Offline'
+                    WHEN 'decommissioned' THEN '⚫ Decomm'
+                    ELSE '⚪ ' || initcap(COALESCE(NULLIF(n.state, ''), 'unknown'))
+                END AS "Status",
+                COALESCE(NULLIF(s.name, ''), 'N/A') AS "Site",
+                COALESCE(NULLIF(s.city, ''), 'N/A') AS "City",
+                COALESCE(NULLIF(s.state, ''), 'N/A') AS "State"
             FROM node n
             LEFT JOIN site s ON n.site_id = s.id
-            WHERE (n.name ILIKE %s OR n.fqdn ILIKE %s)
+            WHERE {node_sql}
             ORDER BY 
                 CASE 
                     WHEN n.name = %s THEN 1
@@ -734,8 +668,7 @@ class TitanQueries(TitanDatabase):
                 n.name
             LIMIT %s
         """
-        params = (
-            f'%{clean_term}%', f'%{clean_term}%',
+        params = node_params + (
             clean_term,
             f'{clean_term}.wal-mart.com.',
             f'{clean_term}.wal-mart.com',
@@ -744,34 +677,5 @@ class TitanQueries(TitanDatabase):
             limit
         )
         
-        self.cur.execute(query, params)
-        results = self.cur.fetchall()
-        
-        data = []
-        for row in results:
-
-            state = row[3] or 'unknown'
-            if state.lower() == 'online':
-                state_display = '🟢 Online'
-            elif state.lower() == 'offline':
-                state_display = '🔴 Offline'
-            elif state.lower() == 'decommissioned':
-                state_display = '⚫ Decomm'
-            else:
-                state_display = f'⚪ {state.title()}'
-            
-
-            fqdn = row[0].rstrip('.') if row[0] else None
-            name = row[1] or 'N/A'
-            device_identifier = fqdn if fqdn else name
-            
-            data.append({
-                'Device_FQDN': device_identifier,
-                'Mgmt_IP': row[2] if row[2] else 'N/A',
-                'Status': state_display,
-                'Site': row[4] if row[4] else 'N/A',
-                'City': row[5] if row[5] else 'N/A',
-                'State': row[6] if row[6] else 'N/A'
-            })
-        
-        return data
+        self.execute_prepared('tm_search_devices', query, params)
+        return self.cur.fetchall()
@@ -4,6 +4,9 @@ SSH Configuration for Titan Remote Command Execution
 Stores default credentials, jump host info, and OS-specific commands.
 """
 
+from types import MappingProxyType
+from typing import Mapping, Tuple
+
 JUMP_HOST = "Oser500521.homeoffice.wal-mart.com"
 JUMP_HOST_FALLBACK = "Oser500522.homeoffice.wal-mart.com"
 JUMP_HOST_PORT = 22
@@ -12,7 +15,7 @@ TACASC_PASSCODE_FORMAT = "PCI_TOKEN(8) + RSA_PIN(6) = 14 chars total"
 TACACS_PORT = 49
 TACACS_TIMEOUT = 10
 
-DEFAULT_USERNAMES = [
+DEFAULT_USERNAMES = (
     "vn59iz6",
     "neteng",
     "admin",
@@ -24,10 +27,10 @@ DEFAULT_USERNAMES = [
     "nettitansvc",
     "gec_netengmonitor",
     "svc_netengmonitor",
-]
+)
 
-DEVICE_SPECIFIC_USERNAMES = {
-    "cisco_ios": [
+DEVICE_SPECIFIC_USERNAMES = MappingProxyType({
+    "cisco_ios": (
         "vn59iz6",
         "admin",
         "netadmin",
@@ -36,30 +39,30 @@ DEVICE_SPECIFIC_USERNAMES = {
         "network",
         "automation",
         "neteng",
-    ],
-    "arista_eos": [
+    ),
+    "arista_eos": (
         "admin",
         "automation",
         "netadmin",
         "operator",
         "neteng",
-    ],
-    "juniper_junos": [
+    ),
+    "juniper_junos": (
         "root",
         "admin",
         "netops",
         "automation",
         "neteng",
-    ],
-    "sonic_cli": [
+    ),
+    "sonic_cli": (
         "admin",
         "netadmin",
         "automation",
         "neteng",
-    ],
-}
+    ),
+})
 
-CISCO_IOS_USERNAMES = [
+CISCO_IOS_USERNAMES = (
     "admin",
     "root",
     "netadmin",
@@ -73,9 +76,9 @@ CISCO_IOS_USERNAMES = [
     "neteng",
     "netman",
     "bootstrap",
-]
+)
 
-TACACUS_USERNAMES = [
+TACACUS_USERNAMES = (
     "neteng",
     "network",
     "operations",
@@ -85,49 +88,81 @@ TACACUS_USERNAMES = [
     "automation",
     "netengineer",
     "sysadmin",
-]
+)
 
 SSH_TIMEOUT = 30
 SSH_CONNECT_TIMEOUT = 10
 COMMAND_TIMEOUT = 15
+SSH_KEEPALIVE_INTERVAL = 30
+RECV_CHUNK_SIZE = 65536
+JUMP_POOL_IDLE_TIMEOUT = 2 * 60 * 60
+USERNAME_PROBE_BATCH = 4
+USERNAME_CACHE_TTL = 24 * 60 * 60
 
-OS_TYPES = {
+OS_TYPES = MappingProxyType({
     "IOS": "cisco_ios",
     "EOS": "arista_eos",
     "JUNOS": "juniper_junos",
     "SONIC": "sonic_cli",
-}
+})
+
+OS_TYPE_ALIASES = MappingProxyType({
+    **OS_TYPES,
+    "IOS-XE": "cisco_ios",
+    "CISCO_IOS": "cisco_ios",
+    "ARISTA_EOS": "arista_eos",
+    "JUNIPER_JUNOS": "juniper_junos",
+    "SONIC_CLI": "sonic_cli",
+})
 
-SHOW_COMMANDS = {
-    "cisco_ios": {
+BATCHED_OS_TYPES = ("sonic_cli",)
+COMMAND_DELIMITER = "===TMENU_DELIM==="
+
+SHOW_COMMANDS = MappingProxyType({
+    "cisco_ios": MappingProxyType({
         "version": "show version",
         "bgp_summary": "show ip bgp summary",
         "interfaces": "show interfaces brief",
         "routes": "show ip route",
         "neighbors": "show cdp neighbors brief",
-    },
-    "arista_eos": {
+    }),
+    "arista_eos": MappingProxyType({
         "version": "show version",
         "bgp_summary": "show ip bgp summary",
         "interfaces": "show interfaces brief",
         "routes": "show ip route",
         "neighbors": "show lldp neighbors",
-    },
-    "juniper_junos": {
+    }),
+    "juniper_junos": MappingProxyType({
         "version": "show version",
         "bgp_summary": "show bgp summary",
         "interfaces": "show interfaces brief",
         "routes": "show route",
         "neighbors": "show lldp neighbors",
-    },
-    "sonic_cli": {
+    }),
+    "sonic_cli": MappingProxyType({
         "version": "show version",
         "bgp_summary": "show ip bgp summary",
         "interfaces": "show interfaces brief",
         "routes": "show ip route",
         "neighbors": "show lldp neighbors",
-    },
-}
+    }),
+})
+
+
+def _merge_usernames(*groups: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Concatenate username groups, keeping the first occurrence of each."""
+    return tuple(dict.fromkeys(u for group in groups for u in group))
+
+
+USERNAMES_BY_OS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    os_key: _merge_usernames(
+        DEVICE_SPECIFIC_USERNAMES.get(os_key, ()),
+        DEFAULT_USERNAMES,
+        CISCO_IOS_USERNAMES if "cisco" in os_key else (),
+    )
+    for os_key in (*DEVICE_SPECIFIC_USERNAMES, *OS_TYPES.values())
+})
 
 CONNECTING_MSG = "[*] Connecting to jump host..."
 CONNECTED_MSG = "[+] Connected to jump host!"
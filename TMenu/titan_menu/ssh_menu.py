@@ -7,11 +7,14 @@ Handles user selection for:
   - Custom command input
 """
 
-from typing import Optional, Tuple
+import sys
+from typing import TYPE_CHECKING, Optional, Tuple
 from .bastion_manager import BastionManager
 from .bastion_config import BASTION_HOSTS
 from .ssh_config import SHOW_COMMANDS
-from .ssh_remote import DeviceCommandRunner
+
+if TYPE_CHECKING:
+    from .ssh_remote import DeviceCommandRunner
 
 
 def display_bastion_menu() -> str:
@@ -22,37 +25,38 @@ def display_bastion_menu() -> str:
         Selected bastion ID
     """
     manager = BastionManager()
-    bastions = manager.list_available_bastions()
-    
-    print("\n" + "="*70)
-    print("[Bastion Host Selection]")
-    print("="*70)
-    
-    for i, bastion in enumerate(bastions, 1):
-        print(f"\n{i}. {bastion['name']}")
-        print(f"   Type: {bastion['type']}")
-        print(f"   Region: {bastion['region']}")
-        print(f"   {bastion['description']}")
-    
-    print(f"\n{len(bastions) + 1}. Exit")
-    print("\n" + "="*70)
+    table = manager.get_bastion_table()
+    count = len(table.ids)
+    
+    parts = ["\n" + "="*70, "[Bastion Host Selection]", "="*70]
+    parts += [
+        f"\n{i}. {name}\n"
+        f"   Type: {bastion_type}\n"
+        f"   Region: {region}\n"
+        f"   {description}"
+        for i, (name, bastion_type, region, description) in enumerate(
+            zip(table.names, table.types, table.regions, table.descriptions), 1
+        )
+    ]
+    parts += [f"\n{count + 1}. Exit", "\n" + "="*70]
+    sys.stdout.write("\n".join(parts) + "\n")
     
     while True:
         try:
-            choice = int(input(f"\nSelect bastion (1-{len(bastions)}): ").strip())
-            if 1 <= choice <= len(bastions):
-                return bastions[choice - 1]["id"]
-            elif choice == len(bastions) + 1:
+            choice = int(input(f"\nSelect bastion (1-{count}): ").strip())
+            if 1 <= choice <= count:
+                return table.ids[choice - 1]
+            elif choice == count + 1:
                 return None
             else:
-                print(f"Invalid choice. Enter 1-{len(bastions)}")
+                print(f"Invalid choice. Enter 1-{count}")
         except ValueError:
             print("Invalid input. Enter a number.")
         except KeyboardInterrupt:
             return None
 
 
-def display_command_menu(device_runner: DeviceCommandRunner) -> Optional[str]:
+def display_command_menu(device_runner: "DeviceCommandRunner") -> Optional[str]:
     """
     Display command selection menu for device OS.
     
@@ -65,16 +69,14 @@ def display_command_menu(device_runner: DeviceCommandRunner) -> Optional[str]:
     commands = device_runner.get_available_commands()
     command_list = list(commands.items())
     
-    print("\n" + "="*70)
-    print(f"[Available Commands - {device_runner.device_os.upper()}]")
-    print("="*70)
-    
-    for i, (alias, cmd) in enumerate(command_list, 1):
-        print(f"{i}. {alias:<20} -> {cmd}")
-    
-    print(f"{len(command_list) + 1}. Custom command")
-    print(f"{len(command_list) + 2}. Back")
-    print("\n" + "="*70)
+    parts = ["\n" + "="*70, f"[Available Commands - {device_runner.device_os.upper()}]", "="*70]
+    parts += [f"{i}. {alias:<20} -> {cmd}" for i, (alias, cmd) in enumerate(command_list, 1)]
+    parts += [
+        f"{len(command_list) + 1}. Custom command",
+        f"{len(command_list) + 2}. Back",
+        "\n" + "="*70,
+    ]
+    sys.stdout.write("\n".join(parts) + "\n")
     
     while True:
         try:
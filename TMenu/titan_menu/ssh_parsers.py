@@ -5,9 +5,46 @@ Parsers for Cisco IOS, Arista EOS, Juniper JUNOS, and Sonic CLI output.
 """
 
 import re
+from bisect import bisect_right
 from typing import Dict, List, Optional
 
 
+_CISCO_MODEL_RE = re.compile(r"Cisco (.*?) Software")
+_VERSION_RE = re.compile(r"Version\s+([\d.]+)")
+_UPTIME_RE = re.compile(r"uptime is (.+)$", re.MULTILINE)
+_SERIAL_RE = re.compile(r"Serial Number\s*:\s*([A-Z0-9]+)")
+_IPV4_LINE_RE = re.compile(r"^[^\S\n]*\d+\.\d+\.\d+\.\d+", re.MULTILINE)
+_BGP_SUMMARY_LINE_RE = re.compile(r"^.*BGP summary.*$", re.MULTILINE)
+_ROUTER_ID_RE = re.compile(r"([0-9.]+),")
+_AS_RE = re.compile(r"AS (\d+)")
+_JUNOS_RELEASE_RE = re.compile(r"Release\s+([\d.]+)")
+
+_BULK_SEPARATOR = "\n<<<TMENU_SEP>>>\n"
+
+_CISCO_VERSION_FIELDS = (
+    ("Model", _CISCO_MODEL_RE, True),
+    ("IOS_Version", _VERSION_RE, False),
+    ("Uptime", _UPTIME_RE, True),
+    ("Serial", _SERIAL_RE, False),
+)
+
+_ARISTA_VERSION_FIELDS = {
+    "Model": "Model",
+    "System uptime": "Uptime",
+    "Software image version": "EOS_Version",
+    "Serial number": "Serial",
+}
+_JUNIPER_VERSION_FIELDS = {
+    "Model": "Model",
+    "Serial ID": "Serial",
+}
+_SONIC_VERSION_FIELDS = {
+    "Platform": "Platform",
+    "SONiC Software Version": "Sonic_Version",
+    "System uptime": "Uptime",
+}
+
+
 class OutputParser:
     """
     Base class for parsing network device command output.
@@ -36,6 +73,42 @@ class OutputParser:
         else:
             return {"raw_output": output}
     
+    @staticmethod
+    def parse_show_version_bulk(outputs: List[str], os_type: str) -> List[Dict]:
+        """
+        Parse show version output from many devices at once.
+        
+        Cisco outputs are joined into one corpus and each field regex runs
+        over it once; matches are bucketed back to their device by offset.
+        Other OS types are parsed per output.
+        
+        Args:
+            outputs: Raw command output, one per device
+            os_type: Device OS type shared by all outputs
+            
+        Returns:
+            Parsed version info, in the same order as outputs
+        """
+        if os_type != "cisco_ios":
+            return [OutputParser.parse_show_version(output, os_type) for output in outputs]
+        
+        starts = []
+        offset = 0
+        for output in outputs:
+            starts.append(offset)
+            offset += len(output) + len(_BULK_SEPARATOR)
+        corpus = _BULK_SEPARATOR.join(outputs)
+        
+        results: List[Dict] = [{} for _ in outputs]
+        for key, pattern, strip in _CISCO_VERSION_FIELDS:
+            for match in pattern.finditer(corpus):
+                data = results[bisect_right(starts, match.start()) - 1]
+                if key not in data:
+                    value = match.group(1)
+                    data[key] = value.strip() if strip else value
+        
+        return [data or {"raw_output": output[:500]} for data, output in zip(results, outputs)]
+    
     @staticmethod
     def parse_bgp_summary(output: str, os_type: str) -> Dict:
         """
@@ -64,19 +137,19 @@ class OutputParser:
         """Parse Cisco IOS show version output."""
         data = {}
         
-        model_match = re.search(r"Cisco (.*?) Software", output)
+        model_match = _CISCO_MODEL_RE.search(output)
         if model_match:
             data["Model"] = model_match.group(1).strip()
         
-        version_match = re.search(r"Version\s+([\d.]+)", output)
+        version_match = _VERSION_RE.search(output)
         if version_match:
             data["IOS_Version"] = version_match.group(1)
         
-        uptime_match = re.search(r"uptime is (.+)$", output, re.MULTILINE)
+        uptime_match = _UPTIME_RE.search(output)
         if uptime_match:
             data["Uptime"] = uptime_match.group(1).strip()
         
-        serial_match = re.search(r"Serial Number\s*:\s*([A-Z0-9]+)", output)
+        serial_match = _SERIAL_RE.search(output)
         if serial_match:
             data["Serial"] = serial_match.group(1)
         
@@ -86,17 +159,16 @@ class OutputParser:
     def _parse_cisco_bgp(output: str) -> Dict:
         """Parse Cisco IOS show ip bgp summary output."""
         data = {}
-        lines = output.split("\n")
+        neighbor_count = 0
         
-        for line in lines:
+        for line in output.splitlines():
             if "BGP router identifier" in line:
-                match = re.search(r"([0-9.]+),", line)
+                match = _ROUTER_ID_RE.search(line)
                 if match:
                     data["Router_ID"] = match.group(1)
-        
-        neighbor_count = 0
-        for line in lines:
-            if "neighbor" in line.lower() and ("up" in line.lower() or "down" in line.lower()):
+            
+            low = line.lower()
+            if "neighbor" in low and ("up" in low or "down" in low):
                 neighbor_count += 1
         
         if neighbor_count > 0:
@@ -108,17 +180,12 @@ class OutputParser:
     def _parse_arista_version(output: str) -> Dict:
         """Parse Arista EOS show version output."""
         data = {}
-        lines = output.split("\n")
         
-        for line in lines:
-            if "Model:" in line:
-                data["Model"] = line.split(":")[1].strip()
-            elif "System uptime:" in line:
-                data["Uptime"] = line.split(":")[1].strip()
-            elif "Software image version:" in line:
-                data["EOS_Version"] = line.split(":")[1].strip()
-            elif "Serial number:" in line:
-                data["Serial"] = line.split(":")[1].strip()
+        for line in output.splitlines():
+            head, _, tail = line.partition(":")
+            key = _ARISTA_VERSION_FIELDS.get(head.strip())
+            if key:
+                data[key] = tail.strip()
         
         return data or {"raw_output": output[:500]}
     
@@ -126,19 +193,13 @@ class OutputParser:
     def _parse_arista_bgp(output: str) -> Dict:
         """Parse Arista EOS show ip bgp summary output."""
         data = {}
-        lines = output.split("\n")
         
-        for line in lines:
-            if "BGP summary" in line:
-                match = re.search(r"AS (\d+)", line)
-                if match:
-                    data["AS_Number"] = match.group(1)
-        
-        neighbor_count = 0
-        for line in lines:
-            if re.match(r"^\s*\d+\.\d+\.\d+\.\d+", line):
-                neighbor_count += 1
+        for line in _BGP_SUMMARY_LINE_RE.findall(output):
+            match = _AS_RE.search(line)
+            if match:
+                data["AS_Number"] = match.group(1)
         
+        neighbor_count = len(_IPV4_LINE_RE.findall(output))
         if neighbor_count > 0:
             data["BGP_Neighbors"] = neighbor_count
         
@@ -148,17 +209,16 @@ class OutputParser:
     def _parse_juniper_version(output: str) -> Dict:
         """Parse Juniper JUNOS show version output."""
         data = {}
-        lines = output.split("\n")
         
-        for line in lines:
-            if "Model:" in line:
-                data["Model"] = line.split(":")[1].strip()
+        for line in output.splitlines():
+            head, _, tail = line.partition(":")
+            key = _JUNIPER_VERSION_FIELDS.get(head.strip())
+            if key:
+                data[key] = tail.strip()
             elif "JUNOS Software Release" in line:
-                match = re.search(r"Release\s+([\d.]+)", line)
+                match = _JUNOS_RELEASE_RE.search(line)
                 if match:
                     data["JUNOS_Version"] = match.group(1)
-            elif "Serial ID:" in line:
-                data["Serial"] = line.split(":")[1].strip()
         
         return data or {"raw_output": output[:500]}
     
@@ -180,15 +240,12 @@ class OutputParser:
     def _parse_sonic_version(output: str) -> Dict:
         """Parse Sonic CLI show version output."""
         data = {}
-        lines = output.split("\n")
         
-        for line in lines:
-            if "Platform:" in line:
-                data["Platform"] = line.split(":")[1].strip()
-            elif "SONiC Software Version:" in line:
-                data["Sonic_Version"] = line.split(":")[1].strip()
-            elif "System uptime:" in line:
-                data["Uptime"] = line.split(":")[1].strip()
+        for line in output.splitlines():
+            head, _, tail = line.partition(":")
+            key = _SONIC_VERSION_FIELDS.get(head.strip())
+            if key:
+                data[key] = tail.strip()
         
         return data or {"raw_output": output[:500]}
     
@@ -196,13 +253,8 @@ class OutputParser:
     def _parse_sonic_bgp(output: str) -> Dict:
         """Parse Sonic CLI show ip bgp summary output."""
         data = {}
-        lines = output.split("\n")
-        
-        neighbor_count = 0
-        for line in lines:
-            if re.match(r"^\s*\d+\.\d+\.\d+\.\d+", line):
-                neighbor_count += 1
         
+        neighbor_count = len(_IPV4_LINE_RE.findall(output))
         if neighbor_count > 0:
             data["BGP_Neighbors"] = neighbor_count
         
@@ -5,20 +5,374 @@ Handles SSH connections through jump host and remote command execution
 on network devices with multi-OS support and username rotation.
 """
 
-import paramiko
+import json
+import os
 import socket
-from typing import Optional, Dict, List, Tuple
+import tempfile
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Optional, Dict, List, Tuple
 from io import StringIO
+from pathlib import Path
 
 from .ssh_config import (
-    JUMP_HOST, JUMP_HOST_PORT, DEFAULT_USERNAMES,
-    SSH_TIMEOUT, SSH_CONNECT_TIMEOUT, COMMAND_TIMEOUT,
-    OS_TYPES, SHOW_COMMANDS, DEVICE_SPECIFIC_USERNAMES,
-    CISCO_IOS_USERNAMES
+    JUMP_HOST, JUMP_HOST_FALLBACK, JUMP_HOST_PORT, DEFAULT_USERNAMES,
+    SSH_TIMEOUT, SSH_CONNECT_TIMEOUT, COMMAND_TIMEOUT, SSH_KEEPALIVE_INTERVAL, RECV_CHUNK_SIZE,
+    JUMP_POOL_IDLE_TIMEOUT, USERNAME_PROBE_BATCH, USERNAME_CACHE_TTL, OS_TYPES,
+    OS_TYPE_ALIASES, BATCHED_OS_TYPES, COMMAND_DELIMITER, SHOW_COMMANDS, USERNAMES_BY_OS,
+    CISCO_IOS_USERNAMES, _merge_usernames
 )
 from .bastion_manager import BastionManager
 from .ssh_parsers import OutputParser
 
+if TYPE_CHECKING:
+    import paramiko
+
+# Per-attempt progress lines are printed only when TMENU_VERBOSE is set;
+# the one-line result for each device is always shown.
+VERBOSE = bool(os.environ.get("TMENU_VERBOSE"))
+
+_JUMP_POOL: Dict[Tuple[str, int, str], "paramiko.SSHClient"] = {}
+# References are counted per client, so a stale client evicted from
+# _JUMP_POOL can still be released by its borrowers without touching
+# the replacement pooled under the same key.
+_JUMP_POOL_REFCOUNT: Dict["paramiko.SSHClient", int] = {}
+_JUMP_POOL_TIMERS: Dict[Tuple[str, int, str], threading.Timer] = {}
+_JUMP_POOL_LOCK = threading.Lock()
+
+
+def _transport_alive(client: Optional["paramiko.SSHClient"]) -> bool:
+    """
+    Check that a client's transport is active and still accepts writes.
+    
+    Args:
+        client: SSH client to probe
+        
+    Returns:
+        True if an SSH_MSG_IGNORE could be sent on the transport
+    """
+    transport = client.get_transport() if client else None
+    if transport is None or not transport.is_active():
+        return False
+    try:
+        transport.send_ignore()
+        return True
+    except Exception:
+        return False
+
+
+def _drain(recv) -> bytearray:
+    """
+    Read a channel stream until EOF into a single buffer.
+    
+    Args:
+        recv: Channel.recv or Channel.recv_stderr
+        
+    Returns:
+        Everything the stream sent
+    """
+    buf = bytearray()
+    while True:
+        data = recv(RECV_CHUNK_SIZE)
+        if not data:
+            return buf
+        buf.extend(data)
+
+
+def _checkout_jump_client(key: Tuple[str, int, str]) -> Optional["paramiko.SSHClient"]:
+    """
+    Take a reference to the pooled jump host client for key, if its
+    transport still answers an SSH_MSG_IGNORE. A stale client is evicted.
+    
+    Args:
+        key: (host, port, user) pool key
+        
+    Returns:
+        Pooled client (release with _release_jump_client) or None
+    """
+    with _JUMP_POOL_LOCK:
+        client = _JUMP_POOL.get(key)
+        if client:
+            timer = _JUMP_POOL_TIMERS.pop(key, None)
+            if timer:
+                timer.cancel()
+            if _transport_alive(client):
+                _JUMP_POOL_REFCOUNT[client] = _JUMP_POOL_REFCOUNT.get(client, 0) + 1
+                return client
+            
+            # Evict; borrowers still holding it release it themselves
+            del _JUMP_POOL[key]
+            if not _JUMP_POOL_REFCOUNT.get(client):
+                _JUMP_POOL_REFCOUNT.pop(client, None)
+                client.close()
+    
+    return None
+
+
+def _get_jump_client(
+    host: str,
+    port: int,
+    user: str,
+    password: str,
+    sock: Optional[socket.socket] = None
+) -> "paramiko.SSHClient":
+    """
+    Get a jump host client shared across SSHConnection instances.
+    A pooled client is reused while its transport still answers an
+    SSH_MSG_IGNORE; otherwise a new one is connected and pooled.
+    
+    Args:
+        host: Jump host name
+        port: Jump host SSH port
+        user: AD username
+        password: AD password
+        sock: Already-connected TCP socket to host (closed if unused)
+        
+    Returns:
+        Connected paramiko.SSHClient (release with _release_jump_client)
+    """
+    import paramiko
+    
+    key = (host, port, user)
+    
+    client = _checkout_jump_client(key)
+    if client:
+        if sock:
+            sock.close()
+        return client
+    
+    client = paramiko.SSHClient()
+    client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+    try:
+        client.connect(
+            hostname=host,
+            port=port,
+            username=user,
+            password=password,
+            sock=sock,
+            timeout=SSH_CONNECT_TIMEOUT,
+            allow_agent=False,
+            look_for_keys=False
+        )
+    except Exception:
+        client.close()
+        if sock:
+            sock.close()
+        raise
+    client.get_transport().set_keepalive(SSH_KEEPALIVE_INTERVAL)
+    
+    with _JUMP_POOL_LOCK:
+        pooled = _JUMP_POOL.get(key)
+        if pooled:
+            client.close()
+            client = pooled
+            timer = _JUMP_POOL_TIMERS.pop(key, None)
+            if timer:
+                timer.cancel()
+        else:
+            _JUMP_POOL[key] = client
+        _JUMP_POOL_REFCOUNT[client] = _JUMP_POOL_REFCOUNT.get(client, 0) + 1
+    
+    return client
+
+
+def _release_jump_client(client: "paramiko.SSHClient", linger: bool = True):
+    """
+    Release a reference to a jump host client from _get_jump_client.
+    A pooled client stays open for JUMP_POOL_IDLE_TIMEOUT after the last
+    release so the next SSHConnection can pick it up. A client that was
+    evicted from the pool is closed once its last borrower releases it.
+    
+    Args:
+        client: Client returned by _get_jump_client
+        linger: False to close the client at once when unreferenced
+    """
+    with _JUMP_POOL_LOCK:
+        count = _JUMP_POOL_REFCOUNT.get(client)
+        if not count:
+            return
+        
+        if count > 1:
+            _JUMP_POOL_REFCOUNT[client] = count - 1
+            return
+        
+        key = next((k for k, pooled in _JUMP_POOL.items() if pooled is client), None)
+        if key is None or not linger:
+            del _JUMP_POOL_REFCOUNT[client]
+            if key is not None:
+                del _JUMP_POOL[key]
+            client.close()
+            return
+        
+        _JUMP_POOL_REFCOUNT[client] = 0
+        timer = threading.Timer(JUMP_POOL_IDLE_TIMEOUT, _close_idle_jump_client, args=(key,))
+        timer.daemon = True
+        _JUMP_POOL_TIMERS[key] = timer
+        timer.start()
+
+
+def _dial_first_jump_host(hosts: Tuple[str, ...], port: int) -> Tuple[str, socket.socket]:
+    """
+    Open a TCP connection to every jump host at once and keep the first
+    to answer, so an unreachable primary does not cost a full
+    SSH_CONNECT_TIMEOUT before the fallback is tried. If several answer
+    together the earlier host in hosts wins; the other sockets are closed.
+    
+    Args:
+        hosts: Jump host names in order of preference
+        port: Jump host SSH port
+        
+    Returns:
+        Tuple of (hostname, connected socket)
+        
+    Raises:
+        The first host's connection error if every host failed
+    """
+    executor = ThreadPoolExecutor(max_workers=len(hosts))
+    futures = {
+        executor.submit(socket.create_connection, (host, port), SSH_CONNECT_TIMEOUT): host
+        for host in hosts
+    }
+    pending = set(futures)
+    winner = None
+    
+    def discard(fut):
+        if fut.exception() is None:
+            fut.result().close()
+    
+    try:
+        while pending and winner is None:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in sorted(done, key=lambda f: hosts.index(futures[f])):
+                if fut.exception() is not None:
+                    continue
+                if winner is None:
+                    winner = fut
+                else:
+                    discard(fut)
+    finally:
+        for fut in pending:
+            fut.add_done_callback(discard)
+        executor.shutdown(wait=False)
+    
+    if winner is None:
+        primary = next(fut for fut, host in futures.items() if host == hosts[0])
+        raise primary.exception()
+    
+    return futures[winner], winner.result()
+
+
+def _connect_first_jump_client(
+    hosts: Tuple[str, ...],
+    port: int,
+    user: str,
+    password: str
+) -> Tuple[str, "paramiko.SSHClient"]:
+    """
+    Get a jump host client, preferring a live pooled client in host order.
+    Otherwise only the TCP connect is raced across hosts and the SSH
+    handshake and password auth run once, on the winning socket, so a
+    one-time RSA passcode is never sent to both hosts.
+    
+    Args:
+        hosts: Jump host names in order of preference
+        port: Jump host SSH port
+        user: AD username
+        password: AD password
+        
+    Returns:
+        Tuple of (hostname, pooled client)
+    """
+    for host in hosts:
+        client = _checkout_jump_client((host, port, user))
+        if client:
+            return host, client
+    
+    host, sock = _dial_first_jump_host(hosts, port)
+    return host, _get_jump_client(host, port, user, password, sock=sock)
+
+
+def _close_idle_jump_client(key: Tuple[str, int, str]):
+    """
+    Close a pooled jump host client nobody picked up before the idle timer fired.
+    
+    Args:
+        key: (host, port, user) pool key
+    """
+    with _JUMP_POOL_LOCK:
+        client = _JUMP_POOL.get(key)
+        if client is None or _JUMP_POOL_REFCOUNT.get(client, 0) > 0:
+            return
+        
+        _JUMP_POOL_TIMERS.pop(key, None)
+        _JUMP_POOL_REFCOUNT.pop(client, None)
+        del _JUMP_POOL[key]
+    
+    client.close()
+
+
+USERNAME_CACHE_PATH = Path.home() / ".titan_menu" / "ssh_user_cache.json"
+_USERNAME_CACHE_LOCK = threading.Lock()
+
+
+def _read_username_cache() -> Dict[str, Dict]:
+    """
+    Read the per-device username cache, treating a missing or corrupt
+    file as empty.
+    
+    Returns:
+        Mapping of device_ip to {"user": ..., "ts": ...}
+    """
+    try:
+        with open(USERNAME_CACHE_PATH, 'r') as f:
+            cache = json.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _cached_username(device_ip: str) -> Optional[str]:
+    """
+    Get the username that last worked on a device, if still within
+    USERNAME_CACHE_TTL.
+    
+    Args:
+        device_ip: Device management IP
+        
+    Returns:
+        Cached username or None
+    """
+    entry = _read_username_cache().get(device_ip) or {}
+    if entry.get("ts", 0) > time.time() - USERNAME_CACHE_TTL:
+        return entry.get("user")
+    return None
+
+
+def _remember_username(device_ip: str, username: str):
+    """
+    Record the username that worked on a device.
+    
+    The file is re-read under a lock and replaced atomically so concurrent
+    runners do not drop each other's entries or leave a partial file.
+    
+    Args:
+        device_ip: Device management IP
+        username: Username that authenticated
+    """
+    with _USERNAME_CACHE_LOCK:
+        cache = _read_username_cache()
+        cache[device_ip] = {"user": username, "ts": time.time()}
+        
+        try:
+            USERNAME_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=str(USERNAME_CACHE_PATH.parent), suffix=".tmp")
+            with os.fdopen(fd, 'w') as f:
+                json.dump(cache, f, indent=2)
+            os.replace(tmp_path, USERNAME_CACHE_PATH)
+        except OSError as e:
+            print(f"[!] Could not save username cache: {e}")
+
 
 class SSHConnection:
     """
@@ -41,8 +395,11 @@ class SSHConnection:
         self.bastion_id = bastion_id
         self.ssh_client = None
         self.ssh_transport = None
+        self.jump_host = None
         self.connected = False
         self.bastion_manager = None
+        self._device_clients: Dict[Tuple[str, str], "paramiko.SSHClient"] = {}
+        self._reconnect_lock = threading.Lock()
         self._init_bastion_manager()
     
     def _init_bastion_manager(self):
@@ -68,6 +425,8 @@ class SSHConnection:
         Returns:
             True if connection successful, False otherwise
         """
+        import paramiko
+        
         if not self.bastion_manager:
             print("[!] Bastion manager not initialized")
             return False
@@ -77,24 +436,13 @@ class SSHConnection:
             return True
         
         try:
-            print(f"[*] Connecting to jump host: {JUMP_HOST}...")
-            
-            self.ssh_client = paramiko.SSHClient()
-            self.ssh_client.set_missing_host_key_policy(
-                paramiko.AutoAddPolicy()
-            )
+            print(f"[*] Connecting to jump host: {JUMP_HOST} (fallback: {JUMP_HOST_FALLBACK})...")
             
-            self.ssh_client.connect(
-                hostname=JUMP_HOST,
-                port=JUMP_HOST_PORT,
-                username=self.username,
-                password=self.password,
-                timeout=SSH_CONNECT_TIMEOUT,
-                allow_agent=False,
-                look_for_keys=False
+            self.jump_host, self.ssh_client = _connect_first_jump_client(
+                (JUMP_HOST, JUMP_HOST_FALLBACK), JUMP_HOST_PORT, self.username, self.password
             )
             
-            print(f"[+] Connected to jump host!")
+            print(f"[+] Connected to jump host: {self.jump_host}")
             self.connected = True
             return True
             
@@ -108,6 +456,101 @@ class SSHConnection:
             print(f"[!] Connection error: {e}")
             return False
     
+    def _ensure_jump_transport(self) -> bool:
+        """
+        Make sure the jump host transport is usable before opening channels
+        on it. A dead or half-closed transport is evicted and reconnected
+        once instead of letting the next command hang until COMMAND_TIMEOUT.
+        
+        Returns:
+            True if the jump host transport is usable
+        """
+        if self.ssh_client is None or _transport_alive(self.ssh_client):
+            return True
+        
+        with self._reconnect_lock:
+            if _transport_alive(self.ssh_client):
+                return True
+            
+            print("[*] Jump host connection is stale, reconnecting...")
+            for client in self._device_clients.values():
+                client.close()
+            self._device_clients.clear()
+            # Drop our reference to the dead client without an idle linger;
+            # other connections still holding it release it themselves.
+            _release_jump_client(self.ssh_client, linger=False)
+            self.ssh_client = None
+            
+            try:
+                self.jump_host, self.ssh_client = _connect_first_jump_client(
+                    (JUMP_HOST, JUMP_HOST_FALLBACK), JUMP_HOST_PORT, self.username, self.password
+                )
+                print(f"[+] Reconnected to jump host: {self.jump_host}")
+                return True
+            except Exception as e:
+                print(f"[!] Reconnect to jump host failed: {e}")
+                self.ssh_client = None
+                self.jump_host = None
+                self.connected = False
+                return False
+    
+    def _get_device_client(
+        self,
+        device_ip: str,
+        device_username: str
+    ) -> "paramiko.SSHClient":
+        """
+        Get an authenticated SSH client for a device, tunnelled through the
+        jump host transport and reused while it is still active.
+        
+        Args:
+            device_ip: Target device IP address
+            device_username: Username on target device
+            
+        Returns:
+            Connected paramiko.SSHClient
+        """
+        import paramiko
+        
+        key = (device_ip, device_username)
+        
+        client = self._device_clients.get(key)
+        if client:
+            transport = client.get_transport()
+            if transport and transport.is_active():
+                return client
+            client.close()
+            del self._device_clients[key]
+        
+        sock = self.ssh_client.get_transport().open_channel(
+            "direct-tcpip",
+            (device_ip, 22),
+            ("127.0.0.1", 0),
+            timeout=SSH_CONNECT_TIMEOUT
+        )
+        
+        client = paramiko.SSHClient()
+        client.set_missing_host_key_policy(paramiko.AutoAddPolicy())
+        try:
+            client.connect(
+                hostname=device_ip,
+                username=device_username,
+                password=self.password,
+                sock=sock,
+                timeout=SSH_CONNECT_TIMEOUT,
+                banner_timeout=SSH_CONNECT_TIMEOUT,
+                allow_agent=False,
+                look_for_keys=False
+            )
+        except Exception:
+            client.close()
+            sock.close()
+            raise
+        
+        client.get_transport().set_keepalive(SSH_KEEPALIVE_INTERVAL)
+        self._device_clients[key] = client
+        return client
+    
     def execute_command_on_device(
         self,
         device_ip: str,
@@ -125,26 +568,37 @@ class SSHConnection:
         Returns:
             Tuple of (success: bool, output: str)
         """
+        import paramiko
+        
         if not self.connected:
             return False, "[!] Not connected to jump host"
         
+        if not self._ensure_jump_transport():
+            return False, "[!] Lost connection to jump host"
+        
         try:
-            print(f"[*] Running: {command}")
-            
-            stdin, stdout, stderr = self.ssh_client.exec_command(
-                f"ssh -o StrictHostKeyChecking=no {device_username}@{device_ip} '{command}'",
-                timeout=COMMAND_TIMEOUT
-            )
+            if VERBOSE:
+                print(f"[*] Running on {device_ip} as {device_username}: {command}")
             
-            output = stdout.read().decode('utf-8', errors='ignore')
-            error = stderr.read().decode('utf-8', errors='ignore')
+            client = self._get_device_client(device_ip, device_username)
+            channel = client.get_transport().open_session()
+            try:
+                channel.settimeout(COMMAND_TIMEOUT)
+                channel.exec_command(command)
+                output = _drain(channel.recv).decode('utf-8', errors='ignore')
+                error = _drain(channel.recv_stderr).decode('utf-8', errors='ignore')
+            finally:
+                channel.close()
             
             if error and "Warning" not in error:
                 return False, error
             
-            print(f"[+] Command completed")
+            if VERBOSE:
+                print(f"[+] Command completed on {device_ip}")
             return True, output
             
+        except paramiko.AuthenticationException:
+            return False, f"[!] Permission denied for {device_username}@{device_ip}"
         except socket.timeout:
             return False, "[!] Command timeout"
         except Exception as e:
@@ -152,10 +606,16 @@ class SSHConnection:
     
     def disconnect(self):
         """
-        Close SSH connection.
+        Close device sessions and release the pooled jump host connection.
         """
+        for client in self._device_clients.values():
+            client.close()
+        self._device_clients.clear()
+        
         if self.ssh_client:
-            self.ssh_client.close()
+            _release_jump_client(self.ssh_client)
+            self.ssh_client = None
+            self.jump_host = None
             self.connected = False
             print("[*] Disconnected from jump host")
 
@@ -190,6 +650,9 @@ class DeviceCommandRunner:
             self.usernames = usernames
         else:
             self.usernames = self._build_username_list()
+            cached = _cached_username(device_ip)
+            if cached:
+                self.usernames = [cached] + [u for u in self.usernames if u != cached]
         
         self.current_username = None
         self.authenticated = False
@@ -198,6 +661,8 @@ class DeviceCommandRunner:
     def _normalize_os_type(self, os_type: str) -> str:
         """
         Normalize OS type to standard format.
+        Known spellings resolve with one OS_TYPE_ALIASES lookup; anything
+        else falls back to substring matching against OS_TYPES.
         
         Args:
             os_type: Raw OS type from database
@@ -207,8 +672,9 @@ class DeviceCommandRunner:
         """
         os_upper = os_type.upper().strip()
         
-        if os_upper in OS_TYPES:
-            return OS_TYPES[os_upper]
+        normalized = OS_TYPE_ALIASES.get(os_upper)
+        if normalized:
+            return normalized
         
         for key, value in OS_TYPES.items():
             if key in os_upper or os_upper in key:
@@ -216,21 +682,19 @@ class DeviceCommandRunner:
         
         return os_upper.lower()
     
-    def _build_username_list(self) -> List[str]:
+    def _build_username_list(self) -> Tuple[str, ...]:
         """
-        Build comprehensive username list based on device OS type.
-        Combines device-specific usernames with defaults.
+        Get the username list for the device OS type.
+        Device-specific usernames come first, then the defaults; the lists
+        are merged once at import time in ssh_config.
         
         Returns:
-            List of usernames to try in order
+            Usernames to try in order
         """
-        device_specific = DEVICE_SPECIFIC_USERNAMES.get(self.device_os, [])
-        
-        usernames = list(dict.fromkeys(device_specific + DEFAULT_USERNAMES))
-        
-        if "cisco" in self.device_os.lower():
-            cisco_specific = [u for u in CISCO_IOS_USERNAMES if u not in usernames]
-            usernames.extend(cisco_specific)
+        usernames = USERNAMES_BY_OS.get(self.device_os)
+        if usernames is None:
+            cisco = CISCO_IOS_USERNAMES if "cisco" in self.device_os.lower() else ()
+            usernames = _merge_usernames(DEFAULT_USERNAMES, cisco)
         
         return usernames
     
@@ -249,7 +713,11 @@ class DeviceCommandRunner:
     def run_command(self, command_alias: str = "version") -> Tuple[bool, Dict]:
         """
         Run a show command on the device.
-        Tries usernames in order, prioritizing device-specific ones first.
+        Tries usernames in batches of USERNAME_PROBE_BATCH, in order,
+        prioritizing device-specific ones first. A batch runs to completion
+        and its earliest working username in list order is used, so the
+        account chosen (and cached) does not depend on which probe answers
+        first.
         
         Args:
             command_alias: Command alias (version, bgp_summary, etc.)
@@ -264,36 +732,124 @@ class DeviceCommandRunner:
         
         actual_command = available_commands[command_alias]
         
-        attempted = 0
-        for username in self.usernames:
-            attempted += 1
-            print(f"[*] Trying username: {username} ({attempted}/{len(self.usernames)})")
-            
-            success, output = self.ssh_connection.execute_command_on_device(
-                self.device_ip,
-                username,
-                actual_command
-            )
-            
-            if success and output and "permission denied" not in output.lower():
-                self.current_username = username
-                self.authenticated = True
-                print(f"[+] Authenticated as: {username}")
+        with ThreadPoolExecutor(max_workers=USERNAME_PROBE_BATCH) as executor:
+            for start in range(0, len(self.usernames), USERNAME_PROBE_BATCH):
+                batch = self.usernames[start:start + USERNAME_PROBE_BATCH]
+                if VERBOSE:
+                    print(f"[*] Trying usernames on {self.device_ip}: {', '.join(batch)} "
+                          f"({start + len(batch)}/{len(self.usernames)})")
                 
-                if command_alias == "version":
-                    parsed = OutputParser.parse_show_version(output, self.device_os)
-                elif command_alias == "bgp_summary":
-                    parsed = OutputParser.parse_bgp_summary(output, self.device_os)
-                else:
-                    parsed = {"raw_output": output[:200]}
+                futures = [
+                    executor.submit(
+                        self.ssh_connection.execute_command_on_device,
+                        self.device_ip,
+                        username,
+                        actual_command
+                    )
+                    for username in batch
+                ]
                 
-                return True, parsed
-            else:
-                self.failed_usernames.append(username)
+                for offset, (username, future) in enumerate(zip(batch, futures)):
+                    success, output = future.result()
+                    
+                    if success and output and "permission denied" not in output.lower():
+                        self.current_username = username
+                        self.authenticated = True
+                        print(f"[+] {self.device_ip} authenticated as {username} "
+                              f"(attempts={start + offset + 1})")
+                        _remember_username(self.device_ip, username)
+                        
+                        return True, self._parse_output(command_alias, output)
+                    
+                    self.failed_usernames.append(username)
         
         error_msg = self._build_auth_failure_message()
         return False, {"error": error_msg}
     
+    def run_commands(self, command_aliases: List[str]) -> Tuple[bool, Dict[str, Dict]]:
+        """
+        Run several show commands on the device.
+        On shells that accept ';' (BATCHED_OS_TYPES) the commands share a
+        single exec and the output is split on COMMAND_DELIMITER; other
+        CLIs run them one at a time over the same device session.
+        
+        Args:
+            command_aliases: Command aliases (version, bgp_summary, etc.)
+            
+        Returns:
+            Tuple of (success: bool, parsed output per alias: Dict)
+        """
+        available_commands = self.get_available_commands()
+        
+        unknown = [alias for alias in command_aliases if alias not in available_commands]
+        if unknown:
+            return False, {"error": f"Command(s) {', '.join(unknown)} not available for {self.device_os}"}
+        
+        results = {}
+        remaining = list(command_aliases)
+        
+        if remaining and not self.current_username:
+            success, parsed = self.run_command(remaining[0])
+            if not success:
+                return False, parsed
+            results[remaining.pop(0)] = parsed
+        
+        if not remaining:
+            return True, results
+        
+        if self.device_os not in BATCHED_OS_TYPES:
+            all_ok = True
+            for alias in remaining:
+                success, output = self.ssh_connection.execute_command_on_device(
+                    self.device_ip,
+                    self.current_username,
+                    available_commands[alias]
+                )
+                if success:
+                    results[alias] = self._parse_output(alias, output)
+                else:
+                    results[alias] = {"error": output}
+                    all_ok = False
+            return all_ok, results
+        
+        joined = f" ; echo '{COMMAND_DELIMITER}' ; ".join(
+            available_commands[alias] for alias in remaining
+        )
+        success, output = self.ssh_connection.execute_command_on_device(
+            self.device_ip,
+            self.current_username,
+            joined
+        )
+        if not success:
+            return False, {"error": output}
+        
+        chunks = output.split(COMMAND_DELIMITER)
+        if len(chunks) != len(remaining):
+            return False, {"error": f"Expected {len(remaining)} outputs, got {len(chunks)}"}
+        
+        for alias, chunk in zip(remaining, chunks):
+            results[alias] = self._parse_output(alias, chunk.strip("\r\n"))
+        
+        return True, results
+    
+    def _parse_output(self, command_alias: str, output: str) -> Dict:
+        """
+        Parse raw command output for a command alias.
+        
+        Args:
+            command_alias: Command alias the output came from
+            output: Raw command output
+            
+        Returns:
+            Parsed output dictionary
+        """
+        if command_alias == "version":
+            return OutputParser.parse_show_version(output, self.device_os)
+        elif command_alias == "bgp_summary":
+            return OutputParser.parse_bgp_summary(output, self.device_os)
+        else:
+            return {"raw_output": output[:200]}
+    
     def _build_auth_failure_message(self) -> str:
         """
         Build helpful error message when authentication fails.
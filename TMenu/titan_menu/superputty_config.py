@@ -22,12 +22,63 @@ Usage:
     gen.save_profile(device_profile)
 
 """
+import functools
 import os
-import json
-from typing import Dict, Optional, List
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, List, Set, TextIO
 from pathlib import Path
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+_XML_ESCAPES = {
+    '&': '&amp;',
+    '<': '&lt;',
+    '>': '&gt;',
+    '"': '&quot;',
+    "'": '&apos;',
+}
+_XML_RE = re.compile(r'[&<>"\']')
+
+
+def _escape_xml(text: str) -> str:
+    """
+    Escape XML special characters.
+    
+    Args:
+        text: Text to escape
+        
+    Returns:
+        Escaped text
+    """
+    match = _XML_RE.search(text)
+    if match is None:
+        return text
+    
+    parts = []
+    last = 0
+    while match is not None:
+        i = match.start()
+        parts.append(text[last:i])
+        parts.append(_XML_ESCAPES[text[i]])
+        last = i + 1
+        match = _XML_RE.search(text, last)
+    parts.append(text[last:])
+    return ''.join(parts)
+
+
+# Hosts, usernames and protocols repeat across a batch; session names and
+# descriptions are unique per device, so they bypass the cache.
+_escape_xml_cached = functools.lru_cache(maxsize=1024)(_escape_xml)
+
+_SANITIZE_BAD = re.compile(r'[<>:"|?*\\]')
+_SANITIZE_WS = re.compile(r'[\s/]+')
+
 
 class SuperPuttyProfile:
     """
@@ -37,6 +88,31 @@ class SuperPuttyProfile:
     Each profile corresponds to a .xml session file.
     """
     
+    __slots__ = (
+        'session_name', 'host', 'port', 'username', 'password',
+        'session_type', 'description', 'created',
+    )
+    
+    _PUTTY_DEFAULTS = (
+        ("StrictHostKeyChecking", "0"),
+        ("ServerAliveInterval", "60"),
+        ("X11Forward", "0"),
+        ("X11Display", ""),
+        ("ForwardAgent", "0"),
+        ("ProxyCommand", ""),
+        ("ProxyUsername", ""),
+        ("ProxyPassword", ""),
+        ("ProxyTelnetCommand", ""),
+        ("ProxyLocalhost", "0"),
+        ("BuggyMAC", "0"),
+        ("RekeyTime", "3600"),
+        ("RekeyBytes", ""),
+    )
+    # Defaults are plain literals with no XML specials, so render them once
+    _PUTTY_DEFAULTS_XML = ''.join(
+        f'    <{key}>{value}</{key}>\n' for key, value in _PUTTY_DEFAULTS
+    )
+    
     def __init__(
         self,
         session_name: str,
@@ -45,7 +121,8 @@ class SuperPuttyProfile:
         username: str = "",
         password: str = "",
         session_type: str = "ssh",
-        description: str = ""
+        description: str = "",
+        created: Optional[str] = None
     ):
         """
         Initialize SuperPutty profile.
@@ -58,6 +135,7 @@ class SuperPuttyProfile:
             password: SSH password (can be empty for prompt)
             session_type: Protocol (ssh, telnet, raw, rlogin)
             description: Human-readable description
+            created: ISO timestamp for CreatedDate (defaults to now)
         """
         self.session_name = session_name
         self.host = host
@@ -66,7 +144,7 @@ class SuperPuttyProfile:
         self.password = password
         self.session_type = session_type
         self.description = description
-        self.created = datetime.now().isoformat()
+        self.created = created or datetime.now().isoformat()
     
     def to_putty_format(self) -> Dict:
         """
@@ -80,23 +158,8 @@ class SuperPuttyProfile:
             "Port": str(self.port),
             "Protocol": self.session_type,
             "UserName": self.username,
-            "StrictHostKeyChecking": "0",
-            "ServerAliveInterval": "60",
-            "X11Forward": "0",
-            "X11Display": "",
-            "ForwardAgent": "0",
-            "ProxyCommand": "",
-            "ProxyUsername": "",
-            "ProxyPassword": "",
-            "ProxyTelnetCommand": "",
-            "ProxyLocalhost": "0",
-            "BuggyMAC": "0",
-            "RekeyTime": "3600",
-            "RekeyBytes": "",
         }
-        
-
-        
+        settings.update(self._PUTTY_DEFAULTS)
         return settings
     
     def to_xml(self) -> str:
@@ -106,44 +169,32 @@ class SuperPuttyProfile:
         Returns:
             XML string representing the profile
         """
-        settings = self.to_putty_format()
-        
-        xml = '<?xml version="1.0" encoding="utf-8"?>\n'
-        xml += '<Session>\n'
-        xml += f'  <SessionName>{self._escape_xml(self.session_name)}</SessionName>\n'
-        xml += f'  <Description>{self._escape_xml(self.description)}</Description>\n'
-        xml += f'  <CreatedDate>{self.created}</CreatedDate>\n'
-        xml += '  <Settings>\n'
-        
-        for key, value in settings.items():
-            xml += f'    <{key}>{self._escape_xml(str(value))}</{key}>\n'
-        
-        xml += '  </Settings>\n'
-        xml += '</Session>\n'
-        
-        return xml
+        esc = _escape_xml_cached
+        
+        return (
+            '<?xml version="1.0" encoding="utf-8"?>\n'
+            '<Session>\n'
+            f'  <SessionName>{_escape_xml(self.session_name)}</SessionName>\n'
+            f'  <Description>{_escape_xml(self.description)}</Description>\n'
+            f'  <CreatedDate>{self.created}</CreatedDate>\n'
+            '  <Settings>\n'
+            f'    <HostName>{esc(self.host)}</HostName>\n'
+            f'    <Port>{self.port}</Port>\n'
+            f'    <Protocol>{esc(self.session_type)}</Protocol>\n'
+            f'    <UserName>{esc(self.username)}</UserName>\n'
+            f'{self._PUTTY_DEFAULTS_XML}'
+            '  </Settings>\n'
+            '</Session>\n'
+        )
     
-    @staticmethod
-    def _escape_xml(text: str) -> str:
+    def write_xml(self, fp: TextIO) -> None:
         """
-        Escape XML special characters.
+        Write profile XML to an open text file.
         
         Args:
-            text: Text to escape
-            
-        Returns:
-            Escaped text
-        """
-        replacements = {
-            '&': '&amp;',
-            '<': '&lt;',
-            '>': '&gt;',
-            '"': '&quot;',
-            "'": '&apos;',
-        }
-        for old, new in replacements.items():
-            text = text.replace(old, new)
-        return text
+            fp: Writable text file object
+        """
+        fp.write(self.to_xml())
 
 
 class SuperPuttyConfigGenerator:
@@ -165,11 +216,16 @@ class SuperPuttyConfigGenerator:
         """
         self.base_path = base_path or self._get_superputty_path()
         self.profiles: List[SuperPuttyProfile] = []
+        # One timestamp per generator run, shared by every profile it creates
+        self._run_timestamp = datetime.now().isoformat()
+        self._ensured_dirs: Set[str] = set()
     
     @staticmethod
+    @functools.lru_cache(maxsize=1)
     def _get_superputty_path() -> str:
         """
-        Get default SuperPutty configuration directory.
+        Get default SuperPutty configuration directory, resolved once per
+        process. Call _get_superputty_path.cache_clear() to re-resolve.
         
         Returns:
             Path to SuperPutty sessions directory
@@ -179,7 +235,6 @@ class SuperPuttyConfigGenerator:
             if appdata:
                 return os.path.join(appdata, 'SuperPutty', 'Sessions')
         
-
         return os.path.expanduser('~/.superputty/sessions')
     
     def create_jumpbox_profile(
@@ -222,7 +277,8 @@ class SuperPuttyConfigGenerator:
             port=port,
             username=username,
             session_type="ssh",
-            description=description
+            description=description,
+            created=self._run_timestamp
         )
         
         self.profiles.append(profile)
@@ -249,6 +305,56 @@ class SuperPuttyConfigGenerator:
             device_port: SSH port on device
             jumpbox_host: Jumpbox to tunnel through
             
+        Returns:
+            SuperPuttyProfile instance
+        """
+        profile = self._build_device_profile(
+            device_name, device_ip, device_username, device_port, jumpbox_host
+        )
+        self.profiles.append(profile)
+        return profile
+    
+    def bulk_create_devices(
+        self,
+        devices: List[Dict],
+        jumpbox_host: str = "Oser500521.homeoffice.wal-mart.com"
+    ) -> List[SuperPuttyProfile]:
+        """
+        Create device profiles for a whole inventory in one pass.
+        
+        Args:
+            devices: Device dicts with 'name' and 'ip', plus optional
+                'username' and 'port' (the generate_batch_config format)
+            jumpbox_host: Jumpbox to tunnel through
+            
+        Returns:
+            List of SuperPuttyProfile instances, in input order
+        """
+        build = self._build_device_profile
+        profiles = [
+            build(
+                device['name'],
+                device['ip'],
+                device.get('username', ""),
+                device.get('port', 22),
+                jumpbox_host
+            )
+            for device in devices
+        ]
+        self.profiles.extend(profiles)
+        return profiles
+    
+    def _build_device_profile(
+        self,
+        device_name: str,
+        device_ip: str,
+        device_username: str,
+        device_port: int,
+        jumpbox_host: str
+    ) -> SuperPuttyProfile:
+        """
+        Build a device profile without registering it on the generator.
+        
         Returns:
             SuperPuttyProfile instance
         """
@@ -270,17 +376,15 @@ class SuperPuttyConfigGenerator:
             f"  ssh -t {jumpbox_host} ssh -t {device_username}@{device_ip}"
         )
         
-        profile = SuperPuttyProfile(
+        return SuperPuttyProfile(
             session_name=session_name,
             host=device_ip,
             port=device_port,
             username=device_username,
             session_type="ssh",
-            description=description
+            description=description,
+            created=self._run_timestamp
         )
-        
-        self.profiles.append(profile)
-        return profile
     
     def save_profile(
         self,
@@ -300,22 +404,59 @@ class SuperPuttyConfigGenerator:
         output_dir = output_dir or self.base_path
         
 
-        os.makedirs(output_dir, exist_ok=True)
+        self._ensure_dir(output_dir)
         
-
+        filepath = self._write_profile(profile, output_dir)
+        
+        print(f"[+] Saved SuperPutty profile: {filepath}")
+        return filepath
+    
+    def _ensure_dir(self, path: str) -> None:
+        """
+        Create a directory once per generator, skipping repeat makedirs calls.
+        
+        Args:
+            path: Directory to create
+        """
+        if path not in self._ensured_dirs:
+            os.makedirs(path, exist_ok=True)
+            self._ensured_dirs.add(path)
+    
+    def _profile_path(self, profile: SuperPuttyProfile, output_dir: str) -> str:
+        """
+        Get the file path a profile is saved under.
+        
+        Args:
+            profile: SuperPuttyProfile to place
+            output_dir: Directory the file goes in
+            
+        Returns:
+            Path to the profile's XML file
+        """
         filename = self._sanitize_filename(profile.session_name) + ".xml"
-        filepath = os.path.join(output_dir, filename)
+        return os.path.join(output_dir, filename)
+    
+    def _write_profile(self, profile: SuperPuttyProfile, output_dir: str) -> str:
+        """
+        Write a profile's XML into an existing directory.
         
-
+        Args:
+            profile: SuperPuttyProfile to write
+            output_dir: Directory to write into
+            
+        Returns:
+            Path to written file
+        """
+        filepath = self._profile_path(profile, output_dir)
         with open(filepath, 'w', encoding='utf-8') as f:
-            f.write(profile.to_xml())
-        
-        print(f"[+] Saved SuperPutty profile: {filepath}")
+            profile.write_xml(f)
         return filepath
     
     def save_all_profiles(self, output_dir: Optional[str] = None) -> List[str]:
         """
         Save all created profiles to disk.
+        Profiles whose names sanitize to the same file are written once,
+        with the last one winning as it would when saved in order.
         
         Args:
             output_dir: Override output directory
@@ -323,10 +464,22 @@ class SuperPuttyConfigGenerator:
         Returns:
             List of saved file paths
         """
-        saved_files = []
-        for profile in self.profiles:
-            filepath = self.save_profile(profile, output_dir)
-            saved_files.append(filepath)
+        if not self.profiles:
+            return []
+        
+        output_dir = output_dir or self.base_path
+        self._ensure_dir(output_dir)
+        
+        saved_files = [self._profile_path(profile, output_dir) for profile in self.profiles]
+        latest = dict(zip(saved_files, self.profiles))
+        
+        with ThreadPoolExecutor(max_workers=min(8, len(latest))) as executor:
+            list(executor.map(
+                lambda profile: self._write_profile(profile, output_dir),
+                latest.values()
+            ))
+        
+        print(f"[+] Saved {len(saved_files)} SuperPutty profile(s) to: {output_dir}")
         return saved_files
     
     def generate_batch_config(
@@ -347,7 +500,7 @@ class SuperPuttyConfigGenerator:
         if not output_file:
             output_file = os.path.join(self.base_path, "nre_devices_batch.json")
         
-        os.makedirs(os.path.dirname(output_file), exist_ok=True)
+        self._ensure_dir(os.path.dirname(output_file))
         
         config = {
             "generated": datetime.now().isoformat(),
@@ -356,8 +509,12 @@ class SuperPuttyConfigGenerator:
             "note": "Use this file with bulk_create_devices() to generate profiles"
         }
         
-        with open(output_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        if orjson is not None:
+            Path(output_file).write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+        else:
+            import json
+            with open(output_file, 'w') as f:
+                json.dump(config, f, indent=2)
         
         print(f"[+] Saved batch config: {output_file}")
         return output_file
@@ -373,10 +530,8 @@ class SuperPuttyConfigGenerator:
         Returns:
             Sanitized filename
         """
-        import re
-
-        filename = re.sub(r'[<>:"|?*\]', '', filename)
-        filename = re.sub(r'[\s/]+', '_', filename)
+        filename = _SANITIZE_BAD.sub('', filename)
+        filename = _SANITIZE_WS.sub('_', filename)
         return filename
 
 